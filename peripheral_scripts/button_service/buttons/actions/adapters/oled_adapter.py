@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from typing import Optional, Any
+from ..ports.display_port import IDisplay
+from utils import oled_control
+
+class OledControlAdapter(IDisplay):
+    def __init__(self, logger: Optional[Any] = None):
+        self.log = logger
+
+    def show_page(self, page: str) -> None:
+        if not oled_control.show_page(page) and self.log:
+            try: self.log.debug("[OledAdapter] OLED service not listening; page %r not shown", page)
+            except Exception: pass
@@ -1,33 +1,31 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import subprocess
 from typing import Optional, Any
+
+from utils.rfkill import TYPE_WLAN, RfkillState, shared_rfkill
 from ..ports.wifi_port import IWifi
 
 class RfkillWifiAdapter(IWifi):
     
-    def __init__(self, logger: Optional[Any] = None):
+    def __init__(self, logger: Optional[Any] = None, rfkill: Optional[RfkillState] = None):
         self.log = logger
+        self._rfkill = rfkill or shared_rfkill(logger)
 
     def _is_soft_blocked(self) -> bool:
-        try:
-            out = subprocess.check_output(["rfkill", "list", "wifi"], text=True, stderr=subprocess.DEVNULL)
-            for line in out.splitlines():
-                line = line.strip().lower()
-                if line.startswith("soft blocked:"):
-                    return "yes" in line
-        except Exception:
+        blocked = self._rfkill.soft_blocked(TYPE_WLAN)
+        if blocked is None:
             if self.log:
                 try: self.log.warning("[WifiAdapter] Can't read rfkill state; assuming unblocked")
                 except Exception: pass
-        return False
+            return False
+        return blocked
 
     def enable(self) -> None:
         if self.log:
             try: self.log.info("[ButtonActions] Turning on Wi-Fi...")
             except Exception: pass
-        subprocess.run(["rfkill", "unblock", "wifi"], check=False)
+        self._rfkill.set_blocked(TYPE_WLAN, False)
         if self.log:
             try: self.log.info("[ButtonActions] Wi-Fi toggle complete.")
             except Exception: pass
@@ -36,7 +34,7 @@ class RfkillWifiAdapter(IWifi):
         if self.log:
             try: self.log.info("[ButtonActions] Turning off Wi-Fi...")
             except Exception: pass
-        subprocess.run(["rfkill", "block", "wifi"], check=False)
+        self._rfkill.set_blocked(TYPE_WLAN, True)
         if self.log:
             try: self.log.info("[ButtonActions] Wi-Fi toggle complete.")
             except Exception: pass
@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from typing import Protocol
+
+class IDisplay(Protocol):
+    def show_page(self, page: str) -> None: ...
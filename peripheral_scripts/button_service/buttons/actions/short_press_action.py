@@ -4,13 +4,17 @@ from __future__ import annotations
 from typing import Optional, Any
 from .ports.sound_port import ISound
 from .ports.wifi_port import IWifi
+from .ports.display_port import IDisplay
 
 class ShortPressAction:
 
-    def __init__(self, sound: ISound, wifi: IWifi, *, sound_name: str, logger: Optional[Any] = None):
+    def __init__(self, sound: ISound, wifi: IWifi, *, sound_name: str,
+                 display: Optional[IDisplay] = None, page: str = "", logger: Optional[Any] = None):
         self.sound = sound
         self.wifi = wifi
         self.sound_name = sound_name
+        self.display = display
+        self.page = page
         self.log = logger
 
     def __call__(self) -> None:
@@ -19,4 +23,6 @@ class ShortPressAction:
             except Exception: pass
             
         self.sound.play(self.sound_name, wait=False)
+        if self.display is not None and self.page:
+            self.display.show_page(self.page)
         self.wifi.toggle()
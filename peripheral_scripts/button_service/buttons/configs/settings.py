@@ -13,6 +13,7 @@ DEFAULT_MODE = "auto"         # "auto" | "bare_pullup" | "module_active_low" | "
 
 DEFAULT_SOUND_SHORT = "WIFI_TOGGLE"
 DEFAULT_SOUND_LONG  = "REBOOT_SYSTEM"
+DEFAULT_OLED_PAGE   = "network"   # OLED page shown on short press; "" disables
 
 @dataclass
 class Settings:
@@ -24,6 +25,7 @@ class Settings:
     mode: str = DEFAULT_MODE
     sound_short: str = DEFAULT_SOUND_SHORT
     sound_long: str = DEFAULT_SOUND_LONG
+    oled_page: str = DEFAULT_OLED_PAGE
 
 
 def load_settings() -> Settings:
@@ -54,5 +56,6 @@ def load_settings() -> Settings:
     s.mode          = os.getenv("BUTTON_MODE", s.mode)
     s.sound_short   = os.getenv("BUTTON_SOUND_SHORT", s.sound_short)
     s.sound_long    = os.getenv("BUTTON_SOUND_LONG",  s.sound_long)
+    s.oled_page     = os.getenv("BUTTON_OLED_PAGE", s.oled_page)
 
     return s
@@ -13,6 +13,7 @@ from .configs.configs import BUTTONS_LOG_FILE
 from .actions.adapters.sound_adapter import SoundClientAdapter
 from .actions.adapters.wifi_adapter import RfkillWifiAdapter
 from .actions.adapters.system_power_adapter import SystemPowerAdapter
+from .actions.adapters.oled_adapter import OledControlAdapter
 from .actions.short_press_action import ShortPressAction
 from .actions.long_press_action import LongPressAction
 
@@ -32,8 +33,10 @@ def main() -> None:
     sound = SoundClientAdapter(logger=log)
     wifi = RfkillWifiAdapter(logger=log)
     power = SystemPowerAdapter(logger=log)
+    display = OledControlAdapter(logger=log)
 
-    short_uc = ShortPressAction(sound, wifi, sound_name=settings.sound_short, logger=log)
+    short_uc = ShortPressAction(sound, wifi, sound_name=settings.sound_short,
+                                display=display, page=settings.oled_page, logger=log)
     long_uc  = LongPressAction(sound, power, sound_name=settings.sound_long, delay_before_reboot=0.0, logger=log)
 
     controller = ButtonController(
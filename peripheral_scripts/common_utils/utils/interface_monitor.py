@@ -1,26 +1,297 @@
 #!/usr/bin/env python3
-import subprocess
+from __future__ import annotations
+
+import errno
+import os
+import socket
+import struct
+import threading
+from typing import Callable, List, Optional, Set
+
+# <linux/rtnetlink.h>, <linux/if_link.h>, <linux/if_addr.h>
+NETLINK_ROUTE = 0
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+RTMGRP_IPV6_IFADDR = 0x100
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_GETADDR = 22
+
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+
+IFLA_IFNAME = 3
+IFLA_OPERSTATE = 16
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+
+IF_OPER_UP = 6
+IFF_LOWER_UP = 0x10000
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_IFINFOMSG = struct.Struct("=BxHiII")
+_IFADDRMSG = struct.Struct("=BBBBI")
+_RTATTR = struct.Struct("=HH")
+
+def _align(n: int) -> int:
+    return (n + 3) & ~3
+
+def _attrs(buf: bytes, offset: int, end: int):
+    while offset + _RTATTR.size <= end:
+        length, kind = _RTATTR.unpack_from(buf, offset)
+        if length < _RTATTR.size:
+            return
+        yield kind, buf[offset + _RTATTR.size:offset + length]
+        offset += _align(length)
 
 class InterfaceMonitor:
-    def __init__(self, interface_name, logger=None):
+    """
+    Tracks one interface's link state and addresses. Without start() every
+    is_up() reads /sys/class/net/<if>/operstate. After start() the state is
+    seeded from an RTNETLINK dump and kept current from link/address
+    multicast events, and listeners are called on every change (not for
+    the seeding itself). When the kernel drops events (ENOBUFS) the state
+    is dumped again and listeners are called once; any other socket error
+    stops the monitor and is reported to the failure listeners.
+    """
+
+    def __init__(self, interface_name, logger=None, sock=None, sysfs_root: str = "/"):
         self.interface_name = interface_name
         self.log = logger
+        self._sock = sock
+        self._sysfs_root = sysfs_root
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[["InterfaceMonitor"], None]] = []
+        self._failure_listeners: List[Callable[["InterfaceMonitor", Exception], None]] = []
+        self._seeding = False
+        self._index: Optional[int] = None
+        self._up: Optional[bool] = None
+        self._addresses: Set[str] = set()
+        self._seq = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
 
-    def is_up(self) -> bool:
+    # ---- state ----
+
+    def _read_operstate(self) -> bool:
+        path = os.path.join(self._sysfs_root, "sys/class/net", self.interface_name, "operstate")
         try:
-            result = subprocess.run(
-                ['ip', 'addr', 'show', self.interface_name],
-                capture_output=True, text=True, check=True, timeout=5
-            )
-            up = 'state UP' in result.stdout
-            if self.log:
-                self.log.debug("[InterfaceMonitor] %s is %s", self.interface_name, "UP" if up else "DOWN")
-            return up
-        except subprocess.TimeoutExpired as e:
+            with open(path) as f:
+                return f.read().strip() == "up"
+        except OSError as e:
             if self.log:
-                self.log.error("[InterfaceMonitor] ip addr timeout: %s", e, exc_info=True)
+                self.log.error("[InterfaceMonitor] can't read %s: %s", path, e)
             return False
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            if self.log:
-                self.log.error("[InterfaceMonitor] ip addr failed: %s", e, exc_info=True)
+
+    def is_up(self) -> bool:
+        with self._lock:
+            up = self._up if self._running else None
+        if up is None:
+            up = self._read_operstate()
+        if self.log:
+            self.log.debug("[InterfaceMonitor] %s is %s", self.interface_name, "UP" if up else "DOWN")
+        return up
+
+    @property
+    def addresses(self) -> Set[str]:
+        with self._lock:
+            return set(self._addresses)
+
+    def add_listener(self, callback: Callable[["InterfaceMonitor"], None]) -> None:
+        self._listeners.append(callback)
+
+    def add_failure_listener(self, callback: Callable[["InterfaceMonitor", Exception], None]) -> None:
+        """callback(monitor, error) runs on the watcher thread once it has stopped for good."""
+        self._failure_listeners.append(callback)
+
+    def _notify(self) -> None:
+        for cb in list(self._listeners):
+            try:
+                cb(self)
+            except Exception as e:
+                if self.log:
+                    self.log.error("[InterfaceMonitor] listener failed: %s", e, exc_info=True)
+
+    # ---- netlink parsing ----
+
+    def handle(self, data: bytes) -> bool:
+        """
+        Applies a buffer of netlink messages. Returns True once the buffer
+        holds the end of a dump (NLMSG_DONE or an error).
+        """
+        changed = done = False
+        offset = 0
+        while offset + _NLMSGHDR.size <= len(data):
+            length, kind, _flags, _seq, _pid = _NLMSGHDR.unpack_from(data, offset)
+            if length < _NLMSGHDR.size:
+                break
+            body, end = offset + _NLMSGHDR.size, min(len(data), offset + length)
+            if kind in (NLMSG_DONE, NLMSG_ERROR):
+                done = True
+            elif kind in (RTM_NEWLINK, RTM_DELLINK):
+                changed |= self._on_link(kind, data, body, end)
+            elif kind in (RTM_NEWADDR, RTM_DELADDR):
+                changed |= self._on_addr(kind, data, body, end)
+            offset += _align(length)
+        if changed and not self._seeding:
+            self._notify()
+        return done
+
+    def _on_link(self, kind: int, data: bytes, body: int, end: int) -> bool:
+        _family, _type, index, flags, _change = _IFINFOMSG.unpack_from(data, body)
+        name = operstate = None
+        for attr, value in _attrs(data, body + _IFINFOMSG.size, end):
+            if attr == IFLA_IFNAME:
+                name = value.rstrip(b"\0").decode(errors="replace")
+            elif attr == IFLA_OPERSTATE and value:
+                operstate = value[0]
+        if name != self.interface_name:
+            return False
+
+        if kind == RTM_DELLINK:
+            up = False
+        elif operstate is not None:
+            up = operstate == IF_OPER_UP
+        else:
+            up = bool(flags & IFF_LOWER_UP)
+
+        with self._lock:
+            self._index = None if kind == RTM_DELLINK else index
+            changed = up != self._up
+            self._up = up
+            if kind == RTM_DELLINK:
+                changed |= bool(self._addresses)
+                self._addresses.clear()
+        if changed and self.log:
+            self.log.info("[InterfaceMonitor] %s link %s", self.interface_name, "UP" if up else "DOWN")
+        return changed
+
+    def _on_addr(self, kind: int, data: bytes, body: int, end: int) -> bool:
+        family, _prefixlen, _flags, _scope, index = _IFADDRMSG.unpack_from(data, body)
+        with self._lock:
+            if index != self._index:
+                return False
+        addr = None
+        for attr, value in _attrs(data, body + _IFADDRMSG.size, end):
+            if attr in (IFA_LOCAL, IFA_ADDRESS) and (addr is None or attr == IFA_LOCAL):
+                try:
+                    addr = socket.inet_ntop(family, value)
+                except (OSError, ValueError):
+                    pass
+        if addr is None:
             return False
+
+        with self._lock:
+            before = len(self._addresses)
+            if kind == RTM_NEWADDR:
+                self._addresses.add(addr)
+            else:
+                self._addresses.discard(addr)
+            changed = len(self._addresses) != before
+        if changed and self.log:
+            self.log.info("[InterfaceMonitor] %s %s %s", self.interface_name,
+                          "gained" if kind == RTM_NEWADDR else "lost", addr)
+        return changed
+
+    # ---- socket ----
+
+    def _open_socket(self):
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+        sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR))
+        return sock
+
+    def _dump(self, kind: int, payload: bytes) -> None:
+        self._seq += 1
+        msg = _NLMSGHDR.pack(_NLMSGHDR.size + len(payload), kind, NLM_F_REQUEST | NLM_F_DUMP, self._seq, 0) + payload
+        self._sock.send(msg)
+        while not self.handle(self._sock.recv(65536)):
+            pass
+
+    def start(self) -> None:
+        """Subscribes to link/address events; the current state is dumped first."""
+        if self._running:
+            return
+        if self._sock is None:
+            self._sock = self._open_socket()
+        # subscribed before dumping, so no change between the two is lost
+        self._seed()
+        self._running = True
+        self._thread = threading.Thread(target=self._watch, name=f"netlink-{self.interface_name}", daemon=True)
+        self._thread.start()
+
+    def _seed(self) -> None:
+        """Dumps link and address state; listeners are not called for it."""
+        self._seeding = True
+        try:
+            self._dump(RTM_GETLINK, _IFINFOMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0))
+            self._dump(RTM_GETADDR, _IFADDRMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0))
+        finally:
+            self._seeding = False
+        with self._lock:
+            if self._up is None:
+                self._up = False
+
+    def _resync(self, attempts: int = 3) -> None:
+        """Rebuilds the state after lost events, then calls the listeners once."""
+        for attempt in range(attempts):
+            with self._lock:
+                self._index, self._up = None, None
+                self._addresses.clear()
+            try:
+                self._seed()
+                break
+            except OSError as e:
+                if e.errno != errno.ENOBUFS or attempt == attempts - 1:
+                    raise
+        self._notify()
+
+    def _watch(self) -> None:
+        error: Optional[Exception] = None
+        while self._running:
+            try:
+                data = self._sock.recv(65536)
+                if not data:
+                    error = OSError("netlink socket closed")
+                    break
+                self.handle(data)
+            except OSError as e:
+                if not self._running:
+                    return      # stop() closed the socket
+                if e.errno != errno.ENOBUFS:
+                    error = e
+                    break
+                # the receive buffer overflowed and events were lost
+                if self.log:
+                    self.log.warning("[InterfaceMonitor] %s: netlink events lost, resyncing", self.interface_name)
+                try:
+                    self._resync()
+                except OSError as e2:
+                    error = e2
+                    break
+
+        self._running = False
+        if error is None:
+            return
+        if self.log:
+            self.log.error("[InterfaceMonitor] netlink socket failed: %s", error, exc_info=error)
+        for cb in list(self._failure_listeners):
+            try:
+                cb(self, error)
+            except Exception as e:
+                if self.log:
+                    self.log.error("[InterfaceMonitor] failure listener failed: %s", e, exc_info=True)
+
+    def stop(self) -> None:
+        self._running = False
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Fire-and-forget commands to the OLED service's control socket (a unix
+datagram socket). Sending never blocks; False means the service is not
+listening.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+from typing import Any
+
+CONTROL_SOCKET = os.environ.get("OLED_CONTROL_SOCKET", "/run/peripherals/oled/control.sock")
+
+def send(command: str, *, path: str = CONTROL_SOCKET, **args: Any) -> bool:
+    payload = json.dumps({"cmd": command, **args}, separators=(",", ":")).encode("utf-8")
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(payload, path)
+        return True
+    except OSError:
+        return False
+
+def show_page(page: str, **kw: Any) -> bool:
+    """page: a page token ("network", "perf", ...), "next" or "prev"."""
+    return send("page", page=page, **kw)
+
+def alert(kind: str, **details: Any) -> bool:
+    """kind: "ac_lost", "ac_restored" or "low_battery"; details are shown with it (e.g. soc=42.0)."""
+    return send("alert", kind=kind, **details)
+
+def redraw(**kw: Any) -> bool:
+    return send("redraw", **kw)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import glob
+import os
+import struct
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+
+# enum rfkill_type / rfkill_operation from <linux/rfkill.h>
+TYPE_ALL = 0
+TYPE_WLAN = 1
+TYPE_BLUETOOTH = 2
+
+OP_ADD = 0
+OP_DEL = 1
+OP_CHANGE = 2
+OP_CHANGE_ALL = 3
+
+_TYPE_NAMES = {
+    "all": TYPE_ALL, "wlan": TYPE_WLAN, "wifi": TYPE_WLAN, "bluetooth": TYPE_BLUETOOTH,
+    "uwb": 3, "wimax": 4, "wwan": 5, "gps": 6, "fm": 7, "nfc": 8,
+}
+
+# struct rfkill_event: idx, type, op, soft, hard. Newer kernels append bytes
+# (hard_block_reasons), so reads take a larger buffer and decode the prefix.
+_EVENT = struct.Struct("=IBBBB")
+_READ_SIZE = 64
+
+def rfkill_type(name: str) -> int:
+    return _TYPE_NAMES[name.lower()]
+
+@dataclass(frozen=True)
+class RfkillDevice:
+    idx: int
+    type: int
+    name: str
+    soft: bool
+    hard: bool
+
+    @property
+    def blocked(self) -> bool:
+        return self.soft or self.hard
+
+class RfkillState:
+    """
+    In-memory table of rfkill switches. It is seeded from /sys/class/rfkill
+    and kept current by a thread reading change events from /dev/rfkill, so
+    queries never touch the filesystem. Without /dev/rfkill the table is
+    re-read from sysfs on each query instead.
+    """
+
+    def __init__(self, root: str = "/", logger=None, watch: bool = True):
+        self.root = root
+        self.log = logger
+        self._lock = threading.Lock()
+        self._devices: Dict[int, RfkillDevice] = {}
+        self._watching = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.reload()
+        if watch:
+            self.start()
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self.root, rel)
+
+    @staticmethod
+    def _read_attr(path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def reload(self) -> None:
+        table: Dict[int, RfkillDevice] = {}
+        for d in glob.glob(self._path("sys/class/rfkill/rfkill*")):
+            idx = self._read_attr(os.path.join(d, "index"))
+            kind = self._read_attr(os.path.join(d, "type"))
+            if idx is None or not idx.isdigit() or kind is None:
+                continue
+            table[int(idx)] = RfkillDevice(
+                idx=int(idx),
+                type=_TYPE_NAMES.get(kind, -1),
+                name=self._read_attr(os.path.join(d, "name")) or "",
+                soft=self._read_attr(os.path.join(d, "soft")) == "1",
+                hard=self._read_attr(os.path.join(d, "hard")) == "1",
+            )
+        with self._lock:
+            self._devices = table
+
+    def apply_event(self, idx: int, type_: int, op: int, soft: bool, hard: bool) -> None:
+        with self._lock:
+            if op == OP_DEL:
+                self._devices.pop(idx, None)
+            elif op in (OP_ADD, OP_CHANGE):
+                prev = self._devices.get(idx)
+                name = prev.name if prev else self._read_attr(self._path(f"sys/class/rfkill/rfkill{idx}/name")) or ""
+                self._devices[idx] = RfkillDevice(idx, type_, name, soft, hard)
+            elif op == OP_CHANGE_ALL:
+                for i, dev in self._devices.items():
+                    if type_ == TYPE_ALL or dev.type == type_:
+                        self._devices[i] = replace(dev, soft=soft)
+
+    def _watch(self, fd: int) -> None:
+        try:
+            while True:
+                data = os.read(fd, _READ_SIZE)
+                if len(data) < _EVENT.size:
+                    break
+                idx, type_, op, soft, hard = _EVENT.unpack_from(data)
+                self.apply_event(idx, type_, op, bool(soft), bool(hard))
+        except OSError as e:
+            if self.log:
+                self.log.warning("[Rfkill] event stream closed: %s", e)
+        finally:
+            self._watching = False
+            os.close(fd)
+
+    def start(self) -> None:
+        if self._watching:
+            return
+        try:
+            fd = os.open(self._path("dev/rfkill"), os.O_RDONLY)
+        except OSError as e:
+            if self.log:
+                self.log.debug("[Rfkill] /dev/rfkill unavailable (%s); polling sysfs", e)
+            return
+        # the kernel replays an ADD event for every existing switch on open
+        self._watching = True
+        self._thread = threading.Thread(target=self._watch, args=(fd,), name="rfkill-events", daemon=True)
+        self._thread.start()
+
+    def devices(self, type_: int = TYPE_ALL) -> List[RfkillDevice]:
+        if not self._watching:
+            self.reload()
+        with self._lock:
+            return [d for d in self._devices.values() if type_ == TYPE_ALL or d.type == type_]
+
+    def soft_blocked(self, type_: int) -> Optional[bool]:
+        """True if any switch of the type is soft-blocked; None when there is none."""
+        devs = self.devices(type_)
+        return any(d.soft for d in devs) if devs else None
+
+    def blocked(self, type_: int) -> Optional[bool]:
+        """True if any switch of the type is soft- or hard-blocked; None when there is none."""
+        devs = self.devices(type_)
+        return any(d.blocked for d in devs) if devs else None
+
+    def set_blocked(self, type_: int, blocked: bool) -> bool:
+        """Soft-blocks or unblocks every switch of the type, like `rfkill block <type>`."""
+        event = _EVENT.pack(0, type_, OP_CHANGE_ALL, int(blocked), 0)
+        try:
+            fd = os.open(self._path("dev/rfkill"), os.O_WRONLY)
+            try:
+                os.write(fd, event)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            if self.log:
+                self.log.debug("[Rfkill] /dev/rfkill write failed (%s); writing sysfs", e)
+            if not self._write_sysfs(type_, blocked):
+                return False
+        self.apply_event(0, type_, OP_CHANGE_ALL, blocked, False)
+        return True
+
+    def _write_sysfs(self, type_: int, blocked: bool) -> bool:
+        devs = self.devices(type_)
+        ok = bool(devs)
+        for d in devs:
+            try:
+                with open(self._path(f"sys/class/rfkill/rfkill{d.idx}/soft"), "w") as f:
+                    f.write("1" if blocked else "0")
+            except OSError as e:
+                if self.log:
+                    self.log.error("[Rfkill] failed to set rfkill%d soft=%d: %s", d.idx, blocked, e)
+                ok = False
+        return ok
+
+_shared: Optional[RfkillState] = None
+_shared_lock = threading.Lock()
+
+def shared_rfkill(logger=None) -> RfkillState:
+    """Process-wide RfkillState, so every reader shares one table and one event thread."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RfkillState(root=os.environ.get("RFKILL_ROOT", "/"), logger=logger)
+        return _shared
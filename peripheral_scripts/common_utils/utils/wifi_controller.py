@@ -1,41 +1,27 @@
 #!/usr/bin/env python3
-import subprocess
+from utils.rfkill import TYPE_WLAN, shared_rfkill
 
 class WifiController:
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, rfkill=None):
         self.log = logger
+        self._rfkill = rfkill or shared_rfkill(logger)
 
     def is_blocked(self) -> bool:
-        try:
-            result = subprocess.run(
-                ['rfkill', 'list', 'wifi'],
-                capture_output=True, text=True, check=True, timeout=5
-            )
-            blocked = 'Soft blocked: yes' in result.stdout
+        blocked = self._rfkill.soft_blocked(TYPE_WLAN)
+        if blocked is None:
             if self.log:
-                self.log.debug("[WifiController] rfkill says wifi is %s", "BLOCKED" if blocked else "UNBLOCKED")
-            return blocked
-        except subprocess.TimeoutExpired as e:
-            if self.log:
-                self.log.error("[WifiController] rfkill timeout: %s", e, exc_info=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            if self.log:
-                self.log.error("[WifiController] rfkill failed: %s", e, exc_info=True)
+                self.log.error("[WifiController] no wlan rfkill switch found")
             return True
+        if self.log:
+            self.log.debug("[WifiController] rfkill says wifi is %s", "BLOCKED" if blocked else "UNBLOCKED")
+        return blocked
 
     def set_blocked(self, blocked: bool) -> bool:
         action = 'block' if blocked else 'unblock'
-        try:
-            subprocess.run(['rfkill', action, 'wifi'], check=True, timeout=5)
+        if self._rfkill.set_blocked(TYPE_WLAN, blocked):
             if self.log:
                 self.log.info("[WifiController] Wi-Fi %sed successfully.", action)
             return True
-        except subprocess.TimeoutExpired as e:
-            if self.log:
-                self.log.error("[WifiController] rfkill %s timeout: %s", action, e, exc_info=True)
-            return False
-        except Exception as e:
-            if self.log:
-                self.log.error("[WifiController] Failed to %s Wi-Fi: %s", action, e, exc_info=True)
-            return False
+        if self.log:
+            self.log.error("[WifiController] Failed to %s Wi-Fi", action)
+        return False
@@ -2,7 +2,11 @@ import os
 
 BASE_DIR = os.environ.get("PERIPHERALS_ROOT", "/home/reekroo/peripheral_scripts")
 LOG_DIR = os.path.join(BASE_DIR, "logs")
-LOG_FILE = os.path.join(LOG_DIR, "network_policy.log"),
+LOG_FILE = os.path.join(LOG_DIR, "network_policy.log")
 
 LAN_INTERFACE = os.environ.get("LAN_INTERFACE", "eth0")
-AUTO_UNBLOCK_WHEN_LAN_DOWN = os.environ.get("AUTO_UNBLOCK_WHEN_LAN_DOWN", "0") in ("1", "true", "True")
\ No newline at end of file
+AUTO_UNBLOCK_WHEN_LAN_DOWN = os.environ.get("AUTO_UNBLOCK_WHEN_LAN_DOWN", "0") in ("1", "true", "True")
+
+# Daemon mode
+POLICY_DEBOUNCE_SEC = float(os.environ.get("POLICY_DEBOUNCE_SEC", "0.5"))  # quiet time before re-applying
+POLICY_RESYNC_SEC = float(os.environ.get("POLICY_RESYNC_SEC", "300"))     # periodic re-apply; 0 disables
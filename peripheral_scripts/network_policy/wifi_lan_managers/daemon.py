@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import logging
+import signal
+import sys
+import threading
+import time
+
+from . import configs
+from .policy import LanWifiPolicy
+
+from utils.logger import setup_logger
+from utils.interface_monitor import InterfaceMonitor
+from utils.wifi_controller import WifiController
+
+class LanWifiDaemon:
+    """
+    Re-applies the policy whenever the LAN interface changes. Changes are
+    debounced: the policy runs once the link has been quiet for `debounce`
+    seconds, so a flapping cable or a DHCP renewal triggers a single apply.
+    The policy is also re-applied every `resync` seconds as a safety net.
+    If the monitor's netlink socket fails, the monitor is restarted; when
+    the restart fails too, run() raises and the service exits for systemd
+    to restart it.
+    """
+
+    def __init__(
+        self,
+        policy: LanWifiPolicy,
+        lan_monitor: InterfaceMonitor,
+        debounce: float,
+        resync: float,
+        logger: logging.Logger
+    ):
+        self._policy = policy
+        self._lan_monitor = lan_monitor
+        self._debounce = max(0.0, debounce)
+        self._resync = resync
+        self._log = logger
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._monitor_failed = threading.Event()
+        self._last_change = 0.0
+        lan_monitor.add_listener(self._on_change)
+        lan_monitor.add_failure_listener(self._on_failure)
+
+    def _on_change(self, _monitor: InterfaceMonitor) -> None:
+        self._last_change = time.monotonic()
+        self._changed.set()
+
+    def _on_failure(self, _monitor: InterfaceMonitor, error: Exception) -> None:
+        self._monitor_failed.set()
+        self._changed.set()
+
+    def _restart_monitor(self) -> None:
+        self._log.warning("Restarting the %s monitor.", self._lan_monitor.interface_name)
+        self._monitor_failed.clear()
+        self._lan_monitor.stop()
+        self._lan_monitor.start()   # an OSError here ends run()
+
+    def _settle(self) -> None:
+        while not self._stop.is_set():
+            quiet = time.monotonic() - self._last_change
+            if quiet >= self._debounce:
+                return
+            self._stop.wait(self._debounce - quiet)
+
+    def run(self) -> None:
+        self._lan_monitor.start()
+        self._log.info("LanWifiDaemon watching %s (debounce=%.2fs).", self._lan_monitor.interface_name, self._debounce)
+        self._policy.apply()
+
+        while not self._stop.is_set():
+            woke = self._changed.wait(self._resync if self._resync > 0 else None)
+            if self._stop.is_set():
+                break
+            if self._monitor_failed.is_set():
+                self._restart_monitor()
+            if woke:
+                self._settle()
+                self._changed.clear()
+                self._log.info("LAN state changed.")
+            self._policy.apply()
+
+        self._lan_monitor.stop()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._changed.set()
+
+def main():
+    logger = setup_logger(
+        logger_name='LanWifiPolicy',
+        log_file=configs.LOG_FILE
+    )
+
+    try:
+        lan_monitor = InterfaceMonitor(configs.LAN_INTERFACE, logger=logger)
+        wifi_controller = WifiController(logger=logger)
+
+        policy = LanWifiPolicy(
+            lan_monitor=lan_monitor,
+            wifi_controller=wifi_controller,
+            auto_unblock=configs.AUTO_UNBLOCK_WHEN_LAN_DOWN,
+            logger=logger
+        )
+        daemon = LanWifiDaemon(
+            policy=policy,
+            lan_monitor=lan_monitor,
+            debounce=configs.POLICY_DEBOUNCE_SEC,
+            resync=configs.POLICY_RESYNC_SEC,
+            logger=logger
+        )
+
+        signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+        daemon.run()
+        logger.info("LanWifiDaemon stopped.")
+
+    except KeyboardInterrupt:
+        logger.info("LanWifiDaemon stopped by user.")
+    except Exception:
+        logger.critical("Critical error in LAN/Wi-Fi policy daemon.", exc_info=True)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Per-page render cost for every page make_pages() builds, on both
+profiles, against synthetic stats: draw time (status bar and page),
+show() time on the render thread and memory allocated per frame. Frames
+go to a CaptureDriver, so no hardware is needed:
+
+    python -m oleds.benchmarks.page_render [--frames N] [--png DIR]
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+from oleds.configs.oled_profiles import PROFILES
+from oleds.displays.drivers.capture import CaptureDriver
+from oleds.displays.manager import DisplayManager
+from oleds.displays.screen_factory import make_pages
+
+GIB = 1024 ** 3
+
+def _rate(bps: float) -> str:
+    return f"{bps / (1024 * 1024):.1f}M/s" if bps >= 1024 * 1024 else f"{bps / 1024:.0f}K/s"
+
+def synthetic_stats(i: int, rng: random.Random) -> dict:
+    """A plausible stats dict for frame i: slow waves plus noise, all keys the pages read."""
+    wave = 0.5 + 0.5 * math.sin(i / 7.0)
+    mem_used = (2.0 + 3.0 * wave) * GIB
+    return {
+        "cpu": round(100 * wave * rng.uniform(0.6, 1.0), 1),
+        "cpu_freq": rng.choice((600, 1200, 1800, 2400)),
+        "temp": round(45 + 20 * wave, 1),
+        "mem": {"used": mem_used, "total": 8 * GIB, "percent": round(100 * mem_used / (8 * GIB), 1)},
+        "swap": {"used": 0.1 * GIB, "total": 1 * GIB, "percent": 10.0},
+        "uptime": f"3d {4 + i // 3600}h",
+        "ip": "192.168.1.20", "lan_ip": "192.168.1.20", "wifi_ip": None,
+        "root_disk_usage": {"used": 9 * GIB, "total": 30 * GIB, "percent": 30.0},
+        "status_root_disk": True,
+        "storage_disk_usage": {"used": 500 * GIB, "total": 1000 * GIB, "percent": 50.0},
+        "disk_io": {"read": _rate(rng.uniform(0, 40e6) * wave), "write": _rate(rng.uniform(0, 8e6))},
+        "network_throughput": {"upload": _rate(rng.uniform(0, 2e6)), "download": _rate(rng.uniform(0, 90e6) * wave)},
+        "docker_restarts": 1, "docker_status": "running", "docker_exit_code": 0, "status_docker": True,
+        "nvme_temp": round(38 + 10 * wave), "status_storage_disk": True,
+        "core_voltage": 0.88, "status_voltage": True,
+        "throttling": "NO" if i % 50 else "0x50000",
+        "status_wifi": False, "status_wifi_connected": False, "status_lan": True, "status_bluetooth": False,
+        "weather": {"location_name": "Berlin", "temperature": 21.0 + wave, "feels_like": 20.0,
+                    "pressure": 1013, "humidity": 40, "description": "clear sky", "source": "synthetic"},
+    }
+
+def _render(dm, page, stats) -> float:
+    page.observe(stats)
+    t0 = time.perf_counter()
+    if not getattr(page, "HANDLES_BACKGROUND", False):
+        dm.clear()
+        dm.draw_status_bar(stats)
+    page.draw(dm, stats)
+    return time.perf_counter() - t0
+
+def _show(dm) -> float:
+    t0 = time.perf_counter()
+    dm.show()
+    elapsed = time.perf_counter() - t0
+    dm.flush()
+    return elapsed
+
+def run(profile_name: str, frames: int, seed: int, png_dir: str | None) -> None:
+    profile = PROFILES[profile_name]
+    driver = CaptureDriver(profile.width, profile.height, identifier=profile_name)
+    dm = DisplayManager(driver, profile_name)
+    pages = make_pages(driver)
+    print(f"{profile_name}: {profile.width}x{profile.height} mode {profile.image_mode}, "
+          f"{len(pages)} pages, {frames} frames each")
+    print(f"  {'page':<24} {'draw ms p50/p95':>16} {'show ms p50':>12} {'alloc KiB':>10} {'kept B':>8}")
+
+    for idx, page in enumerate(pages):
+        name = type(page).__name__
+        rng = random.Random(seed)
+        try:
+            for i in range(3):    # warm caches (glyphs, layers, icons)
+                _render(dm, page, synthetic_stats(i, rng))
+                _show(dm)
+
+            draw_t, show_t = [], []
+            for i in range(frames):
+                draw_t.append(_render(dm, page, synthetic_stats(i, rng)))
+                show_t.append(_show(dm))
+
+            # allocations: peak above the starting point within a frame, and what stays allocated
+            tracemalloc.start()
+            peak, kept = 0, 0
+            start = tracemalloc.get_traced_memory()[0]
+            for i in range(min(frames, 20)):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                _render(dm, page, synthetic_stats(i, rng))
+                _show(dm)
+                peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+            kept = (tracemalloc.get_traced_memory()[0] - start) / min(frames, 20)
+            tracemalloc.stop()
+        except Exception as e:
+            tracemalloc.stop()
+            print(f"  {name:<24} failed: {e!r}")
+            continue
+
+        p95 = sorted(draw_t)[max(0, int(len(draw_t) * 0.95) - 1)]
+        print(f"  {name:<24} {statistics.median(draw_t) * 1e3:7.2f} /{p95 * 1e3:7.2f} "
+              f"{statistics.median(show_t) * 1e3:12.3f} {peak / 1024:10.1f} {kept:8.0f}")
+
+        if png_dir and driver.last is not None:
+            os.makedirs(png_dir, exist_ok=True)
+            driver.last.save(os.path.join(png_dir, f"{profile_name}_{idx:02d}_{name}.png"))
+
+    print(f"  transfer: {dm.transfer_stats()}")
+    dm.close()
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--frames", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--png", metavar="DIR", help="save each page's last frame as a PNG in DIR")
+    ap.add_argument("--profile", choices=sorted(PROFILES), action="append")
+    args = ap.parse_args()
+    for name in args.profile or ("ssd1306", "ssd1327"):
+        run(name, args.frames, args.seed, args.png)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Per-frame cost of packing a 128x64 mode "1" frame into the SSD1306 page
+buffer: the per-pixel loop the adafruit driver's image() runs versus
+pack_pages(). No hardware needed:
+
+    python -m oleds.benchmarks.ssd1306_packing [--frames N]
+"""
+import argparse
+import time
+
+from PIL import Image, ImageDraw
+
+from oleds.displays.drivers.ssd1306_framebuffer import pack_pages
+
+def pack_per_pixel(image, out, offset: int = 0) -> None:
+    """Reference: the pixel walk adafruit_ssd1306.SSD1306.image() performs."""
+    width, height = image.size
+    pix = image.load()
+    index = offset
+    for page in range(height // 8):
+        for x in range(width):
+            bits = 0
+            for bit in range(8):
+                bits <<= 1
+                bits |= 0 if pix[(x, page * 8 + 7 - bit)] == 0 else 1
+            out[index] = bits
+            index += 1
+
+def _frame(width: int, height: int, seed: int) -> Image.Image:
+    img = Image.new("1", (width, height))
+    d = ImageDraw.Draw(img)
+    d.text((2, 0), "CPU 37% 1.8GHz", fill=255)
+    d.text((2, 16), f"12:{seed % 60:02d}  up 3d 4h", fill=255)
+    d.rectangle((2, 34, 2 + (seed * 7) % 120, 42), fill=255)
+    d.line((0, height - 1, width - 1, height - 1 - seed % height), fill=255)
+    return img
+
+def _bench(fn, frames, width, height) -> float:
+    buf = bytearray(width * height // 8 + 1)
+    t0 = time.perf_counter()
+    for img in frames:
+        fn(img, buf, 1)
+    return (time.perf_counter() - t0) / len(frames)
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--frames", type=int, default=200)
+    ap.add_argument("--width", type=int, default=128)
+    ap.add_argument("--height", type=int, default=64)
+    args = ap.parse_args()
+
+    frames = [_frame(args.width, args.height, i) for i in range(args.frames)]
+
+    a = bytearray(args.width * args.height // 8 + 1)
+    b = bytearray(len(a))
+    for img in frames[:10]:
+        pack_per_pixel(img, a, 1)
+        pack_pages(img, b, 1)
+        assert a == b, "pack_pages output differs from the per-pixel reference"
+
+    slow = _bench(pack_per_pixel, frames, args.width, args.height)
+    fast = _bench(pack_pages, frames, args.width, args.height)
+    print(f"{args.width}x{args.height}, {args.frames} frames")
+    print(f"  per-pixel loop : {slow * 1e6:9.1f} us/frame")
+    print(f"  pack_pages     : {fast * 1e6:9.1f} us/frame  ({slow / fast:.0f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Per-string cost of drawing page text with ImageDraw.text (FreeType layout
+and rasterization on every call) versus GlyphTextRenderer (glyphs
+rasterized once, strings composed from the cached bitmaps, recent strings
+kept), for the fonts and image mode of each profile. No hardware needed:
+
+    python -m oleds.benchmarks.text_render [--rounds N]
+"""
+import argparse
+import time
+
+from PIL import Image, ImageDraw
+
+from oleds.configs.oled_profiles import PROFILES
+from oleds.configs.themes import get_theme
+from oleds.displays.ui.glyph_text import GlyphTextRenderer
+
+LINES = (
+    "CPU 37% 1.8GHz 51°C",
+    "MEM 2.0/8.0G 40%",
+    "IP 10.0.0.5",
+    "↑12K/s  ↓1.2M/s",
+    "Disk IO: R:10K W:2M",
+    "Docker: running (R:1)",
+    "Uptime: 3d 4h",
+    "12:34",
+)
+
+def _bench(draw_fn, image, fonts, rounds: int) -> float:
+    draw = ImageDraw.Draw(image)
+    t0 = time.perf_counter()
+    for i in range(rounds):
+        for font in fonts:
+            for y, s in enumerate(LINES):
+                draw_fn(draw, (2, (y * 14 + i) % image.size[1]), s, font)
+    return (time.perf_counter() - t0) / (rounds * len(fonts) * len(LINES))
+
+def run(profile_name: str, rounds: int) -> None:
+    profile = PROFILES[profile_name]
+    theme = get_theme(profile_name)
+    fonts = [theme.load_font(sz) for sz in (theme.font_small, theme.font_regular, theme.font_large)]
+    size = (profile.width, profile.height)
+    fill = 255
+
+    renderer = GlyphTextRenderer()
+    t0 = time.perf_counter()
+    ref = Image.new(profile.image_mode, size)
+    renderer.warm(fonts, ImageDraw.Draw(ref).fontmode)
+    build = time.perf_counter() - t0
+
+    got = Image.new(profile.image_mode, size)
+    for y, s in enumerate(LINES):
+        for font in fonts:
+            ImageDraw.Draw(ref).text((2, y * 14), s, font=font, fill=fill)
+            renderer.text(ImageDraw.Draw(got), (2, y * 14), s, font=font, fill=fill)
+    assert ref.tobytes() == got.tobytes(), "glyph renderer output differs from ImageDraw.text"
+
+    freetype = _bench(lambda d, xy, s, f: d.text(xy, s, font=f, fill=fill), Image.new(profile.image_mode, size), fonts, rounds)
+    glyphs = _bench(lambda d, xy, s, f: renderer.text(d, xy, s, font=f, fill=fill), Image.new(profile.image_mode, size), fonts, rounds)
+
+    fontmode = ImageDraw.Draw(ref).fontmode
+    atlases = [a for a in (renderer.atlas(f, fontmode) for f in fonts) if a is not None]
+
+    def uncached(d, xy, s, f):
+        for a in atlases:
+            a._strings.clear()    # compose every string from glyphs
+        renderer.text(d, xy, s, font=f, fill=fill)
+
+    composed = _bench(uncached, Image.new(profile.image_mode, size), fonts, rounds)
+    print(f"{profile_name}: {size[0]}x{size[1]} mode {profile.image_mode}, "
+          f"{len(atlases)}/{len(fonts)} fonts on the atlas (built in {build * 1e3:.0f} ms)")
+    print(f"  ImageDraw.text     : {freetype * 1e6:7.1f} us/string")
+    print(f"  glyphs, composed   : {composed * 1e6:7.1f} us/string  ({freetype / composed:.1f}x)")
+    print(f"  glyphs, cached     : {glyphs * 1e6:7.1f} us/string  ({freetype / glyphs:.1f}x)")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--rounds", type=int, default=200)
+    ap.add_argument("--profile", choices=sorted(PROFILES), action="append")
+    args = ap.parse_args()
+    for name in args.profile or ("ssd1306", "ssd1327"):
+        run(name, args.rounds)
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,14 @@ LOG_FILE = os.path.join(LOG_DIR, "oleds.log")
 
 # Rendering / UI
 PAGE_INTERVAL = int(os.environ.get("OLED_PAGE_INTERVAL", "10"))     # seconds per page
-UPDATE_INTERVAL = int(os.environ.get("OLED_UPDATE_INTERVAL", "2"))  # refresh period
+UPDATE_INTERVAL = int(os.environ.get("OLED_UPDATE_INTERVAL", "2"))  # stats collection period
+RENDER_FPS = float(os.environ.get("OLED_RENDER_FPS", "0"))          # 0: the display's capabilities.target_fps
+ANIMATIONS = os.environ.get("OLED_ANIMATIONS", "0") == "1"          # redraw ANIMATED pages at the frame rate (opt-in: ~20 wakeups/s)
+PAGE_PREFETCH_LEAD = float(os.environ.get("OLED_PAGE_PREFETCH_LEAD", str(UPDATE_INTERVAL)))  # warm next page's stats
+TEXT_BACKEND = os.environ.get("OLED_TEXT_BACKEND", "glyph")  # "glyph" (cached glyph atlas) or "freetype"
+FRAMEBUFFER_BACKEND = os.environ.get("OLED_FRAMEBUFFER", "numpy")  # "numpy" (for "L" frames) or "pil"
+ASYNC_TRANSFER = os.environ.get("OLED_ASYNC_TRANSFER", "1") == "1"  # double-buffer frames, send them on a worker thread
+TREND_WINDOW = os.environ.get("OLED_TREND_WINDOW", "live")  # sparkline span: "live", "1h" or "24h"
 
 # Font configuration
 FONT_PATH = os.environ.get("OLED_FONT_PATH", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
@@ -15,6 +22,50 @@ FONT_SIZE = int(os.environ.get("OLED_FONT_SIZE", "10"))
 # Weather socket
 WEATHER_SERVICE_SOCKET = os.environ.get("WEATHER_SERVICE_SOCKET", "/tmp/weather_service.sock")
 
+# Root of /sys and /dev for native hardware readers (point at a fake tree for testing)
+SYSFS_ROOT = os.environ.get("OLED_SYSFS_ROOT", "/")
+
+# NVMe SMART log read through the admin-command ioctl
+NVME_DEVICE = os.environ.get("OLED_NVME_DEVICE", os.path.join(SYSFS_ROOT, "dev/nvme0"))
+NVME_HEALTH_TTL = float(os.environ.get("OLED_NVME_HEALTH_TTL", "30"))  # seconds a snapshot is reused
+
+# Docker Engine API
+DOCKER_SOCKET = os.environ.get("OLED_DOCKER_SOCKET", "/var/run/docker.sock")
+DOCKER_PROJECT = os.environ.get("OLED_DOCKER_PROJECT", "server-stack") or None  # compose project to track
+DOCKER_CONTAINER = os.environ.get("OLED_DOCKER_CONTAINER", "organizr")         # container shown on the pages
+
+# Control socket (utils.oled_control): page flips from the button service, alerts from the UPS service
+CONTROL_SOCKET = os.environ.get("OLED_CONTROL_SOCKET", "/run/peripherals/oled/control.sock")
+ALERT_DURATION = float(os.environ.get("OLED_ALERT_DURATION", "30"))  # seconds an alert page stays up
+
 # Ups status
 UPS_STATUS_PATH = os.environ.get("UPS_STATUS_PATH", "/run/peripherals/ups/status.json")
-UPS_STATUS_STALE_SEC = int(os.environ.get("UPS_STATUS_STALE_SEC", "120"))
\ No newline at end of file
+UPS_STATUS_STALE_SEC = int(os.environ.get("UPS_STATUS_STALE_SEC", "120"))
+
+# Metrics time-series ring (mmap, tmpfs), persisted periodically; empty OLED_TS_PATH disables it
+TS_PATH = os.environ.get("OLED_TS_PATH", "/run/peripherals/oled/metrics.ring")
+TS_PERSIST_PATH = os.environ.get("OLED_TS_PERSIST_PATH", os.path.join(BASE_DIR, "data", "oled_metrics.ring")) or None
+TS_CAPACITY = int(os.environ.get("OLED_TS_CAPACITY", "43200"))                # records; 24h at 2s cycles
+TS_PERSIST_INTERVAL = float(os.environ.get("OLED_TS_PERSIST_INTERVAL", "900"))  # seconds
+
+# Stats recording for replay (python -m oleds.replay); empty OLED_RECORD_PATH disables it
+RECORD_PATH = os.environ.get("OLED_RECORD_PATH", "")
+
+# Stats collection
+PROBE_DEADLINE = float(os.environ.get("OLED_PROBE_DEADLINE", "1.5"))  # seconds per probe, per cycle
+PROBE_WORKERS = int(os.environ.get("OLED_PROBE_WORKERS", "6"))
+PROBE_PERIOD_SLACK = float(os.environ.get("OLED_PROBE_PERIOD_SLACK", "0.25"))  # tolerate tick jitter
+PROBE_TTL_FACTOR = float(os.environ.get("OLED_PROBE_TTL_FACTOR", "3"))          # ttl = period * factor
+
+# Per-probe sampling periods in seconds; override with OLED_PERIOD_<PROBE>, e.g. OLED_PERIOD_DOCKER=30
+_PROBE_PERIOD_DEFAULTS = {
+    "cpu": 2, "memory": 2, "temp": 2, "disk_io": 2, "network_io": 2, "docker": 2,
+    "wifi": 5, "lan": 5, "ip": 10,
+    "voltage": 10, "throttling": 10,
+    "uptime": 30, "bluetooth": 30, "weather": 30,
+    "root_disk": 60, "storage_disk": 60, "nvme": 60,
+}
+PROBE_PERIODS = {
+    name: float(os.environ.get(f"OLED_PERIOD_{name.upper()}", str(sec)))
+    for name, sec in _PROBE_PERIOD_DEFAULTS.items()
+}
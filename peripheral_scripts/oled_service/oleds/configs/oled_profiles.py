@@ -18,7 +18,7 @@ class OledProfile:
     name: str
     width: int
     height: int
-    image_mode: str           # "1" or "RGB" (for SSD1327)
+    image_mode: str           # "1", or "L" / "RGB" (for SSD1327)
     statusbar_icon: int       # px (8 or 16)
     font_small: int
     font_regular: int
@@ -47,7 +47,7 @@ SSD1327_PROFILE = OledProfile(
     name="ssd1327",
     width=_envint("OLED_WIDTH", 128),
     height=_envint("OLED_HEIGHT", 128),
-    image_mode=os.getenv("OLED_IMAGE_MODE", "RGB"),
+    image_mode=os.getenv("OLED_IMAGE_MODE", "L"),
     statusbar_icon=16,
     font_small=_envint("OLED_FONT_SMALL", 10),
     font_regular=_envint("OLED_FONT_REGULAR", 12),
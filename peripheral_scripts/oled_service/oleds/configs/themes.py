@@ -7,6 +7,10 @@ from typing import Optional, Tuple
 from PIL import Image, ImageFont
 
 from oleds.models.icons_x8 import ICON_DATA
+from oleds.displays.ui.icon_atlas import icon_atlas
+
+# fg/bg a '1' bitmap converts to in each mode; other modes take the PIL path
+_ATLAS_COLOURS = {"1": (255, 0), "L": (255, 0), "RGB": ((255, 255, 255), (0, 0, 0))}
 
 def _default_font_path() -> str:
     candidates = [
@@ -23,9 +27,9 @@ def _default_font_path() -> str:
 @dataclass(frozen=True)
 class Theme:
     name: str
-    image_mode: str                # "1" or "RGB" (for SSD1327)
-    foreground: Tuple[int, ...]    # 255 or (255,255,255)
-    background: Tuple[int, ...]    # 0 or (0,0,0)
+    image_mode: str                # "1", or "L" / "RGB" (for SSD1327)
+    foreground: Tuple[int, ...]    # 255 or (255,255,255) for RGB
+    background: Tuple[int, ...]    # 0 or (0,0,0) for RGB
     font_path: str
     font_small: int
     font_regular: int
@@ -81,6 +85,10 @@ class IconProvider:
         
         if not data:
             return None
+
+        colours = _ATLAS_COLOURS.get(self.image_mode)
+        if colours is not None and self.size % 8 == 0:
+            return icon_atlas("x8", self.size, self.image_mode, *colours).get(name)
         
         icon = Image.frombytes('1', (8, 8), bytes(data))
         
@@ -107,11 +115,13 @@ def make_mono_theme() -> Theme:
     )
 
 def make_gray_theme() -> Theme:
+    image_mode = os.getenv("OLED_IMAGE_MODE", "L")
+    rgb = image_mode == "RGB"
     return Theme(
         name="gray",
-        image_mode=os.getenv("OLED_IMAGE_MODE", "RGB"),
-        foreground=(255, 255, 255),
-        background=(0, 0, 0),
+        image_mode=image_mode,
+        foreground=(255, 255, 255) if rgb else 255,
+        background=(0, 0, 0) if rgb else 0,
         font_path=os.getenv("OLED_FONT_PATH", _default_font_path()),
         font_small=int(os.getenv("OLED_FONT_SMALL", "10")),
         font_regular=int(os.getenv("OLED_FONT_REGULAR", "12")),
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import socket
+import threading
+from typing import Any, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+def _check(cmd: Any) -> None:
+    """Raises ValueError unless cmd is a command object with well-typed arguments."""
+    if not isinstance(cmd, dict) or not isinstance(cmd.get("cmd"), str):
+        raise ValueError("expected an object with a \"cmd\" string")
+    page = cmd.get("page", "next")
+    if isinstance(page, bool) or not isinstance(page, (str, int)):
+        raise ValueError(f"bad page {page!r}")
+    if not isinstance(cmd.get("kind", ""), str):
+        raise ValueError(f"bad alert kind {cmd.get('kind')!r}")
+    duration = cmd.get("duration", 0.0)
+    if isinstance(duration, bool) or not isinstance(duration, (int, float)) or not 0 <= duration < math.inf:
+        raise ValueError(f"bad duration {duration!r}")
+
+class ControlServer:
+    """
+    Receives JSON commands ({"cmd": ..., ...}) on a unix datagram socket
+    and hands each to on_command from a reader thread that sleeps in
+    recv(), so an idle socket costs no wakeups. Clients: utils.oled_control.
+    """
+
+    def __init__(self, path: str, on_command: Callable[[Dict[str, Any]], None],
+                 logger: Optional[logging.Logger] = None, mode: int = 0o666):
+        self.path = path
+        self.on_command = on_command
+        self.log = logger or log
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        try:
+            os.unlink(path)     # left over from a previous run
+        except FileNotFoundError:
+            pass
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(path)
+        os.chmod(path, mode)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="oled-control", daemon=True)
+
+    def start(self) -> "ControlServer":
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._closed = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)   # wakes the reader
+        except OSError:
+            pass
+        self._sock.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            try:
+                data = self._sock.recv(4096)
+            except OSError:
+                return
+            if self._closed:
+                return
+            if not data:
+                continue
+            try:
+                cmd = json.loads(data.decode("utf-8"))
+                _check(cmd)
+            except ValueError as e:
+                self.log.debug("[ControlServer] Ignoring malformed command %r: %s", data[:80], e)
+                continue
+            try:
+                self.on_command(cmd)
+            except Exception as e:
+                self.log.error("[ControlServer] Command %r failed: %s", cmd, e, exc_info=True)
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 from dataclasses import dataclass
+import numpy as np
+from PIL import ImageDraw
+from oleds.displays.ui.framebuffer import PilFramebuffer
 
 @dataclass(frozen=True)
 class Capabilities:
@@ -9,30 +12,35 @@ class Capabilities:
     supports_charts: bool
     target_fps: int = 10
 
+def _framebuffer(target) -> PilFramebuffer:
+    return PilFramebuffer(None, target) if isinstance(target, ImageDraw.ImageDraw) else target
+
 class Charts:
+    """Chart primitives; `target` is a framebuffer (dm.fb) or a plain ImageDraw."""
+
     @staticmethod
-    def bar(draw, x, y, w, h, value01: float, fg, bg=None, border_fg=None):
+    def bar(target, x, y, w, h, value01: float, fg, bg=None, border_fg=None):
+        fb = _framebuffer(target)
         value01 = max(0.0, min(1.0, value01))
         if bg is not None:
-            draw.rectangle((x, y, x+w, y+h), fill=bg)
+            fb.fill_rect(x, y, x+w, y+h, bg)
         if border_fg is not None:
-            draw.rectangle((x, y, x+w, y+h), outline=border_fg, width=1)
+            fb.rect(x, y, x+w, y+h, border_fg)
         fill_w = max(0, int((w-2) * value01))
-        draw.rectangle((x+1, y+1, x+1+fill_w, y+h-1), fill=fg)
+        fb.fill_rect(x+1, y+1, x+1+fill_w, y+h-1, fg)
 
     @staticmethod
-    def sparkline(draw, x, y, w, h, values, fg):
+    def sparkline(target, x, y, w, h, values, fg):
         if not values:
             return
+        fb = _framebuffer(target)
         n = len(values)
         if n == 1:
-            draw.line((x, y+h//2, x+w, y+h//2), fill=fg)
+            fb.polyline(((x, y+h//2), (x+w, y+h//2)), fg)
             return
-        vmin = min(values); vmax = max(values); rng = (vmax - vmin) or 1.0
+        v = np.asarray(values, dtype=float)
+        vmin = v.min(); vmax = v.max(); rng = (vmax - vmin) or 1.0
         step = w / (n - 1)
-        pts = []
-        for i, v in enumerate(values):
-            px = x + int(i * step)
-            py = y + int(h - 1 - ((v - vmin) / rng) * (h - 1))
-            pts.append((px, py))
-        draw.line(pts, fill=fg, width=1)
+        px = x + np.trunc(np.arange(n) * step).astype(int)
+        py = y + np.trunc(h - 1 - ((v - vmin) / rng) * (h - 1)).astype(int)
+        fb.polyline(np.column_stack((px, py)), fg)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 class BaseDisplayDriver(ABC):
     @abstractmethod
@@ -17,4 +18,33 @@ class BaseDisplayDriver(ABC):
     @property
     @abstractmethod
     def height(self):
-        pass
\ No newline at end of file
+        pass
+
+@dataclass
+class TransferStats:
+    frames: int = 0
+    skipped: int = 0
+    bytes_sent: int = 0
+    last_frame_bytes: int = 0
+    full_frame_bytes: int = 0
+
+    def record(self, sent: int) -> None:
+        self.frames += 1
+        self.bytes_sent += sent
+        self.last_frame_bytes = sent
+        if sent == 0:
+            self.skipped += 1
+
+    @property
+    def bytes_per_frame(self) -> float:
+        return self.bytes_sent / self.frames if self.frames else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "bytes_sent": self.bytes_sent,
+            "last_frame_bytes": self.last_frame_bytes,
+            "bytes_per_frame": round(self.bytes_per_frame, 1),
+            "full_frame_bytes": self.full_frame_bytes,
+        }
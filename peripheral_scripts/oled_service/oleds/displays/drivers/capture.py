@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from collections import deque
+from typing import Deque, Optional
+
+import numpy as np
+from PIL import Image
+
+from .base import BaseDisplayDriver, TransferStats
+
+# bits per pixel on the wire, for the transfer stats of the emulated panel
+_BITS_PER_PIXEL = {"ssd1306": 1, "ssd1327": 4}
+
+class CaptureDriver(BaseDisplayDriver):
+    """
+    Headless panel: shown frames are kept in memory as images instead of
+    going to a bus, so the whole pipeline runs (and can be measured) on a
+    machine without a display. identifier names the panel it stands in
+    for, which is what the display manager picks its profile by. keep is
+    how many of the latest frames are retained.
+    """
+
+    def __init__(self, width: int = 128, height: int = 64, identifier: str = "ssd1306", keep: int = 1):
+        self._width = int(width)
+        self._height = int(height)
+        self.identifier = identifier
+        self.frames: Deque[Image.Image] = deque(maxlen=max(1, int(keep)))
+        self.frame_count = 0
+        bpp = _BITS_PER_PIXEL.get(identifier, 8)
+        self.stats = TransferStats(full_frame_bytes=self._width * self._height * bpp // 8)
+
+    @property
+    def last(self) -> Optional[Image.Image]:
+        return self.frames[-1] if self.frames else None
+
+    def clear(self):
+        self.frames.clear()
+
+    def show(self, image):
+        self.transmit(self.encode(image))
+
+    def show_array(self, pixels: np.ndarray):
+        self.transmit(self.encode(pixels))
+
+    def encode(self, frame) -> Image.Image:
+        """A copy of the frame (image or luminance array), detached from the caller's buffer."""
+        if isinstance(frame, np.ndarray):
+            return Image.fromarray(np.array(frame, dtype=np.uint8))
+        return frame.copy()
+
+    def transmit(self, image: Image.Image):
+        self.frames.append(image)
+        self.frame_count += 1
+        self.stats.record(self.stats.full_frame_bytes)
+
+    def transfer_stats(self) -> dict:
+        return self.stats.as_dict()
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
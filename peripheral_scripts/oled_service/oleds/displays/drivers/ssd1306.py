@@ -1,21 +1,78 @@
+import os
+
 import adafruit_ssd1306
 from board import SCL, SDA
 import busio
 
-from .base import BaseDisplayDriver
+from .base import BaseDisplayDriver, TransferStats
+from .ssd1306_framebuffer import WINDOW_OVERHEAD, dirty_windows, pack_pages, window_bytes
+
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+DATA_CONTROL = 0x40
 
 class SSD1306_Driver(BaseDisplayDriver):
-    def __init__(self, width=128, height=64):
+    def __init__(self, width=128, height=64, partial=None):
         i2c = busio.I2C(SCL, SDA)
         self.disp = adafruit_ssd1306.SSD1306_I2C(width, height, i2c)
 
+        if partial is None:
+            partial = os.getenv("OLED_PARTIAL_UPDATE", "1") not in ("0", "false", "False")
+        self.partial = partial                 # send only the changed page/column windows
+
+        self._pages = self.disp.height // 8
+        self._col_offset = {64: 32, 72: 28}.get(self.disp.width, 0)  # panels wired off-centre in GDDRAM
+        self._sent = None                       # transfer buffer as last transmitted
+        self.stats = TransferStats(full_frame_bytes=WINDOW_OVERHEAD + 1 + self._pages * self.disp.width)
+
     def clear(self):
         self.disp.fill(0)
         self.disp.show()
+        self._sent = bytes(self.disp.buffer)
+
+    def _load(self, image, buf):
+        if image.size != (self.disp.width, self.disp.height):
+            raise ValueError(f"image must be {self.disp.width}x{self.disp.height}, got {image.size[0]}x{image.size[1]}")
+        pack_pages(image, buf, offset=1)
 
     def show(self, image):
-        self.disp.image(image)
-        self.disp.show()
+        self._load(image, self.disp.buffer)
+        self.transmit(self.disp.buffer)
+
+    def encode(self, image) -> bytearray:
+        """Image -> transfer buffer for transmit(), laid out like disp.buffer."""
+        buf = bytearray(self.disp.buffer)
+        self._load(image, buf)
+        return buf
+
+    def transmit(self, buf):
+        if buf is not self.disp.buffer:
+            self.disp.buffer[:] = buf
+        if not self.partial:
+            self.disp.show()
+            self.stats.record(self.stats.full_frame_bytes)
+            return
+
+        buf = self.disp.buffer
+        sent = 0
+        for w in dirty_windows(self._sent, buf, self.disp.width, self._pages, offset=1):
+            sent += self._write_window(w, window_bytes(buf, w, self.disp.width, offset=1))
+        self._sent = bytes(buf)
+        self.stats.record(sent)
+
+    def _write_window(self, w, data: bytes) -> int:
+        for cmd in (SET_COL_ADDR, w.col0 + self._col_offset, w.col1 + self._col_offset,
+                    SET_PAGE_ADDR, w.page0, w.page1):
+            self.disp.write_cmd(cmd)
+        payload = bytearray(1 + len(data))
+        payload[0] = DATA_CONTROL
+        payload[1:] = data
+        with self.disp.i2c_device:
+            self.disp.i2c_device.write(payload)
+        return WINDOW_OVERHEAD + len(payload)
+
+    def transfer_stats(self) -> dict:
+        return self.stats.as_dict()
 
     @property
     def width(self) -> int:
@@ -23,4 +80,4 @@ class SSD1306_Driver(BaseDisplayDriver):
 
     @property
     def height(self) -> int:
-        return self.disp.height
\ No newline at end of file
+        return self.disp.height
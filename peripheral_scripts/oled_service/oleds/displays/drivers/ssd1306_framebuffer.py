@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Pure helpers for the SSD1306 page-ordered framebuffer: page p holds rows
+8p..8p+7, one byte per column, LSB at the top.
+"""
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional
+
+from PIL import Image
+
+# Each window costs six single-byte commands (column and page ranges), sent as
+# [control, cmd] pairs; used to decide when merging two windows pays off.
+WINDOW_OVERHEAD = 12
+
+class Window(NamedTuple):
+    page0: int
+    page1: int
+    col0: int
+    col1: int
+
+    @property
+    def size(self) -> int:
+        return (self.page1 - self.page0 + 1) * (self.col1 - self.col0 + 1)
+
+def _page_span(prev, cur, start: int, width: int):
+    end = start + width
+    if prev[start:end] == cur[start:end]:
+        return None
+    lo = 0
+    while prev[start + lo] == cur[start + lo]:
+        lo += 1
+    hi = width - 1
+    while prev[start + hi] == cur[start + hi]:
+        hi -= 1
+    return lo, hi
+
+def dirty_windows(prev: Optional[bytes], cur: bytes, width: int, pages: int, offset: int = 0) -> List[Window]:
+    """
+    Windows covering every byte of `cur` that differs from `prev` (the
+    whole frame when prev is None). Page buffers start at `offset` in both.
+    Vertically adjacent dirty pages are merged when one window over both is
+    cheaper to send than two.
+    """
+    if prev is None:
+        return [Window(0, pages - 1, 0, width - 1)]
+
+    windows: List[Window] = []
+    for page in range(pages):
+        span = _page_span(prev, cur, offset + page * width, width)
+        if span is None:
+            continue
+        w = Window(page, page, span[0], span[1])
+        if windows and windows[-1].page1 == page - 1:
+            last = windows[-1]
+            merged = Window(last.page0, page, min(last.col0, w.col0), max(last.col1, w.col1))
+            if merged.size <= last.size + w.size + WINDOW_OVERHEAD:
+                windows[-1] = merged
+                continue
+        windows.append(w)
+    return windows
+
+def window_bytes(buf, window: Window, width: int, offset: int = 0) -> bytes:
+    """Window data in the order the controller consumes it (horizontal addressing)."""
+    if window.col0 == 0 and window.col1 == width - 1:
+        return bytes(buf[offset + window.page0 * width:offset + (window.page1 + 1) * width])
+    out = bytearray()
+    for page in range(window.page0, window.page1 + 1):
+        start = offset + page * width
+        out += buf[start + window.col0:start + window.col1 + 1]
+    return bytes(out)
+
+def pack_pages(image, out, offset: int = 0) -> None:
+    """
+    Packs a mode "1" image into page order, writing straight into `out` at
+    `offset`. Rotating 90° clockwise turns each panel column into an image
+    row, and PIL's 1-bit packing (MSB = leftmost) then yields page bytes
+    with the top row in the LSB; only the page order needs reversing.
+    """
+    if image.mode != "1":
+        image = image.convert("1")
+    width, height = image.size
+    pages = height // 8
+    data = image.transpose(Image.Transpose.ROTATE_270).tobytes()
+    for page in range(pages):
+        start = offset + page * width
+        out[start:start + width] = data[pages - 1 - page::pages]
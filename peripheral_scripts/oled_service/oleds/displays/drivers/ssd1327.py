@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 import os
+
+import numpy as np
 from PIL import Image
 from luma.core.interface.serial import spi
 from luma.oled.device import ssd1327
 
-from .base import BaseDisplayDriver 
+from .base import BaseDisplayDriver, TransferStats
+from .ssd1327_framebuffer import bayer_thresholds, dirty_window, pack_nibbles, quantize
+
+SET_COL_ADDR = 0x15
+SET_ROW_ADDR = 0x75
+WINDOW_OVERHEAD = 6
+
+_ROTATIONS = {
+    1: Image.Transpose.ROTATE_270,   # luma's rotate=N turns the image N*90° clockwise
+    2: Image.Transpose.ROTATE_180,
+    3: Image.Transpose.ROTATE_90,
+}
+# the same turns as np.rot90 counts (counter-clockwise quarter turns)
+_ROT90 = {Image.Transpose.ROTATE_270: 3, Image.Transpose.ROTATE_180: 2, Image.Transpose.ROTATE_90: 1}
 
 class SSD1327_Driver(BaseDisplayDriver):
+    """
+    luma sets the panel up; frames bypass luma.display(): the driver
+    quantizes "L" frames to 16 levels (ordered dithering), packs two pixels
+    per byte and streams only the window that changed since the last frame.
+    """
+
     def __init__(self):
         port = int(os.getenv("OLED_SPI_PORT", "0"))          # 0
         device = int(os.getenv("OLED_SPI_DEVICE", "0"))      # CE0 = 0, CE1 = 1
@@ -18,31 +39,64 @@ class SSD1327_Driver(BaseDisplayDriver):
         height = int(os.getenv("OLED_HEIGHT", "128"))
         rotate = int(os.getenv("OLED_ROTATE", "0"))          # 0/1/2/3
 
-        self.image_mode = os.getenv("OLED_IMAGE_MODE", "RGB")
+        self.image_mode = os.getenv("OLED_IMAGE_MODE", "L")
+        dither = os.getenv("OLED_DITHER", "1") not in ("0", "false", "False")
 
         serial = spi(port=port, device=device, gpio_DC=dc, gpio_RST=rst, bus_speed_hz=speed)
-        self._dev = ssd1327(serial_interface=serial, width=width, height=height, rotate=rotate)
+        self._dev = ssd1327(serial_interface=serial, width=width, height=height)
 
         self._width = width
         self._height = height
+        self._rotation = _ROTATIONS.get(rotate % 4)
+        self._thresholds = bayer_thresholds(width, height) if dither else None
+        self._sent = None    # packed frame as last transmitted, (height, width/2)
+        self.stats = TransferStats(full_frame_bytes=WINDOW_OVERHEAD + height * width // 2)
 
         self.clear()
 
     def clear(self):
-        if self.image_mode == "RGB":
-            img = Image.new("RGB", (self._width, self._height), "black")
-        else:
-            img = Image.new("1", (self._width, self._height))
-        self._dev.display(img)
+        self._sent = None
+        self._push(np.zeros((self._height, self._width // 2), dtype=np.uint8))
+
+    def _pack(self, image) -> np.ndarray:
+        img = image if image.mode == "L" else image.convert("L")
+        if self._rotation is not None:
+            img = img.transpose(self._rotation)
+        pixels = np.asarray(img, dtype=np.uint8)
+        return pack_nibbles(quantize(pixels, self._thresholds))
+
+    def _pack_array(self, pixels: np.ndarray) -> np.ndarray:
+        if self._rotation is not None:
+            pixels = np.rot90(pixels, _ROT90[self._rotation])    # a view, no copy
+        return pack_nibbles(quantize(pixels, self._thresholds))
+
+    def _push(self, packed: np.ndarray):
+        w = dirty_window(self._sent, packed)
+        if w is None:
+            self.stats.record(0)
+            return
+        self._dev.command(SET_COL_ADDR, w.col0, w.col1, SET_ROW_ADDR, w.row0, w.row1)
+        data = packed[w.row0:w.row1 + 1, w.col0:w.col1 + 1].tobytes()
+        self._dev.data(list(data))
+        self._sent = packed
+        self.stats.record(WINDOW_OVERHEAD + len(data))
 
     def show(self, image):
-        img = image
-        if img.mode not in ("1", "RGB"):
-            img = img.convert(self.image_mode)
-        elif self.image_mode != img.mode:
-            img = img.convert(self.image_mode)
+        self._push(self._pack(image))
+
+    def show_array(self, pixels: np.ndarray):
+        """Frame as an (height, width) uint8 luminance array, e.g. a numpy framebuffer's."""
+        self._push(self._pack_array(pixels))
+
+    def encode(self, frame) -> np.ndarray:
+        """Image or luminance array -> packed frame for transmit(); independent of the source buffer."""
+        return self._pack_array(frame) if isinstance(frame, np.ndarray) else self._pack(frame)
+
+    def transmit(self, packed: np.ndarray):
+        self._push(packed)
 
-        self._dev.display(img)
+    def transfer_stats(self) -> dict:
+        return self.stats.as_dict()
 
     @property
     def width(self) -> int:
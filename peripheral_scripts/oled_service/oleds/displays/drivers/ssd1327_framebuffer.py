@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Helpers for the SSD1327 GDDRAM layout: 4 bits per pixel, two horizontally
+adjacent pixels per byte with the left pixel in the low nibble (what luma's
+ssd1327 sends with its segment remap 0x53).
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+LEVELS = 16
+
+_BAYER4 = np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+], dtype=np.uint16)
+
+class Window(NamedTuple):
+    row0: int
+    row1: int
+    col0: int    # in bytes, i.e. pairs of pixels
+    col1: int
+
+def bayer_thresholds(width: int, height: int) -> np.ndarray:
+    """Per-pixel dither offsets in 1/16 steps of one grey level, tiled to the frame."""
+    reps = (-(-height // 4), -(-width // 4))
+    return np.tile(_BAYER4, reps)[:height, :width]
+
+def quantize(pixels: np.ndarray, thresholds: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    8-bit luminance -> 4-bit levels. With thresholds this is ordered
+    dithering; pure black and white stay exact either way, so text and
+    icons are unaffected.
+    """
+    scaled = pixels.astype(np.uint16) * (LEVELS - 1)
+    if thresholds is None:
+        scaled += 127
+        return (scaled // 255).astype(np.uint8)
+    # floor(v * 15 / 255 + (t + 0.5) / 16), kept in integers
+    levels = (scaled * 16 + thresholds * 255 + 127) // (255 * 16)
+    return np.minimum(levels, LEVELS - 1).astype(np.uint8)
+
+def pack_nibbles(levels: np.ndarray) -> np.ndarray:
+    """(h, w) 4-bit levels -> (h, w/2) bytes, left pixel in the low nibble."""
+    return levels[:, 0::2] | (levels[:, 1::2] << 4)
+
+def dirty_window(prev: Optional[np.ndarray], cur: np.ndarray) -> Optional[Window]:
+    """Smallest window covering every changed byte, or None when nothing changed."""
+    if prev is None:
+        return Window(0, cur.shape[0] - 1, 0, cur.shape[1] - 1)
+    diff = prev != cur
+    rows = np.flatnonzero(diff.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return Window(int(rows[0]), int(rows[-1]), int(cols[0]), int(cols[-1]))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Optional
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+class FrameTransfer:
+    """
+    Streams frames to a driver on a worker thread, so the next frame can be
+    drawn while the last one is still on the bus. Frames are submitted with
+    the framebuffer slot they live in; the worker encodes the newest one
+    (driver.encode: dither/pack into the wire format), releases its slot
+    and only then transmits (driver.transmit). A frame submitted while an
+    older one is still waiting replaces it: intermediate frames are dropped,
+    never queued. Drivers without encode/transmit get a copy of the frame
+    through show()/show_array().
+    """
+
+    def __init__(self, driver, logger: Optional[logging.Logger] = None):
+        self.driver = driver
+        self.log = logger or log
+        self._cond = threading.Condition()
+        self._pending: Optional[tuple] = None   # (slot, frame) waiting for the worker
+        self._reading: Optional[int] = None     # slot the worker is encoding from
+        self._in_flight = False                 # a frame is between pickup and end of transmit
+        self._stop = False
+        self.submitted = 0
+        self.dropped = 0
+        self.sent = 0
+        self.errors = 0
+        self._thread = threading.Thread(target=self._run, name="oled-transfer", daemon=True)
+        self._thread.start()
+
+    def submit(self, slot: int, frame: Any) -> None:
+        """Hands over a completed frame; returns at once."""
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = (slot, frame)
+            self.submitted += 1
+            self._cond.notify_all()
+
+    def wait_released(self, slot: int) -> None:
+        """Blocks while the worker still reads slot (an encode, not the bus write)."""
+        with self._cond:
+            if self._pending is not None and self._pending[0] == slot:
+                self._pending = None    # superseded by a newer frame in another slot
+                self.dropped += 1
+            self._cond.wait_for(lambda: self._reading != slot)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every submitted frame is sent (or dropped); False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending is None and not self._in_flight, timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        self.flush(timeout)
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {"submitted": self.submitted, "dropped": self.dropped, "sent": self.sent, "errors": self.errors}
+
+    def _encode(self, frame):
+        encode = getattr(self.driver, "encode", None)
+        return encode(frame) if encode is not None else frame.copy()
+
+    def _transmit(self, data) -> None:
+        transmit = getattr(self.driver, "transmit", None)
+        if transmit is not None:
+            transmit(data)
+        elif isinstance(data, np.ndarray):
+            self.driver.show_array(data)
+        else:
+            self.driver.show(data)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or self._stop)
+                if self._pending is None:
+                    return
+                (slot, frame), self._pending = self._pending, None
+                self._reading, self._in_flight = slot, True
+            try:
+                try:
+                    data = self._encode(frame)
+                finally:
+                    with self._cond:
+                        self._reading = None
+                        self._cond.notify_all()
+                self._transmit(data)
+                self.sent += 1
+            except Exception as e:
+                self.errors += 1
+                self.log.error("[FrameTransfer] Frame transfer failed: %s", e, exc_info=True)
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._cond.notify_all()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from oleds.displays.ui.framebuffer import Raster
+
+def freeze(value: Any) -> Hashable:
+    """Hashable stand-in for a stats value (dicts and lists included)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+class FrameMemo:
+    """
+    Last rendered frame of every MEMOIZE page, keyed on what it was drawn
+    from: the page's STATS_KEYS values plus the status bar's inputs (its
+    keys, and memo_key(): clock text, UPS charge). When a page comes up
+    with the same inputs, the stored frame is copied back instead of
+    drawing it again. Frames are kept as pixel arrays when the framebuffer
+    has them, so a restore is an array copy.
+    """
+
+    def __init__(self):
+        self._frames: Dict[int, Tuple[Hashable, Raster]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, page, dm, stats) -> Optional[Hashable]:
+        """None when the page cannot be memoized."""
+        keys = getattr(page, "STATS_KEYS", None)
+        if not getattr(page, "MEMOIZE", False) or keys is None:
+            return None
+        bar = getattr(dm, "statusbar", None)
+        bar_keys = getattr(bar, "STATS_KEYS", None) or ()
+        bar_state = bar.memo_key() if bar is not None else None
+        names = sorted(set(keys) | set(bar_keys))
+        return tuple((k, freeze(stats.get(k))) for k in names), bar_state
+
+    def restore(self, page, key: Hashable, dm) -> bool:
+        entry = self._frames.get(id(page))
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return False
+        dm.fb.blit(entry[1], (0, 0))
+        self.hits += 1
+        return True
+
+    def store(self, page, key: Hashable, dm) -> None:
+        pixels = dm.fb.pixels
+        self._frames[id(page)] = (key, pixels.copy() if pixels is not None else dm.image.copy())
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0}
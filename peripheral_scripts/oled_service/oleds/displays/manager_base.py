@@ -1,14 +1,45 @@
 from __future__ import annotations
-from typing import Dict
-from PIL import Image, ImageDraw, ImageFont
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+import numpy as np
+from PIL import Image, ImageFont
+from oleds.configs.configs import ASYNC_TRANSFER, FRAMEBUFFER_BACKEND, TEXT_BACKEND
 from oleds.configs.oled_profiles import OledProfile
 from oleds.configs.themes import Theme, IconProvider
+from oleds.displays.drivers.transfer import FrameTransfer
+from oleds.displays.ui.framebuffer import Raster, make_framebuffer
+from oleds.displays.ui.glyph_text import GlyphTextRenderer
+from oleds.displays.ui.metrics import METRICS, fontmode
 
 WHITE_1BIT = 255
 WHITE_RGB = (255, 255, 255)
 
+LAYER_CACHE_SIZE = 128
+
+def _raw_bytes(image: Image.Image) -> bytes:
+    """
+    image.tobytes(), encoded through a frame-sized buffer: tobytes() hands
+    the encoder a 64 KiB chunk, far more than a 1 KiB "1" frame needs.
+    """
+    w, h = image.size
+    bits = 1 if image.mode == "1" else 8 * len(image.getbands())
+    enc = Image._getencoder(image.mode, "raw", image.mode)
+    enc.setimage(image.im, (0, 0, w, h))
+    bufsize = max(w * 4, (w * bits + 7) // 8 * h)   # the raw encoder needs room for a row
+    out = []
+    while True:
+        _, err, data = enc.encode(bufsize)
+        out.append(data)
+        if err:
+            break
+    if err < 0:
+        raise RuntimeError(f"encoder error {err} hashing the frame")
+    return b"".join(out)
+
 class BaseDisplayManager:
-    def __init__(self, driver, profile: OledProfile, theme: Theme):
+    def __init__(self, driver, profile: OledProfile, theme: Theme, framebuffer: str | None = None,
+                 async_transfer: bool | None = None):
         self.driver = driver
         self.profile = profile
         self.theme = theme
@@ -18,19 +49,37 @@ class BaseDisplayManager:
 
         image_mode = getattr(self.profile, "image_mode", None) or getattr(self.theme, "image_mode", "1")
 
-        self.image = Image.new(image_mode, (self.width, self.height))
-        self.draw = ImageDraw.Draw(self.image)
+        # "numpy" keeps "L" frames in an array the image shares; other modes stay on ImageDraw.
+        # With async transfer there are two: one is drawn into while the other is sent.
+        backend = framebuffer or FRAMEBUFFER_BACKEND
+        use_async = ASYNC_TRANSFER if async_transfer is None else async_transfer
+        self._fbs = [make_framebuffer(backend, image_mode, (self.width, self.height))
+                     for _ in range(2 if use_async else 1)]
+        self.transfer = FrameTransfer(driver) if use_async else None
+        self._use(0)
+        self._shown_digest: bytes | None = None   # of the last frame handed to the driver
+        self.frames_shown = 0
+        self.frames_unchanged = 0
 
         self.font_small = self.theme.load_font(self.theme.font_small)
         self.font       = self.theme.load_font(self.theme.font_regular)
         self.font_large = self.theme.load_font(self.theme.font_large)
 
+        # glyph atlases for the three fonts are rasterized once, here
+        self.text_renderer = GlyphTextRenderer() if TEXT_BACKEND == "glyph" else None
+        if self.text_renderer:
+            self.text_renderer.warm((self.font_small, self.font, self.font_large), fontmode(self.draw))
+
         self._icon_provider = IconProvider(image_mode, self.theme.statusbar_icon, self.theme.icon_pack)
         self.icons: Dict[str, Image.Image] = {}
 
         self._last_stats: Dict = {}
         self.statusbar = None
 
+        self._layers: OrderedDict[Hashable, Raster] = OrderedDict()
+        self.layer_hits = 0
+        self.layer_misses = 0
+
         status_h = self.profile.statusbar_icon + (2 if self.profile.statusbar_icon <= 8 else 6)
         self.statusbar_height = status_h
         self.content_pad = 4
@@ -52,22 +101,115 @@ class BaseDisplayManager:
         self.clear()
 
     def clear(self):
-        self.draw.rectangle((0, 0, self.width, self.height), fill=self._background_color())
+        self.fb.clear(self._background_color())
+
+    def _use(self, slot: int):
+        self._slot = slot
+        self.fb = self._fbs[slot]
+        self.image = self.fb.image
+        self.draw = self.fb.draw
+
+    def _frame_digest(self) -> bytes:
+        data = self.fb.pixels if self.fb.pixels is not None else _raw_bytes(self.image)
+        return hashlib.blake2b(data, digest_size=16).digest()
 
     def show(self):
-        self.driver.show(self.image)
+        # a frame identical to the last one shown never reaches the bus
+        digest = self._frame_digest()
+        if digest == self._shown_digest:
+            self.frames_unchanged += 1
+            return
+        self._shown_digest = digest
+        self.frames_shown += 1
+
+        show_array = getattr(self.driver, "show_array", None)
+        use_array = self.fb.pixels is not None and show_array is not None
+        if self.transfer is None:
+            if use_array:
+                show_array(self.fb.pixels)    # the driver reads the shared array, no image copy
+            else:
+                self.driver.show(self.image)
+            return
+
+        # hand the frame to the transfer worker and carry on in the other buffer; it
+        # starts as a copy of this frame, so drawing on top of it works as before
+        self.transfer.submit(self._slot, self.fb.pixels if use_array else self.image)
+        back = 1 - self._slot
+        self.transfer.wait_released(back)
+        self._fbs[back].copy_from(self.fb)
+        self._use(back)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until the frames shown so far have reached the driver."""
+        return self.transfer.flush(timeout) if self.transfer is not None else True
+
+    def close(self):
+        if self.transfer is not None:
+            self.transfer.close()
+
+    def transfer_stats(self) -> Dict:
+        stats = self.driver.transfer_stats() if hasattr(self.driver, "transfer_stats") else {}
+        stats = {**stats, "shown": self.frames_shown, "unchanged": self.frames_unchanged}
+        if self.transfer is not None:
+            stats = {**stats, **{f"async_{k}": v for k, v in self.transfer.stats().items()}}
+        return stats
+
+    def layer(self, key: Hashable, size: Tuple[int, int], render: Callable[[Image.Image], None]) -> Raster:
+        """
+        Raster produced by render(img), which draws in layer-local coordinates
+        on an image filled with the background colour. Built once per key and
+        kept in a small LRU; the key must capture everything render() reads.
+        Kept as a (h, w) array when the framebuffer has pixels, so compositing
+        it is array work only.
+        """
+        key = (key, size)
+        img = self._layers.get(key)
+        if img is not None:
+            self._layers.move_to_end(key)
+            self.layer_hits += 1
+            return img
+
+        self.layer_misses += 1
+        img = Image.new(self.image.mode, (max(1, size[0]), max(1, size[1])), self._background_color())
+        render(img)
+        if self.fb.pixels is not None:
+            img = np.array(img)
+        self._layers[key] = img
+        if len(self._layers) > LAYER_CACHE_SIZE:
+            self._layers.popitem(last=False)
+        return img
+
+    def blit_layer(self, key: Hashable, xy: Tuple[int, int], size: Tuple[int, int],
+                   render: Callable[[Image.Image], None]) -> None:
+        """
+        Composites a cached layer at xy. Layers are merged with "lighter", which
+        on the dark background gives the same pixels as drawing in place and
+        keeps whatever is already under the layer's empty areas.
+        """
+        img = self.layer(key, size, render)
+        is_array = isinstance(img, np.ndarray)
+        w, h = (img.shape[1], img.shape[0]) if is_array else img.size
+        x, y = int(xy[0]), int(xy[1])
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return
+        if (x0, y0, x1, y1) != (x, y, x + w, y + h):
+            if is_array:
+                img = img[y0 - y:y1 - y, x0 - x:x1 - x]
+            else:
+                img = img.crop((x0 - x, y0 - y, x1 - x, y1 - y))
+        self.fb.lighten(img, (x0, y0, x1, y1))
+
+    def layer_stats(self) -> Dict[str, int]:
+        return {"layers": len(self._layers), "hits": self.layer_hits, "misses": self.layer_misses}
 
     def draw_status_bar(self, statuses: Dict):
         if self.statusbar:
             self.statusbar.draw(self, statuses)
 
     def line_height(self, font: ImageFont.ImageFont, extra: int = 2) -> int:
-        try:
-            bbox = font.getbbox("Ag")
-            h = bbox[3] - bbox[1]
-        except Exception:
-            h = getattr(font, "size", 12)
-        return int(h + extra)
+        return METRICS.line_height(font, extra)
 
     def _clamp_rect(self, x0, y0, x1, y1):
         X0 = max(0, min(self.width - 1, int(x0)))
@@ -83,24 +225,25 @@ class BaseDisplayManager:
         if not r:
             return
         if fill is not None:
-            self.draw.rectangle(r, fill=fill)
+            self.fb.fill_rect(*r, fill)
         if outline is not None:
-            self.draw.rectangle(r, outline=outline, width=width)
+            self.fb.rect(*r, outline, width=width)
 
     def text_ellipsis(self, text: str, max_w: int, font) -> str:
-        if self.draw.textlength(text, font=font) <= max_w:
-            return text
-        ell = "…"; ell_w = self.draw.textlength(ell, font=font)
-        if ell_w > max_w:
-            return ""
-        lo, hi = 0, len(text)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if self.draw.textlength(text[:mid], font=font) + ell_w <= max_w:
-                lo = mid + 1
-            else:
-                hi = mid
-        return text[:max(0, lo-1)] + ell
+        return METRICS.ellipsis(font, text, max_w, fontmode(self.draw))
+
+    def text(self, xy, text: str, *, font=None, fill=None):
+        """draw.text() through the configured text backend."""
+        font = font or self.font
+        fill = fill if fill is not None else self.color()
+        if self.text_renderer:
+            self.text_renderer.text(self.draw, xy, text, font=font, fill=fill)
+        else:
+            self.draw.text(xy, text, font=font, fill=fill)
+
+    def text_width(self, text: str, font=None) -> float:
+        """Cached equivalent of self.draw.textlength(text, font)."""
+        return METRICS.text_width(font or self.font, text, fontmode(self.draw))
 
     def draw_text_row(self, row_idx: int, text: str, *, font=None, fill=None, pad_left: int = 0) -> int:
         font = font or self.font
@@ -111,7 +254,7 @@ class BaseDisplayManager:
             return y
         max_w = max(0, self.content_width - pad_left)
         txt = self.text_ellipsis(text, max_w, font)
-        self.draw.text((self.content_left + pad_left, y), txt, font=font, fill=fill)
+        self.text((self.content_left + pad_left, y), txt, font=font, fill=fill)
         return y + lh
 
     def _get_icon(self, name: str):
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 import os
-from typing import List
+from typing import List, Optional
 
 def _profile_from_env_or_name(driver) -> str:
     p = os.getenv("OLED_PROFILE")
@@ -14,28 +14,38 @@ def _weather_enabled() -> bool:
     isWeatherEnabled = os.getenv("OLED_ENABLE_WEATHER", "1").strip().lower()
     return isWeatherEnabled not in ("0", "false", "off", "no")
 
+# OLED_PAGES / control-socket page tokens -> class-name fragments that identify the page
+_PAGE_TOKENS = {
+    "perf":    ("performance",),
+    "storage": ("storage",),
+    "network": ("network",),
+    "docker":  ("docker",),
+    "health":  ("health",),
+    "weather": ("weather",),
+    "system":  ("system",),
+    "iofocus": ("diskio", "io"),
+}
+
+def find_page(pages: List[object], token: str) -> Optional[int]:
+    """Index of the first page the token names, or None."""
+    fragments = _PAGE_TOKENS.get(token.strip().lower(), ())
+    for i, p in enumerate(pages):
+        name = p.__class__.__name__.lower()
+        if any(f in name for f in fragments):
+            return i
+    return None
+
 def _reorder(pages: List[object]) -> List[object]:
     order = os.getenv("OLED_PAGES")
     if not order:
         return pages
 
-    key_to_page = {
-        "perf":      next((p for p in pages if "performance" in p.__class__.__name__.lower()), None),
-        "storage":   next((p for p in pages if "storage" in p.__class__.__name__.lower()), None),
-        "network":   next((p for p in pages if "network" in p.__class__.__name__.lower()), None),
-        "docker":    next((p for p in pages if "docker" in p.__class__.__name__.lower()), None),
-        "health":    next((p for p in pages if "health" in p.__class__.__name__.lower()), None),
-        "weather":   next((p for p in pages if "weather" in p.__class__.__name__.lower()), None),
-        "system":    next((p for p in pages if "system" in p.__class__.__name__.lower()), None),
-        "iofocus":   next((p for p in pages if "diskio" in p.__class__.__name__.lower() or "io" in p.__class__.__name__.lower()), None),
-    }
-
     result = []
 
-    for token in [t.strip().lower() for t in order.split(",")]:
-        pg = key_to_page.get(token)
-        if pg is not None:
-            result.append(pg)
+    for token in order.split(","):
+        idx = find_page(pages, token)
+        if idx is not None:
+            result.append(pages[idx])
 
     return result or pages
 
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+from typing import Any, Dict, Optional
+
+from .base import BaseScreen
+
+class AlertScreen(BaseScreen):
+    """
+    Full-screen notice raised through the control socket (UPS events);
+    the controller shows it in place of the page rotation until it expires.
+    Works on both profiles: plain text through the display manager.
+    """
+    HANDLES_BACKGROUND = True
+    STATS_KEYS = ()
+
+    MESSAGES = {
+        "ac_lost":     ("AC POWER LOST", "Running on battery"),
+        "ac_restored": ("AC RESTORED", "Charging"),
+        "low_battery": ("LOW BATTERY", "Connect power"),
+    }
+
+    def __init__(self):
+        self.kind: Optional[str] = None
+        self.details: Dict[str, Any] = {}
+
+    def set_alert(self, kind: str, details: Optional[Dict[str, Any]] = None):
+        self.kind = kind
+        self.details = dict(details or {})
+
+    def lines(self):
+        title, hint = self.MESSAGES.get(self.kind, (str(self.kind or "").upper().replace("_", " "), ""))
+        soc = self.details.get("soc")
+        extra = f"Battery {float(soc):.0f}%" if isinstance(soc, (int, float)) else ""
+        return title, hint, extra
+
+    def draw(self, dm, stats):
+        dm.clear()
+        fg = dm.color()
+        dm.rect_safe((0, 0, dm.width - 1, dm.height - 1), outline=fg)
+
+        title, hint, extra = self.lines()
+        rows = [(title, dm.font_large if dm.text_width(title, dm.font_large) <= dm.width - 8 else dm.font)]
+        rows += [(s, dm.font_small) for s in (hint, extra) if s]
+
+        heights = [dm.line_height(font) for _, font in rows]
+        y = max(2, (dm.height - sum(heights)) // 2)
+        for (text, font), lh in zip(rows, heights):
+            text = dm.text_ellipsis(text, dm.width - 8, font)
+            x = max(4, int((dm.width - dm.text_width(text, font)) // 2))
+            dm.text((x, y), text, font=font, fill=fg)
+            y += lh
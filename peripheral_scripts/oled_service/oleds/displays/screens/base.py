@@ -1,6 +1,25 @@
 from abc import ABC, abstractmethod
 
 class BaseScreen(ABC):
+    # Stats keys read by draw(); None means the page needs everything.
+    STATS_KEYS = None
+    # Redrawn every frame while on screen, not just on new stats.
+    ANIMATED = False
+    # draw() depends on STATS_KEYS (and the status bar) only: a frame drawn
+    # from the same inputs can be reused.
+    MEMOIZE = False
+
+    def sample(self, stats):
+        """Folds a new stats snapshot into page state (trends, histories)."""
+
+    def observe(self, stats):
+        """
+        Runs sample() once per snapshot: pages are redrawn every frame from
+        the same snapshot object, so only a new one is a new sample.
+        """
+        if stats is not getattr(self, "_observed", None):
+            self._observed = stats
+            self.sample(stats)
 
     @abstractmethod
     def draw(self, display_manager, stats):
@@ -3,6 +3,8 @@
 from ..base import BaseScreen
 
 class HealthScreen(BaseScreen):
+    STATS_KEYS = ("core_voltage", "throttling", "uptime", "nvme_temp", "network_throughput")
+    MEMOIZE = True
 
     def draw(self, display_manager, stats):
         core_v = stats.get('core_voltage', 0.0)
@@ -11,14 +13,16 @@ class HealthScreen(BaseScreen):
         nvme_t = stats.get('nvme_temp', 0)
         throughput = stats.get('network_throughput', {'download': '0K/s', 'upload': '0K/s'})
 
-        display_manager.draw.text((2, 12), f"Core:{core_v:.2f}V / NVMe:{nvme_t:.0f}C", font=display_manager.font, fill=255)
-        display_manager.draw.text((2, 24), f"Throttled: {throttling}", font=display_manager.font, fill=255)
-        display_manager.draw.text((2, 36), f"Uptime: {uptime}", font=display_manager.font, fill=255)
+        display_manager.text((2, 12), f"Core:{core_v:.2f}V / NVMe:{nvme_t:.0f}C", font=display_manager.font, fill=255)
+        display_manager.text((2, 24), f"Throttled: {throttling}", font=display_manager.font, fill=255)
+        display_manager.text((2, 36), f"Uptime: {uptime}", font=display_manager.font, fill=255)
         
         net_down = throughput['download']
         net_up = throughput['upload']
         
-        display_manager.image.paste(display_manager.icons["ARROW_DOWN"], (2, 49))
-        display_manager.draw.text((14, 48), f"{net_down:<6}", font=display_manager.font, fill=255)
-        display_manager.image.paste(display_manager.icons["ARROW_UP"], (68, 49))
-        display_manager.draw.text((80, 48), f"{net_up:<6}", font=display_manager.font, fill=255)
\ No newline at end of file
+        for name, xy in (("ARROW_DOWN", (2, 49)), ("ARROW_UP", (68, 49))):
+            icon = display_manager._get_icon(name)
+            if icon:
+                display_manager.image.paste(icon, xy)
+        display_manager.text((14, 48), f"{net_down:<6}", font=display_manager.font, fill=255)
+        display_manager.text((80, 48), f"{net_up:<6}", font=display_manager.font, fill=255)
\ No newline at end of file
@@ -3,6 +3,8 @@
 from ..base import BaseScreen
 
 class StorageScreen(BaseScreen):
+    STATS_KEYS = ("root_disk_usage", "storage_disk_usage", "disk_io", "docker_status", "docker_restarts")
+    MEMOIZE = True
 
     def draw(self, display_manager, stats):
         root_usage = stats.get('root_disk_usage', {})
@@ -21,7 +23,7 @@ class StorageScreen(BaseScreen):
         nvme_used = format_storage(nvme_usage.get('used', 0))
         nvme_total = format_storage(nvme_usage.get('total', 0))
 
-        display_manager.draw.text((2, 12), f"SSD: {ssd_used}/{ssd_total} {root_usage.get('percent',0):.0f}%", font=display_manager.font, fill=255)
-        display_manager.draw.text((2, 24), f"NVMe:{nvme_used}/{nvme_total} {nvme_usage.get('percent',0):.0f}%", font=display_manager.font, fill=255)
-        display_manager.draw.text((2, 36), f"Disk IO: R:{disk_io['read']} W:{disk_io['write']}", font=display_manager.font, fill=255)
-        display_manager.draw.text((2, 48), f"Docker: {docker_status} (R:{docker_restarts})", font=display_manager.font, fill=255)
\ No newline at end of file
+        display_manager.text((2, 12), f"SSD: {ssd_used}/{ssd_total} {root_usage.get('percent',0):.0f}%", font=display_manager.font, fill=255)
+        display_manager.text((2, 24), f"NVMe:{nvme_used}/{nvme_total} {nvme_usage.get('percent',0):.0f}%", font=display_manager.font, fill=255)
+        display_manager.text((2, 36), f"Disk IO: R:{disk_io['read']} W:{disk_io['write']}", font=display_manager.font, fill=255)
+        display_manager.text((2, 48), f"Docker: {docker_status} (R:{docker_restarts})", font=display_manager.font, fill=255)
\ No newline at end of file
@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 import os
+from oleds.configs.configs import TREND_WINDOW
 from ..base import BaseScreen
 from ...ui.canvas import Canvas
 from ...ui import grid as G
 from ...ui import format as F
+from ...ui.rollup import HISTORY
 from ...ui.trend import Trend
 
 class DiskIOScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("disk_io",)
 
     def __init__(self):
         alpha = float(os.getenv("OLED_IO_EMA_ALPHA", "0.3"))
         decay = float(os.getenv("OLED_IO_TREND_DECAY", "0.90"))
         self.trend = Trend(n_series=2, history=120, alpha=alpha, decay=decay)
+        self._norm = [[], []]
+
+    def sample(self, stats):
+        dio = stats.get("disk_io") or {}
+        self._norm = self.trend.update([F.parse_rate_bps(dio.get("read")), F.parse_rate_bps(dio.get("write"))])
+
+    def backfill(self, store):
+        self.trend.backfill(store.recent(self.trend.history, ("disk_read", "disk_write")))
 
     def _grey(self, dm, level=160):
         mode = getattr(dm.image, "mode", "L") if getattr(dm, "image", None) is not None else "L"
@@ -22,6 +33,7 @@ class DiskIOScreen1327(BaseScreen):
         return (level, level, level)
 
     def draw(self, dm, stats):
+        self.observe(stats)
         c = dm.color()
         dm.clear(); dm.draw_status_bar(stats)
         cv = Canvas.from_display(dm)
@@ -31,7 +43,7 @@ class DiskIOScreen1327(BaseScreen):
         w_bps = F.parse_rate_bps(dio.get("write"))
 
         row = 0
-        row = G.text_row(cv, dm, row, "Disk I/O", font=dm.font, fill=c)
+        row = G.text_row(cv, dm, row, "Disk I/O", font=dm.font, fill=c, static=True)
         line = G.fit_text(cv, dm.font, [
             f"R {F.fmt_bps(r_bps)}   W {F.fmt_bps(w_bps)}",
             f"R {F.fmt_bps(r_bps)} W {F.fmt_bps(w_bps)}",
@@ -39,13 +51,13 @@ class DiskIOScreen1327(BaseScreen):
         ])
         row = G.text_row(cv, dm, row, line, font=dm.font_small, fill=c)
 
-        r_norm, w_norm = self.trend.update([r_bps, w_bps])
+        r_norm, w_norm = self._norm
+        if TREND_WINDOW in HISTORY.disk_io.windows:
+            r_norm, w_norm = HISTORY.disk_io.normalized(TREND_WINDOW)
         row = G.spark_area(
             cv, dm, row,
             series_list=[r_norm, w_norm],
             colors=[self._grey(dm, 160), c],
             height=max(12, G.base_lh(dm) * 2 - 4),
             gap_above=2, gap_below=0, min_rows=2
-        )
-
-        dm.show()
\ No newline at end of file
+        )
\ No newline at end of file
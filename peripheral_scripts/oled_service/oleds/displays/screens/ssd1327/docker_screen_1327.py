@@ -5,6 +5,8 @@ from ...ui import grid as G
 
 class DockerScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("docker_status", "status_docker", "docker_restarts", "docker_exit_code")
+    MEMOIZE = True
 
     def _status_label(self, stats)->str:
         raw=(stats.get("docker_status") or "").strip().lower()
@@ -29,10 +31,9 @@ class DockerScreen1327(BaseScreen):
         except Exception: exit_code="N/A"
 
         row=0
-        row=G.text_row(cv,dm,row,"Docker",font=dm.font,fill=c)
+        row=G.text_row(cv,dm,row,"Docker",font=dm.font,fill=c,static=True)
         row=G.text_row(cv,dm,row,f"Status {label}",font=dm.font_small,fill=c)
         row=G.text_row(cv,dm,row,f"Restarts {restarts}",font=dm.font_small,fill=c)
         row=G.text_row(cv,dm,row,f"Exit {exit_code}",font=dm.font_small,fill=c)
         row=G.blank_row(row,1)
         row=G.box_row(cv,dm,row,label,rows=2)
-        dm.show()
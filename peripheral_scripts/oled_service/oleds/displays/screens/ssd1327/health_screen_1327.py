@@ -5,6 +5,8 @@ from ...ui import grid as G
 
 class HealthScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("temp", "nvme_temp", "core_voltage", "throttling")
+    MEMOIZE = True
 
     CPU_WARN=70.0
     CPU_CRIT=85.0
@@ -34,7 +36,7 @@ class HealthScreen1327(BaseScreen):
         thr_raw=stats.get('throttling'); thr=self._boolish(thr_raw)
 
         row=0
-        row=G.text_row(cv,dm,row,"Health",font=dm.font,fill=c)
+        row=G.text_row(cv,dm,row,"Health",font=dm.font,fill=c,static=True)
         row=G.text_row(cv,dm,row,f"CPU {cpu:.0f}°  {self._grade(cpu,self.CPU_WARN,self.CPU_CRIT)}",font=dm.font_small,fill=c)
         if nvme>0:
             row=G.text_row(cv,dm,row,f"NVMe {nvme:.0f}°  {self._grade(nvme,self.NVME_WARN,self.NVME_CRIT)}",font=dm.font_small,fill=c)
@@ -55,4 +57,3 @@ class HealthScreen1327(BaseScreen):
         else: summary="OK"
 
         row=G.box_row(cv,dm,row,summary,rows=2)
-        dm.show()
@@ -1,18 +1,29 @@
 #!/usr/bin/env python3
 import os
+from oleds.configs.configs import TREND_WINDOW
 from ..base import BaseScreen
 from ...ui.canvas import Canvas
 from ...ui import grid as G
 from ...ui import format as F
+from ...ui.rollup import HISTORY
 from ...ui.trend import Trend
 
 class NetworkScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("ip", "status_wifi_connected", "status_lan", "status_bluetooth", "network_throughput")
 
     def __init__(self):
         alpha = float(os.getenv("OLED_NET_EMA_ALPHA", "0.3"))
         decay = float(os.getenv("OLED_NET_TREND_DECAY", "0.90"))
         self.trend = Trend(n_series=2, history=120, alpha=alpha, decay=decay)
+        self._norm = [[], []]
+
+    def sample(self, stats):
+        thr = stats.get("network_throughput") or {}
+        self._norm = self.trend.update([F.parse_rate_bps(thr.get("upload")), F.parse_rate_bps(thr.get("download"))])
+
+    def backfill(self, store):
+        self.trend.backfill(store.recent(self.trend.history, ("net_up", "net_down")))
 
     def _grey(self, dm, level=160):
         mode = getattr(dm.image, "mode", "L") if getattr(dm, "image", None) is not None else "L"
@@ -22,6 +33,7 @@ class NetworkScreen1327(BaseScreen):
         return (level, level, level)
 
     def draw(self, dm, stats):
+        self.observe(stats)
         c = dm.color()
         dm.clear(); dm.draw_status_bar(stats)
         cv = Canvas.from_display(dm)
@@ -36,7 +48,7 @@ class NetworkScreen1327(BaseScreen):
         dn_bps = F.parse_rate_bps(thr.get("download"))
 
         row = 0
-        ip_line = F.fit_text(cv, dm.font_small, [f"IP {ip}", F.short_ip(ip)]) if hasattr(F, "fit_text") else (f"IP {ip}" if cv.draw.textlength(f"IP {ip}", font=dm.font_small) <= cv.width else F.short_ip(ip))
+        ip_line = G.fit_text(cv, dm.font_small, [f"IP {ip}", F.short_ip(ip)])
 
         row = G.text_row(cv, dm, row, ip_line, font=dm.font_small, fill=c)
         # Статусы (каждый на своей строке)
@@ -48,7 +60,9 @@ class NetworkScreen1327(BaseScreen):
         rates = f"↑{F.fmt_bps(up_bps)}  ↓{F.fmt_bps(dn_bps)}"
         row = G.text_row(cv, dm, row, rates, font=dm.font, fill=c)
 
-        up_norm, dn_norm = self.trend.update([up_bps, dn_bps])
+        up_norm, dn_norm = self._norm
+        if TREND_WINDOW in HISTORY.network.windows:
+            up_norm, dn_norm = HISTORY.network.normalized(TREND_WINDOW)
         row = G.spark_area(
             cv, dm, row,
             series_list=[up_norm, dn_norm],
@@ -56,5 +70,3 @@ class NetworkScreen1327(BaseScreen):
             height=max(12, G.base_lh(dm) * 2 - 4),
             gap_above=2, gap_below=0, min_rows=2
         )
-
-        dm.show()
@@ -1,19 +1,31 @@
 #!/usr/bin/env python3
 import math
+import time
 from collections import deque
+from oleds.configs.configs import TREND_WINDOW
 from ..base import BaseScreen
 from ...ui.canvas import Canvas
 from ...ui import grid as G
 from ...ui import format as F
+from ...ui.rollup import HISTORY
 
 class PerformanceScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    ANIMATED = True     # the CPU bar pulses
+    STATS_KEYS = ("ip", "cpu", "temp", "cpu_freq", "mem", "swap")
+    PULSE_PERIOD = 1.5  # seconds per CPU-bar pulse
 
     def __init__(self):
-        self._t=0
         self._cpu_hist=deque(maxlen=60)
 
+    def sample(self, stats):
+        self._cpu_hist.append(float(stats.get('cpu',0) or 0.0))
+
+    def backfill(self, store):
+        self._cpu_hist.extend(v for (v,) in store.recent(self._cpu_hist.maxlen, ("cpu",)))
+
     def draw(self, dm, stats):
+        self.observe(stats)
         c=dm.color()
         dm.clear(); dm.draw_status_bar(stats)
         cv=Canvas.from_display(dm)
@@ -50,12 +62,9 @@ class PerformanceScreen1327(BaseScreen):
         row=G.text_row(cv,dm,row,mem_line,font=dm.font_small,fill=c)
         row=G.text_row(cv,dm,row,swp_line,font=dm.font_small,fill=c)
 
-        pulse = 0.95 + 0.05*math.sin(self._t*2*math.pi/30.0)
+        pulse = 0.95 + 0.05*math.sin(time.monotonic()*2*math.pi/self.PULSE_PERIOD)
         cpu_v = max(0.0, min(1.0, (cpu/100.0)*pulse))
         row = G.bar_row(cv, dm, row, cpu_v, height=12, gap_above=2, gap_below=2, min_rows=1, fg=c, bg=dm.theme.background, border=c)
 
-        self._cpu_hist.append(cpu)
-        row = G.spark_row(cv, dm, row, list(self._cpu_hist), height=12, gap_above=4, gap_below=0, min_rows=1, fg=c)
-
-        self._t=(self._t+1)%10000
-        dm.show()
+        cpu_hist = HISTORY.cpu.series(TREND_WINDOW)[0] if TREND_WINDOW in HISTORY.cpu.windows else list(self._cpu_hist)
+        row = G.spark_row(cv, dm, row, cpu_hist, height=12, gap_above=4, gap_below=0, min_rows=1, fg=c)
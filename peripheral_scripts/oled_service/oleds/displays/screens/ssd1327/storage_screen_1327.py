@@ -6,6 +6,8 @@ from ...ui import format as F
 
 class StorageScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("root_disk_usage", "storage_disk_usage", "disk_io")
+    MEMOIZE = True
 
     def draw(self, dm, stats):
         c=dm.color()
@@ -33,5 +35,3 @@ class StorageScreen1327(BaseScreen):
         io_short = f"R:{(io.get('read') or '0K')}  W:{(io.get('write') or '0K')}"
         io_line  = G.fit_text(cv, dm.font_small, [io_full, io_short])
         row = G.text_row(cv, dm, row, io_line, font=dm.font_small, fill=c)
-
-        dm.show()
@@ -6,6 +6,8 @@ from ...ui import format as F
 
 class SystemScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("uptime", "cpu", "cpu_freq", "mem", "root_disk_usage", "ip", "docker_status", "status_docker")
+    MEMOIZE = True
 
     def draw(self, dm, stats):
         c=dm.color()
@@ -42,11 +44,10 @@ class SystemScreen1327(BaseScreen):
         ip_line = G.fit_text(cv, dm.font_small, [f"IP {ip}", F.short_ip(ip)])
 
         row=0
-        row=G.text_row(cv, dm, row, "System", font=dm.font_small, fill=c)
+        row=G.text_row(cv, dm, row, "System", font=dm.font_small, fill=c, static=True)
         row=G.text_row(cv, dm, row, f"Up {uptime}", font=dm.font_small, fill=c)
         row=G.text_row(cv, dm, row, cpu_line, font=dm.font_small, fill=c)
         row=G.text_row(cv, dm, row, mem_line, font=dm.font_small, fill=c)
         row=G.text_row(cv, dm, row, root_line, font=dm.font_small, fill=c)
         row=G.text_row(cv, dm, row, ip_line, font=dm.font_small, fill=c)
         row=G.text_row(cv, dm, row, f"Docker {dock_label}", font=dm.font_small, fill=c)
-        dm.show()
@@ -6,6 +6,8 @@ import json
 
 class WeatherScreen1327(BaseScreen):
     HANDLES_BACKGROUND = True
+    STATS_KEYS = ("weather",)
+    MEMOIZE = True
 
     # def should_render(self, dm, stats: dict) -> bool:
     #     weather_data = stats.get("weather") or stats.get("weather_data")
@@ -89,14 +91,13 @@ class WeatherScreen1327(BaseScreen):
 
         if not any((w["temp"], w["feels"], w["description"], w["location"], w["pressure"], w["humidity"])):
             row = 0
-            row = G.text_row(cv, dm, row, "Weather", font=dm.font_small, fill=c)
+            row = G.text_row(cv, dm, row, "Weather", font=dm.font_small, fill=c, static=True)
             row = G.blank_row(row, 1)
             row = G.box_row(cv, dm, row, "N/A", rows=2)
-            dm.show()
             return
 
         row = 0
-        row = G.text_row(cv, dm, row, "Weather", font=dm.font_small, fill=c)
+        row = G.text_row(cv, dm, row, "Weather", font=dm.font_small, fill=c, static=True)
 
         loc  = str(w["location"] or "—")
         desc = str(w["description"] or "").strip()
@@ -119,6 +120,4 @@ class WeatherScreen1327(BaseScreen):
 
         src = str(w["source"] or "").strip()
         if src:
-            row = G.text_row(cv, dm, row, f"Src: {src}", font=dm.font_small, fill=c)
-
-        dm.show()
\ No newline at end of file
+            row = G.text_row(cv, dm, row, f"Src: {src}", font=dm.font_small, fill=c)
\ No newline at end of file
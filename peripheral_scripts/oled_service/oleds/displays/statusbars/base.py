@@ -5,10 +5,16 @@ WHITE_1BIT = 255
 WHITE_RGB: Tuple[int, int, int] = (255, 255, 255)
 
 class StatusBarBase:
+    STATS_KEYS = ()
+
     def __init__(self, icon_size: int, image_mode: str):
         self.icon_size = icon_size
         self.image_mode = image_mode
 
+    def memo_key(self):
+        """What the bar draws from besides its STATS_KEYS (clock, UPS status); None: nothing."""
+        return None
+
     def color(self):
         return WHITE_RGB if self.image_mode != "1" else WHITE_1BIT
 
@@ -4,6 +4,8 @@ from typing import Dict
 from .base import StatusBarBase
 
 class StatusBarSSD1306(StatusBarBase):
+    STATS_KEYS = ("status_docker", "status_root_disk", "status_storage_disk", "status_wifi", "status_voltage")
+
     def draw(self, dm, statuses: Dict):
         icons = [
             "DOCKER_OK" if statuses.get("status_docker") else "DOCKER_FAIL",
@@ -14,8 +16,11 @@ class StatusBarSSD1306(StatusBarBase):
         ]
 
         positions = [0, 30, 60, 90, 120]
-        
-        for i, name in enumerate(icons):
-            icon = dm._get_icon(name)
-            if icon:
-                dm.image.paste(icon, (positions[i], 0))
\ No newline at end of file
+
+        def render(img):
+            for i, name in enumerate(icons):
+                icon = dm._get_icon(name)
+                if icon:
+                    img.paste(icon, (positions[i], 0))
+
+        dm.blit_layer(("statusbar", tuple(icons)), (0, 0), (dm.width, self.icon_size), render)
\ No newline at end of file
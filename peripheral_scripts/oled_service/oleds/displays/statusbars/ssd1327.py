@@ -4,12 +4,30 @@ import time
 import logging
 from typing import Dict, Tuple, Optional
 
+from PIL import ImageDraw
+
 from .ssd1327_configs import BarConfig
 from .ssd1327_utils import text_y_center, icon_image, choose_icon_name
-from oleds.widgets.batteries.battery import draw_battery
+from oleds.widgets.batteries.battery import battery_fill_width, draw_battery
 
 log = logging.getLogger(__name__)
 
+_ICON_KEYS = {
+    "storage":   ("status_root_disk",),
+    "nvme":      ("status_nvme", "nvme_power_ok"),
+    "bluetooth": ("status_bluetooth",),
+    "wifi":      ("status_wifi",),
+    "docker":    ("status_docker",),
+}
+
+class _Surface:
+    """dm-like target (image/draw/font) so the bar's static part can be drawn into a layer."""
+
+    def __init__(self, dm, image):
+        self.image = image
+        self.draw = ImageDraw.Draw(image)
+        self.font = dm.font
+
 class StatusBarSSD1327:
 
     def __init__(self, fg: int = 255, bg: int = 0, config: BarConfig | None = None):
@@ -20,20 +38,24 @@ class StatusBarSSD1327:
         self.bg = int(bg)
         self.cfg = config or BarConfig()
         self.bar_h = self.cfg.pad_top + self.cfg.elem_h + self.cfg.pad_bot
+        self.STATS_KEYS = tuple(k for cat in self.cfg.left_icons for k in _ICON_KEYS.get(cat, ()))
 
     def draw(self, dm, stats: Dict) -> None:
         self.render(dm, stats)
 
+    def memo_key(self):
+        return time.strftime(self.cfg.clock_fmt), battery_fill_width(self.cfg.battery_width)
+
     def drow_bar(self, dm) -> None:
         y1 = self.bar_h - 1
         dm.draw.line((0, y1, dm.image.size[0]-1, y1), fill=self.fg)
 
     def dwor_clock(self, dm, y: int, right_edge: int) -> Tuple[int,int,int]:
         text = time.strftime(self.cfg.clock_fmt)
-        tw = int(dm.draw.textlength(text, font=dm.font))
+        tw = int(dm.text_width(text, dm.font))
         tx = right_edge - tw
         ty = text_y_center(dm.font, y, self.cfg.elem_h)
-        dm.draw.text((tx, ty), text, font=dm.font, fill=self.fg)
+        dm.text((tx, ty), text, font=dm.font, fill=self.fg)
         return tx, ty, tw
 
     def drow_battery(self, dm, y: int, right_edge: int) -> Tuple[int,int,int,int]:
@@ -87,13 +109,29 @@ class StatusBarSSD1327:
         return self._draw_icon(dm, name, x, y)
 
     def render(self, dm, stats: Dict) -> None:
+        W, _ = dm.image.size
+        text = time.strftime(self.cfg.clock_fmt)
+        tx = W - int(dm.text_width(text, dm.font))
+
+        # icons, battery and rule only change with their inputs; the clock is drawn on top
+        states = tuple(self._icon_state(cat, stats) for cat in self.cfg.left_icons)
+        key = ("statusbar", tx, battery_fill_width(self.cfg.battery_width), states)
+        dm.blit_layer(key, (0, 0), (W, self.bar_h), lambda img: self.render_static(_Surface(dm, img), stats, tx))
+        self.dwor_clock(dm, self.cfg.pad_top, W)
+
+    def _icon_state(self, cat: str, stats: Dict):
+        if cat == "nvme":
+            return (bool(stats.get("status_nvme", False)), stats.get("nvme_power_ok"))
+        if cat == "storage":
+            return bool(stats.get("status_root_disk", True))
+        return bool(stats.get(_ICON_KEYS.get(cat, ("",))[0], False))
+
+    def render_static(self, dm, stats: Dict, clock_x: int) -> None:
         W, _ = dm.image.size
         y_elem = self.cfg.pad_top
         left_x = 0
-        right_edge = W
-        
-        tx, _, tw = self.dwor_clock(dm, y_elem, right_edge)
-        bx, _, bw, _ = self.drow_battery(dm, y_elem, tx - self.cfg.right_gap_between)
+
+        bx, _, bw, _ = self.drow_battery(dm, y_elem, clock_x - self.cfg.right_gap_between)
         left_limit = bx - self.cfg.gap
 
         needed_per_icon = self.cfg.elem_h + self.cfg.gap
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 from typing import List, Optional
-from PIL import Image, ImageDraw
+from PIL import Image
 
 try:
     from oleds.models.icons_x16 import ICON_DATA as ICON16
@@ -9,6 +9,7 @@ except Exception:
     ICON16 = {}
 
 from oleds.models.icons_x8 import ICON_DATA as ICON8
+from oleds.displays.ui.icon_atlas import icon_atlas
 
 def choose_icon_name(category: str, ok: Optional[bool]) -> Optional[str]:
     bank = {
@@ -32,30 +33,13 @@ def choose_icon_name(category: str, ok: Optional[bool]) -> Optional[str]:
             return name
     return None
 
-def bitmap_to_img(bitmap: List[int], size: int, mode: str, fg: int, bg: int) -> Image.Image:
-    img = Image.new(mode if mode in ("1","L","RGB") else "RGB", (size, size), bg)
-    d = ImageDraw.Draw(img)
-    grid = 16 if size >= 16 and len(bitmap) == 16 else 8
-    scale = max(1, size // grid)
-    ox = (size - grid * scale) // 2
-    oy = (size - grid * scale) // 2
-
-    for y, row in enumerate(bitmap[:grid]):
-        for x in range(grid):
-            if row & (1 << (grid - 1 - x)):
-                x0 = ox + x * scale
-                y0 = oy + y * scale
-                x1 = x0 + scale - 1
-                y1 = y0 + scale - 1
-                d.rectangle((x0, y0, x1, y1), fill=fg)
-    
-    return img
-
 def icon_image(name: str, size: int, mode: str, fg: int, bg: int) -> Optional[Image.Image]:
+    """Shared, read-only icon image cut from the cached atlas; None for an unknown name."""
+    mode = mode if mode in ("1", "L", "RGB") else "RGB"
     if name in ICON16:
-        return bitmap_to_img(ICON16[name], size, mode, fg, bg)
+        return icon_atlas("x16", size, mode, fg, bg).get(name)
     if name in ICON8:
-        return bitmap_to_img(ICON8[name], size, mode, fg, bg)
+        return icon_atlas("x8", size, mode, fg, bg).get(name)
     return None
 
 def text_y_center(font, y_top: int, box_h: int) -> int:
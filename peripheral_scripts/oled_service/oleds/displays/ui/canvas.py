@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Any, Sequence, Tuple, Optional
+import numpy as np
 from PIL import ImageDraw, ImageFont
+from .framebuffer import PilFramebuffer
+from .metrics import METRICS, fontmode
 
 @dataclass
 class Canvas:
@@ -14,6 +17,12 @@ class Canvas:
     width: int
     height: int
     color: Tuple[int, ...]  # default color
+    text_renderer: Any = None  # GlyphTextRenderer, or None for draw.text
+    fb: Any = None             # framebuffer the primitives draw into; defaults to draw's
+
+    def __post_init__(self):
+        if self.fb is None:
+            self.fb = PilFramebuffer(None, self.draw)
 
     @classmethod
     def from_display(cls, dm) -> "Canvas":
@@ -26,16 +35,13 @@ class Canvas:
             width=dm.content_width,
             height=dm.content_height,
             color=dm.color(),
+            text_renderer=getattr(dm, "text_renderer", None),
+            fb=getattr(dm, "fb", None),
         )
 
     @staticmethod
     def _line_height(font: ImageFont.ImageFont, extra: int = 2) -> int:
-        try:
-            bbox = font.getbbox("Ag")
-            h = bbox[3] - bbox[1]
-        except Exception:
-            h = getattr(font, "size", 12)
-        return int(h + extra)
+        return METRICS.line_height(font, extra)
 
     def _clamp_rect(self, x0, y0, x1, y1) -> Optional[Tuple[int,int,int,int]]:
         X0 = max(self.left,  min(self.right,  int(x0)))
@@ -47,26 +53,17 @@ class Canvas:
         return (X0, Y0, X1, Y1)
 
     def _ellipsis(self, text: str, max_w: int, font) -> str:
-        if self.draw.textlength(text, font=font) <= max_w:
-            return text
-        ell, w_ell = "…", self.draw.textlength("…", font=font)
-        if w_ell > max_w:
-            return ""
-        lo, hi = 0, len(text)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if self.draw.textlength(text[:mid], font=font) + w_ell <= max_w:
-                lo = mid + 1
-            else:
-                hi = mid
-        return text[:max(0, lo-1)] + ell
+        return METRICS.ellipsis(font, text, max_w, fontmode(self.draw))
 
     # --- text ---
     def text(self, x: int, y: int, s: str, *, font, fill=None, max_w: Optional[int]=None):
         fill = self.color if fill is None else fill
         if max_w is not None:
             s = self._ellipsis(s, max_w, font)
-        self.draw.text((x, y), s, font=font, fill=fill)
+        if self.text_renderer:
+            self.text_renderer.text(self.draw, (x, y), s, font=font, fill=fill)
+        else:
+            self.draw.text((x, y), s, font=font, fill=fill)
 
     def text_row(self, row_idx: int, s: str, *, font, fill=None, pad_left: int=0) -> int:
         lh = self._line_height(font)
@@ -82,9 +79,9 @@ class Canvas:
         if not r:
             return
         if fill is not None:
-            self.draw.rectangle(r, fill=fill)
+            self.fb.fill_rect(*r, fill)
         if outline is not None:
-            self.draw.rectangle(r, outline=outline, width=width)
+            self.fb.rect(*r, outline, width=width)
 
     def bar(self, x, y, w, h, value01: float, *, fg=None, bg=None, border=None):
         fg = self.color if fg is None else fg
@@ -97,21 +94,20 @@ class Canvas:
         if inner_w > 0:
             self.rect(x+1, y+1, x+1+inner_w-1, y+h-1, fill=fg)
 
-    def sparkline(self, x, y, w, h, values: List[float], *, fg=None):
-        if not values:
+    def sparkline(self, x, y, w, h, values: Sequence[float], *, fg=None):
+        if len(values) == 0:
             return
         fg = self.color if fg is None else fg
         n = len(values)
         if n == 1:
-            self.draw.line((x, y+h//2, x+w, y+h//2), fill=fg)
+            self.fb.polyline(((x, y+h//2), (x+w, y+h//2)), fg)
             return
-        vmin = min(values); vmax = max(values); rng = (vmax - vmin) or 1.0
+        v = np.asarray(values, dtype=float)
+        vmin = v.min(); vmax = v.max(); rng = (vmax - vmin) or 1.0
         step = (w - 1) / (n - 1)
-        pts = []
-        for i, v in enumerate(values):
-            px = x + int(i * step)
-            py = y + int(h - 1 - ((v - vmin) / rng) * (h - 1))
-            px = min(self.right, max(self.left, px))
-            py = min(self.bottom, max(self.top, py))
-            pts.append((px, py))
-        self.draw.line(pts, fill=fg, width=1)
+        # same float steps as the scalar form, truncated the way int() does
+        px = x + np.trunc(np.arange(n) * step).astype(int)
+        py = y + np.trunc(h - 1 - ((v - vmin) / rng) * (h - 1)).astype(int)
+        px = np.clip(px, self.left, self.right)
+        py = np.clip(py, self.top, self.bottom)
+        self.fb.polyline(np.column_stack((px, py)), fg)
@@ -0,0 +1,172 @@
+# oleds/displays/ui/glyph_text.py
+from __future__ import annotations
+from collections import OrderedDict
+from string import printable
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageFont
+
+CHARSET = "".join(c for c in printable if c.isprintable()) + "…°±µ·×÷²³—↑↓"
+MAX_ODD_GLYPHS = 4
+STRING_CACHE_SIZE = 256
+
+# Atlases are checked against FreeType when built: every glyph at the string
+# edges and between neighbours, then these strings. Under mono hinting ("1"
+# images) PIL's layout is not quite compositional (glyphs with a negative
+# bearing shift once they are not first, "_" next to a space is clipped);
+# such glyphs are dropped from the atlas, and a font with more than
+# MAX_ODD_GLYPHS of them stays on FreeType altogether.
+_PROBES = ("CPU 37% 1.8GHz", "AVWaTo LT r. fi ff", "V0 0V yj", "12:34 10.0.0.5", "Wi-Fi …°C (x)", "a_b _ _")
+
+class _Glyph:
+    __slots__ = ("mask", "dx", "dy", "advance")
+
+    def __init__(self, mask: np.ndarray, dx: int, dy: int, advance: float):
+        self.mask = mask        # coverage, uint8 (h, w)
+        self.dx = dx            # bitmap offset from the pen position, "la" anchor
+        self.dy = dy
+        self.advance = advance
+
+class GlyphAtlas:
+    """
+    One font's glyphs rasterized once, for one fontmode ("1" = mono hinting
+    as used on "1" images, "L" = antialiased). Strings are composed from the
+    cached bitmaps at the pen positions FreeType's basic layout would use:
+    glyph advances plus pair kerning, rounded to whole pixels. Composed
+    masks of recent strings are kept too, as pages redraw mostly the same
+    text.
+    """
+
+    def __init__(self, font, fontmode: str, charset: str = CHARSET):
+        self.font = font
+        self.fontmode = fontmode
+        self.glyphs: Dict[str, _Glyph] = {}
+        self._kerning: Dict[Tuple[str, str], float] = {}
+        self._strings: OrderedDict[str, Optional[Tuple[Image.Image, int, int]]] = OrderedDict()
+        for ch in charset:
+            mask, (dx, dy) = font.getmask2(ch, fontmode, anchor="la")
+            w, h = mask.size
+            arr = np.frombuffer(bytes(mask), dtype=np.uint8).reshape(h, w) if w and h else np.zeros((0, 0), np.uint8)
+            self.glyphs[ch] = _Glyph(arr, dx, dy, font.getlength(ch, mode=fontmode))
+
+    def covers(self, text: str) -> bool:
+        glyphs = self.glyphs
+        return all(c in glyphs for c in text)
+
+    def _kern(self, a: str, b: str) -> float:
+        k = self._kerning.get((a, b))
+        if k is None:
+            k = self._kerning[(a, b)] = (self.font.getlength(a + b, mode=self.fontmode)
+                                         - self.glyphs[a].advance - self.glyphs[b].advance)
+        return k
+
+    def mask(self, text: str) -> Optional[Tuple[Image.Image, int, int]]:
+        """(coverage mask, x offset, y offset) for text drawn at (0, 0); None if nothing is inked."""
+        if text in self._strings:
+            self._strings.move_to_end(text)
+            return self._strings[text]
+        m = self._strings[text] = self._compose(text)
+        if len(self._strings) > STRING_CACHE_SIZE:
+            self._strings.popitem(last=False)
+        return m
+
+    def _compose(self, text: str) -> Optional[Tuple[Image.Image, int, int]]:
+        placed = []
+        pen = 0.0
+        prev = None
+        for ch in text:
+            if prev is not None:
+                pen += self._kern(prev, ch)
+            g = self.glyphs[ch]
+            if g.mask.size:
+                placed.append((int(pen + 0.5) + g.dx, g.dy, g.mask))
+            pen += g.advance
+            prev = ch
+        if not placed:
+            return None
+        x0 = min(x for x, _, _ in placed)
+        y0 = min(y for _, y, _ in placed)
+        x1 = max(x + m.shape[1] for x, _, m in placed)
+        y1 = max(y + m.shape[0] for _, y, m in placed)
+        out = np.zeros((y1 - y0, x1 - x0), dtype=np.uint16)
+        for x, y, m in placed:
+            region = out[y - y0:y - y0 + m.shape[0], x - x0:x - x0 + m.shape[1]]
+            # overlapping edges combine like FreeType's string render: a + b - a*b/255
+            t = region * m + 128
+            region += m - ((t + (t >> 8)) >> 8)
+        return Image.fromarray(out.astype(np.uint8), "L"), x0, y0
+
+class GlyphTextRenderer:
+    """
+    Drop-in for draw.text(xy, text, font=, fill=) that blits cached glyph
+    bitmaps. Atlases are built per (font, fontmode) on first use (or up
+    front via warm()) and checked against FreeType; strings with glyphs
+    outside the atlas, and fonts that fail the check, go through draw.text.
+    """
+
+    def __init__(self, charset: str = CHARSET):
+        self.charset = charset
+        self._atlases: Dict[Tuple[object, str], Optional[GlyphAtlas]] = {}
+        self.blitted = 0
+        self.fallbacks = 0
+
+    def atlas(self, font, fontmode: str) -> Optional[GlyphAtlas]:
+        key = (font, fontmode)
+        if key not in self._atlases:
+            self._atlases[key] = self._build(font, fontmode)
+        return self._atlases[key]
+
+    def warm(self, fonts, fontmode: str) -> None:
+        for font in fonts:
+            self.atlas(font, fontmode)
+
+    def _build(self, font, fontmode: str) -> Optional[GlyphAtlas]:
+        if not isinstance(font, ImageFont.FreeTypeFont):
+            return None
+        try:
+            atlas = GlyphAtlas(font, fontmode, self.charset)
+            # a few odd glyphs (missing from the font, say) are left to FreeType;
+            # many mean the font's layout isn't compositional at all
+            odd = [c for c in atlas.glyphs
+                   if not all(_same_as_freetype(atlas, p) for p in (f" {c}0{c} ", f"{c} ", f" {c}"))]
+            if len(odd) > MAX_ODD_GLYPHS:
+                return None
+            for c in odd:
+                del atlas.glyphs[c]
+            atlas._strings.clear()
+            probes = ["".join(c for c in p if c in atlas.glyphs) for p in _PROBES]
+            if not all(_same_as_freetype(atlas, p) for p in probes):
+                return None
+        except Exception:
+            return None
+        return atlas
+
+    def text(self, draw, xy, text: str, *, font, fill=None) -> None:
+        atlas = self.atlas(font, draw.fontmode)
+        if atlas is None or not atlas.covers(text):
+            self.fallbacks += 1
+            draw.text(xy, text, font=font, fill=fill)
+            return
+        self.blitted += 1
+        m = atlas.mask(text)
+        if m is not None:
+            mask, dx, dy = m
+            draw.bitmap((int(xy[0]) + dx, int(xy[1]) + dy), mask, fill=fill)
+
+def _same_as_freetype(atlas: GlyphAtlas, text: str) -> bool:
+    ref, (rx, ry) = atlas.font.getmask2(text, atlas.fontmode, anchor="la")
+    ref_arr = np.frombuffer(bytes(ref), dtype=np.uint8).reshape(ref.size[1], ref.size[0])
+    got = atlas.mask(text)
+    if got is None:
+        return not ref_arr.any()
+    mask, dx, dy = got
+    # compare on a common canvas; either side may carry blank margins
+    x0, y0 = min(rx, dx), min(ry, dy)
+    w = max(rx + ref.size[0], dx + mask.size[0]) - x0
+    h = max(ry + ref.size[1], dy + mask.size[1]) - y0
+    a = np.zeros((h, w), np.uint8)
+    b = np.zeros((h, w), np.uint8)
+    a[ry - y0:ry - y0 + ref.size[1], rx - x0:rx - x0 + ref.size[0]] = ref_arr
+    b[dy - y0:dy - y0 + mask.size[1], dx - x0:dx - x0 + mask.size[0]] = np.asarray(mask)
+    return np.array_equal(a, b)
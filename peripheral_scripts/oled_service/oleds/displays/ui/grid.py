@@ -2,26 +2,34 @@
 from __future__ import annotations
 from math import ceil
 from typing import Sequence, Optional
+from PIL import ImageDraw
 from .canvas import Canvas
+from .metrics import METRICS, fontmode
 
 def base_lh(dm) -> int:
     return Canvas._line_height(dm.font)
 
-def text_row(cv, dm, row: int, text: str, *, font=None, fill=None, pad_left: int=0) -> int:
+def text_row(cv, dm, row: int, text: str, *, font=None, fill=None, pad_left: int=0, static: bool=False) -> int:
+    """static=True for fixed labels: the row is rasterized once and blitted afterwards."""
     font = font or dm.font
+    fill = fill or dm.color()
     BASE_LH = base_lh(dm)
     y_row = cv.top + row * BASE_LH
     lh = Canvas._line_height(font)
     y_txt = y_row + max(0, (BASE_LH - lh) // 2)
     if y_txt <= cv.bottom:
-        cv.text(cv.left + pad_left, y_txt, text, font=font, fill=fill or dm.color(), max_w=cv.width - pad_left)
+        max_w = cv.width - pad_left
+        if static:
+            s = cv._ellipsis(text, max_w, font)
+            size = (max_w, font.getbbox(s or " ")[3] + 1)
+            dm.blit_layer(("text", s, font, fill), (cv.left + pad_left, y_txt), size,
+                          lambda img: ImageDraw.Draw(img).text((0, 0), s, font=font, fill=fill))
+        else:
+            cv.text(cv.left + pad_left, y_txt, text, font=font, fill=fill, max_w=max_w)
     return row + 1
 
 def fit_text(cv, font, variants: Sequence[str]) -> str:
-    for s in variants:
-        if cv.draw.textlength(s, font=font) <= cv.width:
-            return s
-    return variants[-1] if variants else ""
+    return METRICS.fit_variant(font, variants, cv.width, fontmode(cv.draw))
 
 def bar_row(
     cv, dm, row: int, value01: float, *,
@@ -48,7 +56,7 @@ def spark_row(
     y_sp = cv.top + row * BASE_LH + gap_above
     w = min(width or 120, cv.width)
     if y_sp <= cv.bottom and height > 0:
-        cv.sparkline(cv.left, y_sp, w, min(height, max(0, cv.bottom - y_sp)), list(values), fg=fg or dm.color())
+        cv.sparkline(cv.left, y_sp, w, min(height, max(0, cv.bottom - y_sp)), values, fg=fg or dm.color())
     rows_used = max(min_rows, ceil((gap_above + height + gap_below) / BASE_LH))
     return row + rows_used
 
@@ -66,26 +74,33 @@ def box_row(
     y1 = min(cv.bottom, cv.top + (row + rows) * BASE_LH - 1)
     x0 = cv.left
     x1 = cv.right - 1
+    if y1 < y0:
+        return row + rows
 
-    try:
-        cv.draw.rounded_rectangle([x0, y0, x1, y1], outline=color, width=1, radius=radius)
-    except Exception:
-        cv.draw.rectangle([x0, y0, x1, y1], outline=color, width=1)
+    # frame and label are rasterized once per (geometry, text) and blitted afterwards
+    def render(img):
+        d = ImageDraw.Draw(img)
+        w, h = x1 - x0, y1 - y0
+        try:
+            d.rounded_rectangle([0, 0, w, h], outline=color, width=1, radius=radius)
+        except Exception:
+            d.rectangle([0, 0, w, h], outline=color, width=1)
 
-    inner_w = max(0, (x1 - x0 + 1) - pad * 2)
-    inner_h = max(0, (y1 - y0 + 1) - pad * 2)
+        inner_w = max(0, w + 1 - pad * 2)
+        inner_h = max(0, h + 1 - pad * 2)
 
-    f = font or dm.font
-    tw = cv.draw.textlength(text, font=f)
-    if tw > inner_w:
-        f = dm.font_small
-        tw = cv.draw.textlength(text, font=f)
+        f = font or dm.font
+        tw = d.textlength(text, font=f)
+        if tw > inner_w:
+            f = dm.font_small
+            tw = d.textlength(text, font=f)
 
-    lh = Canvas._line_height(f)
-    tx = x0 + pad + max(0, (inner_w - tw) // 2)
-    ty = y0 + pad + max(0, (inner_h - lh) // 2)
+        lh = Canvas._line_height(f)
+        tx = pad + max(0, (inner_w - tw) // 2)
+        ty = pad + max(0, (inner_h - lh) // 2)
+        d.text((tx, ty), text, font=f, fill=color)
 
-    cv.text(tx, ty, text, font=f, fill=color)
+    dm.blit_layer(("box", text, font, radius, pad, color), (x0, y0), (x1 - x0 + 1, y1 - y0 + 1), render)
     return row + rows
 
 def spark_area(
@@ -105,7 +120,7 @@ def spark_area(
     if y <= cv.bottom and h > 0:
         for i, seq in enumerate(series_list):
             fg = (colors[i] if (colors and i < len(colors)) else dm.color())
-            cv.sparkline(cv.left, y, w, h, list(seq), fg=fg)
+            cv.sparkline(cv.left, y, w, h, seq, fg=fg)
 
     rows_used = max(min_rows, ceil((gap_above + height + gap_below) / BASE_LH))
     return row + rows_used
\ No newline at end of file
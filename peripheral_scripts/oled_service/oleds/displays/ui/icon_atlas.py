@@ -0,0 +1,79 @@
+# oleds/displays/ui/icon_atlas.py
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from oleds.models.icons_x8 import ICON_DATA as ICON8
+
+try:
+    from oleds.models.icons_x16 import ICON_DATA as ICON16
+except Exception:
+    ICON16 = {}
+
+_SETS = {"x8": ICON8, "x16": ICON16}
+
+Box = Tuple[int, int, int, int]
+
+def _unpack(rows: Sequence[int], grid: int) -> np.ndarray:
+    """Row bitmasks (MSB = leftmost pixel) -> (grid, grid) bool."""
+    words = np.asarray(list(rows[:grid]) + [0] * (grid - len(rows[:grid])), dtype=np.uint16)
+    if grid == 8:
+        return np.unpackbits((words & 0xFF).astype(np.uint8)[:, None], axis=1).astype(bool)
+    return np.unpackbits(words.astype(">u2").view(np.uint8).reshape(grid, 2), axis=1).astype(bool)
+
+class IconAtlas:
+    """
+    Every icon of one bitmap set rasterized side by side into a single strip
+    for a given (size, mode, fg, bg). Icons are handed out as crop boxes into
+    `image` or as per-icon images cut once; treat both as read-only.
+    """
+
+    def __init__(self, bitmaps: Dict[str, Sequence[int]], size: int, mode: str, fg, bg):
+        self.size = size
+        self.mode = mode
+        names = sorted(bitmaps)
+        self.boxes: Dict[str, Box] = {n: (i * size, 0, (i + 1) * size, size) for i, n in enumerate(names)}
+
+        mask = np.zeros((size, max(1, len(names)) * size), dtype=np.uint8)
+        for i, name in enumerate(names):
+            rows = bitmaps[name]
+            grid = 16 if size >= 16 and len(rows) == 16 else 8
+            scale = max(1, size // grid)
+            off = (size - grid * scale) // 2
+            cell = np.kron(_unpack(rows, grid), np.ones((scale, scale), dtype=bool))[:size - off, :size - off]
+            x = i * size + off
+            mask[off:off + cell.shape[0], x:x + cell.shape[1]] = cell * 255
+
+        self.image = Image.new(mode, (mask.shape[1], size), bg)
+        self.image.paste(fg, (0, 0), Image.fromarray(mask, "L"))
+        self._crops: Dict[str, Image.Image] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.boxes
+
+    def box(self, name: str) -> Optional[Box]:
+        return self.boxes.get(name)
+
+    def get(self, name: str) -> Optional[Image.Image]:
+        im = self._crops.get(name)
+        if im is None:
+            box = self.boxes.get(name)
+            if box is None:
+                return None
+            im = self._crops[name] = self.image.crop(box)
+        return im
+
+    def paste(self, dest: Image.Image, name: str, xy: Tuple[int, int]) -> bool:
+        im = self.get(name)
+        if im is None:
+            return False
+        dest.paste(im, xy)
+        return True
+
+@lru_cache(maxsize=16)
+def icon_atlas(icon_set: str, size: int, mode: str, fg, bg) -> IconAtlas:
+    """Shared atlas per (icon set, size, mode, fg, bg); icon_set is "x8" or "x16"."""
+    return IconAtlas(_SETS[icon_set], size, mode, fg, bg)
@@ -0,0 +1,154 @@
+# oleds/displays/ui/metrics.py
+from __future__ import annotations
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, Hashable, List, Optional, Tuple
+
+ELLIPSIS = "…"
+METRICS_CACHE_SIZE = 1024
+
+# pairs that kern or shape in common fonts; if any of them measures differently
+# from the sum of its glyph advances, the font's widths are not additive
+_PROBE_PAIRS = ("AV", "Wa", "To", "Ty", "LT", "r.", "fi", "ff", "11", "%)")
+
+class TextMetrics:
+    """
+    Memoized text measurements shared by the page helpers. Widths, line
+    heights and ellipsis fits are cached per (font, fontmode) — the draw's
+    fontmode picks FreeType's mono hinting for "1" images, which changes
+    advances. Fonts whose widths are additive also get a per-glyph advance
+    table, so new strings are measured by summation instead of layout.
+    """
+
+    def __init__(self, maxsize: int = METRICS_CACHE_SIZE, glyph_advances: bool = True):
+        self.maxsize = maxsize
+        self.glyph_advances = glyph_advances
+        self._widths: OrderedDict[Hashable, float] = OrderedDict()
+        self._fits: OrderedDict[Hashable, str] = OrderedDict()
+        self._line_heights: Dict[Tuple, int] = {}
+        self._advances: Dict[Tuple, Optional[Dict[str, float]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # --- caches ---
+    def _get(self, cache: OrderedDict, key):
+        val = cache.get(key)
+        if val is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+        return val
+
+    def _put(self, cache: OrderedDict, key, val):
+        self.misses += 1
+        cache[key] = val
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return val
+
+    def clear(self):
+        self._widths.clear()
+        self._fits.clear()
+        self._line_heights.clear()
+        self._advances.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses,
+                "widths": len(self._widths), "fits": len(self._fits)}
+
+    # --- glyph advances ---
+    def _advance_table(self, font, fontmode: str) -> Optional[Dict[str, float]]:
+        key = (font, fontmode)
+        if key in self._advances:
+            return self._advances[key]
+        table: Optional[Dict[str, float]] = None
+        if self.glyph_advances and hasattr(font, "getlength"):
+            table = {}
+            try:
+                for pair in _PROBE_PAIRS:
+                    if font.getlength(pair, mode=fontmode) != sum(self._advance(table, font, fontmode, c) for c in pair):
+                        table = None
+                        break
+            except Exception:
+                table = None
+        self._advances[key] = table
+        return table
+
+    @staticmethod
+    def _advance(table: Dict[str, float], font, fontmode: str, ch: str) -> float:
+        adv = table.get(ch)
+        if adv is None:
+            adv = table[ch] = font.getlength(ch, mode=fontmode)
+        return adv
+
+    def _prefix_widths(self, font, text: str, fontmode: str) -> Optional[List[float]]:
+        table = self._advance_table(font, fontmode)
+        if table is None:
+            return None
+        return list(accumulate((self._advance(table, font, fontmode, c) for c in text), initial=0.0))
+
+    # --- measurements ---
+    def text_width(self, font, text: str, fontmode: str = "L") -> float:
+        key = (font, fontmode, text)
+        w = self._get(self._widths, key)
+        if w is not None:
+            return w
+        table = self._advance_table(font, fontmode)
+        if table is not None:
+            w = sum(self._advance(table, font, fontmode, c) for c in text)
+        else:
+            w = font.getlength(text, mode=fontmode)
+        return self._put(self._widths, key, w)
+
+    def line_height(self, font, extra: int = 2) -> int:
+        key = (font, extra)
+        lh = self._line_heights.get(key)
+        if lh is None:
+            try:
+                bbox = font.getbbox("Ag")
+                h = bbox[3] - bbox[1]
+            except Exception:
+                h = getattr(font, "size", 12)
+            lh = self._line_heights[key] = int(h + extra)
+        return lh
+
+    def ellipsis(self, font, text: str, max_w: int, fontmode: str = "L") -> str:
+        """Longest prefix of text that fits max_w with "…" appended (text itself if it fits)."""
+        key = (font, fontmode, text, max_w)
+        fit = self._get(self._fits, key)
+        if fit is not None:
+            return fit
+        return self._put(self._fits, key, self._fit(font, text, max_w, fontmode))
+
+    def _fit(self, font, text: str, max_w: int, fontmode: str) -> str:
+        if self.text_width(font, text, fontmode) <= max_w:
+            return text
+        w_ell = self.text_width(font, ELLIPSIS, fontmode)
+        if w_ell > max_w:
+            return ""
+        prefix = self._prefix_widths(font, text, fontmode)
+        if prefix is not None:
+            # prefix[i] is the width of text[:i]; keep the longest i that fits
+            n = bisect_right(prefix, max_w - w_ell) - 1
+            return text[:max(0, n)] + ELLIPSIS
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.text_width(font, text[:mid], fontmode) + w_ell <= max_w:
+                lo = mid + 1
+            else:
+                hi = mid
+        return text[:max(0, lo - 1)] + ELLIPSIS
+
+    def fit_variant(self, font, variants, max_w: int, fontmode: str = "L") -> str:
+        """First variant that fits max_w, else the last one."""
+        for s in variants:
+            if self.text_width(font, s, fontmode) <= max_w:
+                return s
+        return variants[-1] if variants else ""
+
+METRICS = TextMetrics()
+
+def fontmode(draw) -> str:
+    """The mode ImageDraw.textlength measures with for this draw."""
+    return getattr(draw, "fontmode", "L")
@@ -0,0 +1,159 @@
+# oleds/displays/ui/rollup.py
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import format as F
+
+# (window name, bucket seconds, buckets kept): 1-minute buckets over the last
+# hour, 1-hour buckets over the last day
+DEFAULT_TIERS: Tuple[Tuple[str, float, int], ...] = (("1h", 60, 60), ("24h", 3600, 24))
+STATS = ("min", "max", "avg")
+
+class Rollup:
+    """
+    One resolution of a rollup store: per series, the min, max and sum of
+    the samples in each time bucket, kept in fixed rings. A sample lands in
+    bucket ts // resolution at ring slot bucket % slots; a slot still
+    holding an older bucket is reset first, so adding is O(1) and gaps
+    (service down, clock jumps) simply leave stale slots that reads skip.
+    """
+
+    def __init__(self, n_series: int, resolution: float, slots: int):
+        self.resolution = float(resolution)
+        self.slots = int(slots)
+        self.bucket = np.full(self.slots, -1, dtype=np.int64)   # bucket number held by each slot
+        self.count = np.zeros(self.slots, dtype=np.uint32)
+        self.sum = np.zeros((n_series, self.slots), dtype=np.float64)
+        self.min = np.zeros((n_series, self.slots), dtype=np.float32)
+        self.max = np.zeros((n_series, self.slots), dtype=np.float32)
+        self.newest = -1
+
+    def add(self, ts: float, values: np.ndarray) -> None:
+        self._merge(int(ts // self.resolution), values, values, values, 1)
+
+    def extend(self, ts: np.ndarray, values: np.ndarray) -> None:
+        """Adds many samples at once: ts (k,), values (n_series, k); grouped per bucket with numpy."""
+        if not len(ts):
+            return
+        b = (np.asarray(ts) // self.resolution).astype(np.int64)
+        keep = b > max(self.newest, int(b.max())) - self.slots
+        b, values = b[keep], values[:, keep]
+        buckets, inv = np.unique(b, return_inverse=True)
+        cols = (slice(None), inv)
+        k = len(buckets)
+        sums = np.zeros((values.shape[0], k))
+        mins = np.full((values.shape[0], k), np.inf)
+        maxs = np.full((values.shape[0], k), -np.inf)
+        np.add.at(sums, cols, values)
+        np.minimum.at(mins, cols, values)
+        np.maximum.at(maxs, cols, values)
+        counts = np.bincount(inv, minlength=k)
+        for j, bucket in enumerate(buckets.tolist()):
+            self._merge(bucket, sums[:, j], mins[:, j], maxs[:, j], int(counts[j]))
+
+    def _merge(self, b: int, sums, mins, maxs, count: int) -> None:
+        if b <= self.newest - self.slots:
+            return      # older than the window; its slot may hold a newer bucket
+        s = b % self.slots
+        if self.bucket[s] != b:
+            self.bucket[s] = b
+            self.count[s] = 0
+            self.sum[:, s] = 0.0
+            self.min[:, s] = mins
+            self.max[:, s] = maxs
+        else:
+            np.minimum(self.min[:, s], mins, out=self.min[:, s])
+            np.maximum(self.max[:, s], maxs, out=self.max[:, s])
+        self.sum[:, s] += sums
+        self.count[s] += count
+        self.newest = max(self.newest, b)
+
+    def window(self, stat: str = "avg", now: Optional[float] = None) -> np.ndarray:
+        """(n_series, k) array of the buckets within the window ending at now (default: newest sample), oldest first."""
+        if stat not in STATS:
+            raise ValueError(f"unknown rollup stat: {stat}")
+        last = self.newest if now is None else int(now // self.resolution)
+        ids = np.arange(last - self.slots + 1, last + 1)
+        slot = ids % self.slots
+        idx = slot[(ids >= 0) & (self.bucket[slot] == ids)]
+        if stat == "avg":
+            return self.sum[:, idx] / self.count[idx]
+        return getattr(self, stat)[:, idx].astype(np.float64)
+
+class RollupStore:
+    """n_series sampled together, rolled up at each of the given tiers."""
+
+    def __init__(self, n_series: int, tiers: Sequence[Tuple[str, float, int]] = DEFAULT_TIERS):
+        self.n = int(max(1, n_series))
+        self.tiers: Dict[str, Rollup] = {name: Rollup(self.n, res, slots) for name, res, slots in tiers}
+
+    @property
+    def span(self) -> float:
+        """Seconds covered by the longest tier."""
+        return max((t.resolution * t.slots for t in self.tiers.values()), default=0.0)
+
+    @property
+    def windows(self) -> Tuple[str, ...]:
+        return tuple(self.tiers)
+
+    def add(self, values: Sequence[float], ts: Optional[float] = None) -> None:
+        ts = time.time() if ts is None else ts
+        vs = np.array([float(v) if v is not None else 0.0 for v in (list(values) + [0.0] * self.n)[:self.n]])
+        for tier in self.tiers.values():
+            tier.add(ts, vs)
+
+    def extend(self, ts: np.ndarray, values: np.ndarray) -> None:
+        """Bulk add: ts (k,), values (n_series, k)."""
+        for tier in self.tiers.values():
+            tier.extend(ts, values)
+
+    def series(self, window: str, stat: str = "avg", now: Optional[float] = None) -> List[np.ndarray]:
+        rows = self.tiers[window].window(stat, now)
+        return [rows[i] for i in range(self.n)]
+
+    def normalized(self, window: str, stat: str = "avg", now: Optional[float] = None) -> List[np.ndarray]:
+        """Series scaled to 0..100 against their shared max (at least 1), as Trend does."""
+        rows = self.tiers[window].window(stat, now)
+        scale = max(1.0, float(rows.max()) if rows.size else 1.0)
+        return [np.minimum(100.0, 100.0 * rows[i] / scale) for i in range(self.n)]
+
+class StatsHistory:
+    """
+    Long-window history of the trend metrics, fed from every stats cycle
+    regardless of the page on screen: CPU %, network up/down and disk
+    read/write rates in B/s.
+    """
+
+    KEYS = ("cpu", "network_throughput", "disk_io")
+    # store -> its series as time-series store fields (see providers.timeseries.FIELDS)
+    FIELDS = {"cpu": ("cpu",), "network": ("net_up", "net_down"), "disk_io": ("disk_read", "disk_write")}
+
+    def __init__(self, tiers: Sequence[Tuple[str, float, int]] = DEFAULT_TIERS):
+        self.cpu = RollupStore(1, tiers)
+        self.network = RollupStore(2, tiers)    # upload, download
+        self.disk_io = RollupStore(2, tiers)    # read, write
+
+    def record(self, stats, ts: Optional[float] = None) -> None:
+        ts = time.time() if ts is None else ts
+        if stats.get("cpu") is not None:
+            self.cpu.add([float(stats["cpu"])], ts)
+        thr = stats.get("network_throughput")
+        if thr:
+            self.network.add([F.parse_rate_bps(thr.get("upload")), F.parse_rate_bps(thr.get("download"))], ts)
+        dio = stats.get("disk_io")
+        if dio:
+            self.disk_io.add([F.parse_rate_bps(dio.get("read")), F.parse_rate_bps(dio.get("write"))], ts)
+
+    def backfill(self, ts_store) -> None:
+        """Fills the rollups from a TimeSeriesStore's records; rows with gaps are skipped per store."""
+        for name, fields in self.FIELDS.items():
+            store: RollupStore = getattr(self, name)
+            rows = ts_store.since(store.span, fields)
+            vals = np.stack([rows[f].astype(np.float64) for f in fields])
+            ok = ~np.isnan(vals).any(axis=0)
+            store.extend(rows["ts"][ok], vals[:, ok])
+
+HISTORY = StatsHistory()
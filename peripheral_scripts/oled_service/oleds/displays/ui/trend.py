@@ -3,30 +3,67 @@ from __future__ import annotations
 from collections import deque
 from typing import List, Sequence
 
+import numpy as np
+
 class Trend:
+    """
+    Smoothed history of n_series rates, normalized to 0..100 against a
+    shared, slowly decaying scale. Each series lives in a fixed float32 ring
+    (history * 4 bytes); the window max comes from monotonic deques, so an
+    update does O(1) bookkeeping plus one vectorized rescale into a
+    preallocated buffer. update() returns views of that buffer, oldest
+    first; they are overwritten by the next update.
+    """
+
     def __init__(self, n_series: int, history: int = 120, alpha: float = 0.3, decay: float = 0.90):
         self.n = int(max(1, n_series))
-        self.hist = [deque(maxlen=history) for _ in range(self.n)]
-        self.ema  = [None] * self.n
-        self.scale = 1.0
+        self.history = int(max(1, history))
         self.alpha = max(0.0, min(1.0, float(alpha)))
         self.decay = max(0.0, min(1.0, float(decay)))
+        self.scale = 1.0
+        self.ema = np.zeros(self.n)
+        self._ring = np.zeros((self.n, self.history), dtype=np.float32)
+        self._norm = np.zeros((self.n, self.history), dtype=np.float32)
+        # per series: (tick, value) pairs with decreasing values; the head is the window max
+        self._maxq = [deque() for _ in range(self.n)]
+        self._tick = 0      # samples pushed so far
 
-    def update(self, values: Sequence[float]) -> List[Sequence[float]]:
-        vs = [float(v) if v is not None else 0.0 for v in (list(values) + [0.0] * self.n)[:self.n]]
+    def __len__(self) -> int:
+        return min(self._tick, self.history)
 
-        for i, v in enumerate(vs):
-            if self.ema[i] is None: self.ema[i] = v
-            self.ema[i] = self.alpha * v + (1.0 - self.alpha) * self.ema[i]
-            self.hist[i].append(self.ema[i])
+    def update(self, values: Sequence[float]) -> List[np.ndarray]:
+        vs = [float(v) if v is not None else 0.0 for v in (list(values) + [0.0] * self.n)[:self.n]]
+        tick, pos = self._tick, self._tick % self.history
+        if tick == 0:
+            self.ema[:] = vs
+        self.ema = self.alpha * np.asarray(vs) + (1.0 - self.alpha) * self.ema
+        self._ring[:, pos] = self.ema
 
-        local_max = max(max(h or [0.0]) for h in self.hist)
-        local_max = max(local_max, 1.0)
+        local_max = 1.0
+        for i, q in enumerate(self._maxq):
+            v = float(self._ring[i, pos])
+            while q and q[-1][1] <= v:
+                q.pop()
+            q.append((tick, v))
+            if q[0][0] <= tick - self.history:
+                q.popleft()
+            local_max = max(local_max, q[0][1])
+        self._tick = tick + 1
         self.scale = max(local_max, self.scale * self.decay)
 
-        s = max(self.scale, 1.0)
-        norm = []
-        for h in self.hist:
-            norm.append([min(100.0, 100.0 * v / s) for v in h])
-        
-        return norm
\ No newline at end of file
+        # rescale in chronological order: ring[pos+1:] is older than ring[:pos+1]
+        count = len(self)
+        k = 100.0 / max(self.scale, 1.0)
+        if count < self.history:
+            np.multiply(self._ring[:, :count], k, out=self._norm[:, :count])
+        else:
+            tail = self.history - pos - 1
+            np.multiply(self._ring[:, pos + 1:], k, out=self._norm[:, :tail])
+            np.multiply(self._ring[:, :pos + 1], k, out=self._norm[:, tail:])
+        np.minimum(self._norm[:, :count], 100.0, out=self._norm[:, :count])
+        return [self._norm[i, :count] for i in range(self.n)]
+
+    def backfill(self, rows: Sequence[Sequence[float]]) -> None:
+        """Replays recorded samples (oldest first), as if update() had seen them."""
+        for row in rows[-self.history:]:
+            self.update(row)
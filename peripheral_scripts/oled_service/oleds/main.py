@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import signal
 
 from oleds.configs.configs import LOG_FILE
 from oleds.displays.manager import DisplayManager
@@ -10,6 +11,14 @@ log = setup_logger('OledMain', LOG_FILE)
 
 def _make_driver():
     drv = os.getenv("OLED_DRIVER", "ssd1306").strip().lower()
+    if drv == "capture":
+        # no panel: frames stay in memory (headless runs, benchmarks)
+        from oleds.displays.drivers.capture import CaptureDriver
+        profile = os.getenv("OLED_PROFILE", "ssd1306").strip().lower()
+        height = 128 if "1327" in profile else 64
+        return CaptureDriver(width=int(os.getenv("OLED_WIDTH", "128")),
+                             height=int(os.getenv("OLED_HEIGHT", str(height))),
+                             identifier="ssd1327" if "1327" in profile else "ssd1306")
     if drv == "ssd1327":
         from oleds.displays.drivers.ssd1327 import SSD1327_Driver
         return SSD1327_Driver()
@@ -17,7 +26,13 @@ def _make_driver():
         from oleds.displays.drivers.ssd1306 import SSD1306_Driver
         return SSD1306_Driver()
 
+def _on_sigterm(signum, frame):
+    # systemctl stop / shutdown: unwind through the finally blocks so the
+    # stats store is persisted and the last frame is flushed
+    raise SystemExit(0)
+
 def main():
+    signal.signal(signal.SIGTERM, _on_sigterm)
     try:
         driver = _make_driver()
         display_manager = DisplayManager(driver=driver)
@@ -25,9 +40,14 @@ def main():
 
         from oleds.oled_controller import OledController
         controller = OledController(display_manager=display_manager, pages=pages)
-        controller.run()
+        try:
+            controller.run()
+        finally:
+            controller.close()
     except KeyboardInterrupt:
         log.info("[OledController] stopped by user.")
+    except SystemExit:
+        log.info("[OledController] stopped.")
     except Exception as e:
         log.critical(f"[OledController] failed to start: {e}", exc_info=True)
 
@@ -1,27 +1,116 @@
 #!/usr/-bin/env python3
+import math
+import queue
+import statistics
+import threading
 import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Set
 
-from oleds.configs.configs import LOG_FILE, PAGE_INTERVAL, UPDATE_INTERVAL
+from oleds.configs.configs import (
+    ALERT_DURATION, ANIMATIONS, CONTROL_SOCKET, LOG_FILE, PAGE_INTERVAL, PAGE_PREFETCH_LEAD,
+    PROBE_DEADLINE, RENDER_FPS, UPDATE_INTERVAL,
+)
+from oleds.control_server import ControlServer
+from oleds.displays.frame_memo import FrameMemo
+from oleds.displays.screen_factory import find_page
+from oleds.displays.screens.alert_screen import AlertScreen
+from oleds.displays.ui.rollup import HISTORY
+from oleds.providers.recording import open_recorder
+from oleds.providers.snapshots import SnapshotCollector
 from oleds.providers.stats_provider import StatsProvider
-from oleds.providers.weather_provider import WeatherProvider
+from oleds.providers.timeseries import open_store
 from utils.logger import setup_logger
 
 log = setup_logger('OledController', LOG_FILE)
 
+COMMAND_HOLD = 0.08   # seconds a commanded page switch may wait for fresh stats
+
 class OledController:
-    def __init__(self, display_manager, pages):
-        self.provider = StatsProvider()
+    def __init__(self, display_manager, pages, provider=None, persist: bool = True):
+        """persist=False leaves the stats store and the recording alone (replays)."""
+        self.provider = provider    # built in run() when not given
         self.display = display_manager
         self.pages = list(pages) if pages else []
         self.current_page_index = 0
-        
-        self.weather_provider = WeatherProvider(logger=log)
+        self.collector: Optional[SnapshotCollector] = None
+        self._switched_at = self._next_switch_ts = time.monotonic()
+        self._hold_until = 0.0          # a switched-to page waits this long for its stats
+        self._dirty = True              # redraw even without a new snapshot
+        self._wake = threading.Event()  # snapshots and control commands
+        self._commands: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+        self.alert = AlertScreen()
+        self._alert_until = 0.0
+        self.memo = FrameMemo()
+        self.store = open_store(log) if persist else None
+        if self.store is not None:
+            self._backfill()
+        self.recorder = open_recorder(log) if persist else None
 
         log.info("[OledController] Initialized with %d pages.", len(self.pages))
 
     def _next_index(self, idx: int) -> int:
         return (idx + 1) % len(self.pages)
 
+    def _page_keys(self, idx: int) -> Optional[Set[str]]:
+        keys = getattr(self.pages[idx], "STATS_KEYS", None)
+        if keys is None:
+            return None
+        bar_keys = getattr(self.display.statusbar, "STATS_KEYS", None) or ()
+        return set(keys) | set(bar_keys) | set(HISTORY.KEYS)
+
+    def _log_transfer_stats(self):
+        transfer_stats = getattr(self.display, "transfer_stats", None)
+        if transfer_stats is not None:
+            log.debug("[OledController] Display transfer: %s", transfer_stats())
+        log.debug("[OledController] Page memo: %s, layers: %s", self.memo.stats(), self.display.layer_stats())
+
+    def _wanted_keys(self) -> Optional[Set[str]]:
+        """Keys for the collector: the current page's, plus the next page's once its switch is near."""
+        keys = self._page_keys(self.current_page_index)
+        if keys is not None and self._next_switch_ts - time.monotonic() <= PAGE_PREFETCH_LEAD:
+            upcoming = self._page_keys(self._next_index(self.current_page_index))
+            keys = None if upcoming is None else keys | upcoming
+        return keys
+
+    def _backfill(self):
+        try:
+            HISTORY.backfill(self.store)
+        except Exception as e:
+            log.warning("[OledController] History backfill failed: %s", e)
+        for page in self.pages:
+            if hasattr(page, "backfill"):
+                try:
+                    page.backfill(self.store)
+                except Exception as e:
+                    log.debug("[OledController] backfill() failed for %s: %s", page.__class__.__name__, e)
+        log.info("[OledController] Backfilled from %d stored records.", len(self.store))
+
+    def close(self):
+        close_display = getattr(self.display, "close", None)
+        if close_display is not None:
+            close_display()     # lets the last frame finish transferring
+        if self.store is not None:
+            try:
+                self.store.close()
+            except Exception as e:
+                log.warning("[OledController] Closing the stats store failed: %s", e)
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def _record(self, stats, ts: float | None = None):
+        """ts: when the stats were taken (default now)."""
+        ts = time.time() if ts is None else ts
+        try:
+            HISTORY.record(stats, ts)
+            if self.store is not None:
+                self.store.append(stats, ts)
+                self.store.maybe_persist()
+            if self.recorder is not None:
+                self.recorder.record(stats, ts)
+        except Exception as e:
+            log.debug("[OledController] Recording stats failed: %s", e)
+
     def _pick_renderable_page(self, stats) -> bool:
         if not self.pages:
             return False
@@ -50,58 +139,230 @@ class OledController:
 
         return False
 
-    def run(self, page_interval: int | None = None, update_interval: int | None = None):
+    # --- control commands ---
+    def _on_command(self, cmd: Dict[str, Any]):
+        """ControlServer callback (its thread): queue the command and wake the render loop."""
+        self._commands.put(cmd)
+        self._wake.set()
+
+    def _resolve_page(self, token: str) -> Optional[int]:
+        token = token.strip().lower()
+        if token == "next":
+            return self._next_index(self.current_page_index)
+        if token == "prev":
+            return (self.current_page_index - 1) % len(self.pages)
+        if token.isdigit():
+            return int(token) if int(token) < len(self.pages) else None
+        return find_page(self.pages, token)
+
+    def _switch_to(self, idx: int, now: float, page_interval: float, hold: float):
+        self.current_page_index = idx
+        self._switched_at, self._next_switch_ts = now, now + page_interval
+        self._hold_until = now + hold
+        self._dirty = True
+        snap = self.collector.latest() if self.collector is not None else None
+        if snap is not None and not snap.covers(self._page_keys(idx)):
+            self.collector.request()
+
+    def _apply_commands(self, now: float, page_interval: float):
+        while True:
+            try:
+                cmd = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            # a bad command is dropped; it must not reach the main loop's error path
+            try:
+                if self._apply_command(cmd, now, page_interval):
+                    self._dirty = True
+            except Exception as e:
+                log.warning("[OledController] Ignoring command %r: %s", cmd, e)
+
+    def _apply_command(self, cmd: Dict[str, Any], now: float, page_interval: float) -> bool:
+        """Applies one control command; False when it changes nothing."""
+        kind = cmd.get("cmd")
+        if kind == "page":
+            idx = self._resolve_page(str(cmd.get("page", "next")))
+            if idx is None:
+                log.debug("[OledController] No page %r to show.", cmd.get("page"))
+                return False
+            self._alert_until = 0.0
+            # hold briefly for the page's stats, but stay within the input latency budget
+            self._switch_to(idx, now, page_interval, hold=COMMAND_HOLD)
+        elif kind == "alert":
+            duration = float(cmd.get("duration", ALERT_DURATION))
+            if not 0.0 <= duration < math.inf:
+                raise ValueError(f"bad alert duration {duration!r}")
+            self.alert.set_alert(str(cmd.get("kind", "")), cmd)
+            self._alert_until = now + duration
+            log.info("[OledController] Alert %r raised.", cmd.get("kind"))
+        elif kind == "dismiss":
+            self._alert_until = 0.0
+            self._next_switch_ts = now + page_interval
+        elif kind != "redraw":
+            log.debug("[OledController] Unknown command %r.", kind)
+            return False
+        return True
+
+    def _animating(self, page) -> bool:
+        caps = getattr(self.display, "capabilities", None)
+        return ANIMATIONS and bool(getattr(page, "ANIMATED", False)) and bool(getattr(caps, "supports_animation", False))
+
+    def _render(self, page, stats):
+        key = self.memo.key(page, self.display, stats)
+        if key is None or not self.memo.restore(page, key, self.display):
+            if not getattr(page, "HANDLES_BACKGROUND", False):
+                self.display.clear()
+                self.display.draw_status_bar(stats)
+
+            page.draw(self.display, stats)
+            if key is not None:
+                self.memo.store(page, key, self.display)
+
+        try:
+            self.display.show()
+        except Exception:
+            pass
+
+    def run(self, page_interval: int | None = None, update_interval: int | None = None, fps: float | None = None):
+        """
+        Sleeps on a wake event instead of a timer: a new stats snapshot from
+        the collector thread, a control-socket command or the next page switch
+        ends the wait. Pages redraw on new snapshots only, except ANIMATED
+        ones with OLED_ANIMATIONS=1, which redraw at the display's frame
+        rate (OLED_RENDER_FPS overrides it) while on screen.
+        """
         page_interval = page_interval or PAGE_INTERVAL
         update_interval = update_interval or UPDATE_INTERVAL
+        caps = getattr(self.display, "capabilities", None)
+        fps = fps or RENDER_FPS or getattr(caps, "target_fps", 0) or 1.0 / update_interval
+        frame = 1.0 / fps
 
-        log.info("[OledController] Entering main loop. page_interval=%ss, update_interval=%ss",
-                 page_interval, update_interval)
+        log.info("[OledController] Entering main loop. page_interval=%ss, update_interval=%ss, fps=%s",
+                 page_interval, update_interval, fps)
 
         if not self.pages:
             log.warning("[OledController] No pages to display.")
             return
 
-        next_switch_ts = time.monotonic() + page_interval
+        if self.provider is None:
+            self.provider = StatsProvider(logger=log)
+        self._switched_at = time.monotonic()
+        self._next_switch_ts = self._switched_at + page_interval
+        self.collector = SnapshotCollector(self.provider, self._wanted_keys, update_interval, logger=log,
+                                           on_publish=lambda snap: self._wake.set()).start()
+        control = None
+        try:
+            control = ControlServer(CONTROL_SOCKET, self._on_command, logger=log).start()
+        except OSError as e:
+            log.warning("[OledController] Control socket %s unavailable: %s", CONTROL_SOCKET, e)
 
-        while True:
-            try:
-                stats = self.provider.get_all_stats()
+        seq = 0
+        next_frame = 0.0
+
+        try:
+            while True:
+                try:
+                    self._wake.clear()    # anything after this point wakes the next wait
+                    now = time.monotonic()
+                    self._apply_commands(now, page_interval)
 
-                stats["weather"] = self.weather_provider.get_weather()
+                    alerting = now < self._alert_until
+                    if not alerting and self._alert_until:
+                        self._alert_until = 0.0
+                        self._switch_to(self.current_page_index, now, page_interval, hold=0.0)
+                    if not alerting and now >= self._next_switch_ts:
+                        self._log_transfer_stats()
+                        # prefetching should have the next page's stats ready; wait out a slow probe
+                        self._switch_to(self._next_index(self.current_page_index), now, page_interval,
+                                        hold=2 * PROBE_DEADLINE)
 
-                found = self._pick_renderable_page(stats)
-                if not found:
-                    time.sleep(update_interval)
-                    continue
+                    snap = self.collector.latest()
+                    waiting = snap is None or (not alerting and now < self._hold_until
+                                               and not snap.covers(self._page_keys(self.current_page_index)))
+                    animating = False
+                    if not waiting:
+                        stats = snap.stats
+                        if snap.seq != seq:
+                            seq = snap.seq
+                            self._record(stats)
+                            self._dirty = True
 
-                active_page = self.pages[self.current_page_index]
+                        if alerting:
+                            page = self.alert
+                        elif self._pick_renderable_page(stats):
+                            page = self.pages[self.current_page_index]
+                        else:
+                            page = None
 
-                now = time.monotonic()
-                if now >= next_switch_ts:
-                    self.current_page_index = self._next_index(self.current_page_index)
-                    next_switch_ts = now + page_interval
-                    found = self._pick_renderable_page(stats)
+                        animating = page is not None and self._animating(page)
+                        if page is not None and (self._dirty or (animating and now >= next_frame)):
+                            self._render(page, stats)
+                            self._dirty = False
+                            next_frame = next_frame + frame if next_frame + frame > now else now + frame
 
-                    if not found:
-                        time.sleep(update_interval)
-                        continue
-                    active_page = self.pages[self.current_page_index]
+                    wake_at = self._alert_until if alerting else self._next_switch_ts
+                    if waiting and snap is not None:
+                        wake_at = min(wake_at, self._hold_until)
+                    if animating:
+                        wake_at = min(wake_at, next_frame)
+                    self._wake.wait(max(0.0, wake_at - time.monotonic()))
 
-                handles_bg = bool(getattr(active_page, "HANDLES_BACKGROUND", False))
+                except Exception as e:
+                    log.error("[OledController] Error in main loop: %s", e, exc_info=True)
+                    time.sleep(10)
+        finally:
+            self.collector.stop()
+            if control is not None:
+                control.close()
 
-                if not handles_bg:
-                    self.display.clear()
-                    self.display.draw_status_bar(stats)
+    def replay(self, records: Iterable, *, realtime: bool = False, speed: float = 1.0,
+               page_interval: float | None = None) -> Dict[str, Any]:
+        """
+        Renders recorded stats (providers.recording.Record) through the
+        pages, one frame per record, switching pages on the recorded clock.
+        Records follow each other at once, or with realtime at their
+        recorded spacing divided by speed. Returns frame times per page.
+        The trend history is fed on the recorded clock, and it is the
+        module-wide HISTORY the pages read: replay in its own process (as
+        oleds.replay does), not in a running service.
+        """
+        page_interval = page_interval or PAGE_INTERVAL
+        times: Dict[str, List[float]] = {}
+        first_ts = started = next_switch = None
 
-                active_page.draw(self.display, stats)
+        for rec in records:
+            if first_ts is None:
+                first_ts, started = rec.ts, time.monotonic()
+                next_switch = rec.ts + page_interval
+            elif realtime:
+                delay = started + (rec.ts - first_ts) / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            if rec.ts >= next_switch:
+                self.current_page_index = self._next_index(self.current_page_index)
+                next_switch = rec.ts + page_interval
 
-                try:
-                    self.display.show()
-                except Exception:
-                    pass
+            stats = MappingProxyType(rec.stats)     # read-only, like a published snapshot
+            self._record(stats, rec.ts)
+            if not self._pick_renderable_page(stats):
+                continue
+            page = self.pages[self.current_page_index]
+            t0 = time.perf_counter()
+            self._render(page, stats)
+            times.setdefault(page.__class__.__name__, []).append(time.perf_counter() - t0)
 
-                time.sleep(update_interval)
+        flush = getattr(self.display, "flush", None)
+        if flush is not None:
+            flush()
+        return {name: self._frame_summary(ts) for name, ts in times.items()}
 
-            except Exception as e:
-                log.error("[OledController] Error in main loop: %s", e, exc_info=True)
-                time.sleep(10)
\ No newline at end of file
+    @staticmethod
+    def _frame_summary(ts: List[float]) -> Dict[str, float]:
+        ordered = sorted(ts)
+        return {
+            "frames": len(ts),
+            "mean_ms": round(statistics.fmean(ts) * 1e3, 3),
+            "p50_ms": round(statistics.median(ts) * 1e3, 3),
+            "p95_ms": round(ordered[max(0, int(len(ts) * 0.95) - 1)] * 1e3, 3),
+            "max_ms": round(ordered[-1] * 1e3, 3),
+        }
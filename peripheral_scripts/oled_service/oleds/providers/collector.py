@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from oleds.configs.configs import PROBE_DEADLINE, PROBE_TTL_FACTOR, UPDATE_INTERVAL
+from .scheduler import SamplingScheduler
+
+log = logging.getLogger(__name__)
+
+STALE_KEY = "stale"
+
+@dataclass(frozen=True)
+class Probe:
+    name: str
+    fn: Callable[[], Dict[str, Any]]
+    default: Dict[str, Any] = field(default_factory=dict)
+    deadline: float = PROBE_DEADLINE
+    period: float = UPDATE_INTERVAL        # how often the probe is resampled
+    ttl: Optional[float] = None            # max age of a served value; None -> period * PROBE_TTL_FACTOR
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(self.default.keys())
+
+    @property
+    def max_age(self) -> float:
+        return self.ttl if self.ttl is not None else self.period * PROBE_TTL_FACTOR
+
+class StatsCollector:
+    """
+    Runs the probes that are due concurrently, each bounded by its own deadline.
+    Probes within their period are served from the scheduler's cache. A probe
+    that misses its deadline (or fails) contributes its last-known-good values
+    until they outlive the probe's TTL, and its keys are listed under
+    stats["stale"].
+    """
+
+    def __init__(self, probes: Iterable[Probe], scheduler: Optional[SamplingScheduler] = None):
+        self._probes: Dict[str, Probe] = {p.name: p for p in probes}
+        self._scheduler = scheduler or SamplingScheduler()
+
+    @property
+    def probes(self) -> Dict[str, Probe]:
+        return self._probes
+
+    @property
+    def scheduler(self) -> SamplingScheduler:
+        return self._scheduler
+
+    def collect(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        selected = [self._probes[n] for n in names if n in self._probes] if names is not None else list(self._probes.values())
+
+        started = time.monotonic()
+        pending = [(p, self._scheduler.request(p)) for p in selected]
+
+        stats: Dict[str, Any] = {}
+        stale: List[str] = []
+
+        for probe, fut in sorted(pending, key=lambda pf: pf[0].deadline):
+            missed = False
+            if fut is not None:
+                remaining = started + probe.deadline - time.monotonic()
+                try:
+                    fut.result(timeout=max(0.0, remaining))
+                except FutureTimeout:
+                    log.debug("[StatsCollector] probe %s missed its %.2fs deadline", probe.name, probe.deadline)
+                    missed = True
+                except Exception as e:
+                    log.debug("[StatsCollector] probe %s failed: %s", probe.name, e)
+                    missed = True
+
+            value, age = self._scheduler.cached(probe)
+            if value is None or age > probe.max_age:
+                value, missed = probe.default, True
+
+            if missed:
+                stale.extend(value.keys())
+            stats.update(value)
+
+        stats[STALE_KEY] = sorted(stale)
+        return stats
+
+    def close(self) -> None:
+        self._scheduler.close()
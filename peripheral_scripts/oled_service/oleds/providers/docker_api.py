@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import quote, urlencode
+
+class DockerApiError(Exception):
+    pass
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+def _query(path: str, params: Optional[Dict[str, Any]]) -> str:
+    if not params:
+        return path
+    encoded = {k: (json.dumps(v) if isinstance(v, (dict, list)) else v) for k, v in params.items()}
+    return f"{path}?{urlencode(encoded)}"
+
+class DockerEngineClient:
+    """
+    Minimal Docker Engine API client over the unix socket.
+    Requests share one persistent keep-alive connection; each events()
+    subscription opens its own streaming connection.
+    """
+
+    def __init__(self, socket_path: str = "/var/run/docker.sock", timeout: float = 2.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: Optional[UnixHTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def _request(self, path: str) -> Any:
+        if self._conn is None:
+            self._conn = UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+        self._conn.request("GET", path, headers={"Host": "docker"})
+        resp = self._conn.getresponse()
+        body = resp.read()
+        if resp.status >= 400:
+            raise DockerApiError(f"GET {path} -> {resp.status}: {body[:200]!r}")
+        return json.loads(body) if body else None
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        url = _query(path, params)
+        with self._lock:
+            try:
+                return self._request(url)
+            except (http.client.HTTPException, ConnectionError, BrokenPipeError):
+                # the daemon closed our idle keep-alive connection; retry once on a fresh one
+                self._close_conn()
+                return self._request(url)
+            except Exception:
+                self._close_conn()
+                raise
+
+    def containers(self, filters: Optional[Dict[str, Any]] = None, all: bool = True) -> list:
+        params: Dict[str, Any] = {"all": "true" if all else "false"}
+        if filters:
+            params["filters"] = filters
+        return self.get_json("/containers/json", params) or []
+
+    def inspect(self, container_id: str) -> Dict[str, Any]:
+        return self.get_json(f"/containers/{quote(container_id, safe='')}/json") or {}
+
+    def events(self, filters: Optional[Dict[str, Any]] = None, since: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yields decoded events until the stream ends or the connection breaks."""
+        params: Dict[str, Any] = {}
+        if filters:
+            params["filters"] = filters
+        if since is not None:
+            params["since"] = str(int(since))
+
+        conn = UnixHTTPConnection(self.socket_path, timeout=None)
+        try:
+            conn.request("GET", _query("/events", params), headers={"Host": "docker"})
+            resp = conn.getresponse()
+            if resp.status >= 400:
+                raise DockerApiError(f"GET /events -> {resp.status}")
+            while True:
+                line = resp.readline()
+                if not line:
+                    return
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+    def _close_conn(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_conn()
@@ -1,11 +1,143 @@
 #!/usr/bin/env python3
+from __future__ import annotations
 
-import subprocess
-import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from oleds.configs.configs import DOCKER_CONTAINER, DOCKER_PROJECT, DOCKER_SOCKET
+from .docker_api import DockerEngineClient
+
+log = logging.getLogger(__name__)
+
+_PROJECT_LABEL = "com.docker.compose.project"
+_LIFECYCLE_ACTIONS = {
+    "create", "start", "restart", "stop", "die", "kill", "oom",
+    "pause", "unpause", "rename", "update", "destroy", "health_status",
+}
+
+@dataclass(frozen=True)
+class ContainerState:
+    id: str
+    name: str
+    status: str
+    running: bool
+    restarts: int
+    exit_code: int
+
+def _state_from_inspect(data: Dict) -> ContainerState:
+    state = data.get("State") or {}
+    return ContainerState(
+        id=data.get("Id", ""),
+        name=(data.get("Name") or "").lstrip("/"),
+        status=state.get("Status", "N/A"),
+        running=bool(state.get("Running", False)),
+        restarts=int(data.get("RestartCount", 0) or 0),
+        exit_code=int(state.get("ExitCode", -1)),
+    )
 
 class DockerProvider:
-    def __init__(self, container_name='organizr'):
+    """
+    Keeps an in-memory table of the compose project's containers. The table is
+    built once from /containers/json and then kept current by the /events
+    stream, so reading status or restart counts is a dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        container_name: str = DOCKER_CONTAINER,
+        project: Optional[str] = DOCKER_PROJECT,
+        client: Optional[DockerEngineClient] = None,
+        autostart: bool = True,
+    ):
         self.container_name = container_name
+        self.project = project
+        self._client = client or DockerEngineClient(DOCKER_SOCKET)
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, ContainerState] = {}
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if autostart:
+            self.start()
+
+    def _filters(self) -> Dict:
+        return {"label": [f"{_PROJECT_LABEL}={self.project}"]} if self.project else {}
+
+    def _refresh(self, container_id: str) -> None:
+        try:
+            st = _state_from_inspect(self._client.inspect(container_id))
+        except Exception as e:
+            log.debug("[DockerProvider] inspect %s failed: %s", container_id[:12], e)
+            with self._lock:
+                self._by_id.pop(container_id, None)
+            return
+        with self._lock:
+            self._by_id[st.id] = st
+
+    def sync(self) -> None:
+        listed = self._client.containers(filters=self._filters(), all=True)
+        table: Dict[str, ContainerState] = {}
+        for c in listed:
+            st = _state_from_inspect(self._client.inspect(c["Id"]))
+            table[st.id] = st
+        with self._lock:
+            self._by_id = table
+        self._synced.set()
+
+    def apply_event(self, event: Dict) -> None:
+        if event.get("Type", "container") != "container":
+            return
+        action = (event.get("Action") or event.get("status") or "").split(":", 1)[0].strip()
+        if action not in _LIFECYCLE_ACTIONS:
+            return
+        cid = (event.get("Actor") or {}).get("ID") or event.get("id")
+        if not cid:
+            return
+        if action == "destroy":
+            with self._lock:
+                self._by_id.pop(cid, None)
+            return
+        self._refresh(cid)
+
+    def _watch(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                since = int(time.time()) - 1
+                self.sync()
+                backoff = 1.0
+                filters = dict(self._filters(), type=["container"])
+                for event in self._client.events(filters=filters, since=since):
+                    self.apply_event(event)
+                    if self._stop.is_set():
+                        return
+            except Exception as e:
+                log.debug("[DockerProvider] event stream lost: %s", e)
+            self._synced.clear()
+            self._stop.wait(backoff)
+            backoff = min(60.0, backoff * 2)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="docker-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._client.close()
+
+    def containers(self) -> Dict[str, ContainerState]:
+        with self._lock:
+            return {st.name: st for st in self._by_id.values()}
+
+    def _find(self, name: str) -> Optional[ContainerState]:
+        with self._lock:
+            return next((st for st in self._by_id.values() if st.name == name), None)
 
     def get_stats(self):
         stats = {
@@ -14,24 +146,14 @@ class DockerProvider:
             "restarts": 0,
             "exit_code": -1
         }
-        try:
-            cmd = ["docker", "inspect", self.container_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            data = json.loads(result.stdout)[0]
-            
-            stats["status"] = data["State"]["Status"]
-            stats["is_running"] = data["State"]["Running"]
-            stats["restarts"] = data["HostConfig"]["RestartPolicy"].get("MaximumRetryCount", 0)
-            stats["exit_code"] = data["State"]["ExitCode"]
-
-        except (FileNotFoundError, json.JSONDecodeError, IndexError):
-            pass
+        st = self._find(self.container_name) if self._synced.is_set() else None
+        if st is not None:
+            stats["status"] = st.status
+            stats["is_running"] = st.running
+            stats["restarts"] = st.restarts
+            stats["exit_code"] = st.exit_code
         return stats
 
     def get_raw_status(self):
-        try:
-            command = ["docker", "inspect", "-f", "{{.State.Status}}", self.container_name]
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return "N/A"
\ No newline at end of file
+        st = self._find(self.container_name) if self._synced.is_set() else None
+        return st.status if st is not None else "N/A"
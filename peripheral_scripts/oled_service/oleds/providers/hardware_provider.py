@@ -1,33 +1,36 @@
 #!/usr/bin/env python3
+from __future__ import annotations
 
-import subprocess
-import json
+from oleds.configs.configs import NVME_DEVICE, NVME_HEALTH_TTL, SYSFS_ROOT
+from .nvme_health import IoctlSmartLogBackend, NvmeHealthReader
+from .videocore import VideoCoreReader
 
 class HardwareProvider:
+    def __init__(self, videocore: VideoCoreReader | None = None, nvme: NvmeHealthReader | None = None):
+        self.videocore = videocore or VideoCoreReader(root=SYSFS_ROOT)
+        self.nvme = nvme or NvmeHealthReader(IoctlSmartLogBackend(NVME_DEVICE), ttl=NVME_HEALTH_TTL)
 
     def get_core_voltage(self):
-        try:
-            result = subprocess.run(['vcgencmd', 'measure_volts', 'core'], capture_output=True, text=True)
-            return float(result.stdout.split('=')[1][:-2])
-        except (FileNotFoundError, IndexError, ValueError):
-            return 0.0
+        volts = self.videocore.core_voltage()
+        return volts if volts is not None else 0.0
+
+    def get_clocks(self):
+        return self.videocore.clocks()
+
+    def get_throttle_history(self):
+        return self.videocore.throttle_history()
 
     def get_nvme_health(self):
         health_stats = {
             "critical_warning": 1,
             "temperature": 0
         }
-        try:
-            result = subprocess.run(['nvme', 'smart-log', '/dev/nvme0', '-o', 'json'], capture_output=True, text=True)
-            data = json.loads(result.stdout)
-            health_stats["critical_warning"] = data.get("critical_warning", 1)
-            
-            temperature_kelvin = data.get("temperature", 0)
-            if temperature_kelvin > 0:
-                health_stats["temperature"] = temperature_kelvin - 273
-            
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
+        health = self.nvme.health()
+        if health is not None:
+            health_stats["critical_warning"] = health.critical_warning
+            health_stats["temperature"] = health.temperature
+            health_stats["percentage_used"] = health.percentage_used
+            health_stats["data_units_written"] = health.data_units_written
         return health_stats
 
     def get_throttling_status(self):
@@ -39,16 +42,15 @@ class HardwareProvider:
             17: "Arm frequency capping has occurred",
             18: "Throttling has occurred",
         }
-        try:
-            result = subprocess.run(['vcgencmd', 'get_throttled'], capture_output=True, text=True)
-            hex_code = int(result.stdout.strip().split('=')[1], 16)
-            
-            if hex_code == 0:
-                return "NO"
-            
-            for bit, message in status_map.items():
-                if (hex_code >> bit) & 1:
-                    return f"YES ({message.split(' ')[0]})"
-            return "YES (Unknown)"
-        except (FileNotFoundError, IndexError, ValueError):
-            return "N/A"
\ No newline at end of file
+        flags = self.videocore.throttled()
+        if flags is None:
+            return "N/A"
+
+        hex_code = flags.raw
+        if hex_code == 0:
+            return "NO"
+
+        for bit, message in status_map.items():
+            if (hex_code >> bit) & 1:
+                return f"YES ({message.split(' ')[0]})"
+        return "YES (Unknown)"
\ No newline at end of file
@@ -1,19 +1,19 @@
 #!/usr/bin/env python3
 import time
 import socket
-import subprocess
-from shutil import which
 
 import netifaces as ni
 import psutil
 
+from utils.rfkill import TYPE_BLUETOOTH, shared_rfkill
 from utils.wifi_controller import WifiController
 
 class NetworkProvider:
     def __init__(self, lan_if: str = "eth0", wlan_if: str = "wlan0"):
         self.lan_if = lan_if
         self.wlan_if = wlan_if
-        self._wifi_controller = WifiController()
+        self._rfkill = shared_rfkill()
+        self._wifi_controller = WifiController(rfkill=self._rfkill)
 
         self.last_check_time = time.time()
         io = psutil.net_io_counters()
@@ -68,52 +68,11 @@ class NetworkProvider:
 
     def is_bluetooth_enabled(self) -> bool | None:
         """
-        True/False если смогли определить; None — если утилит нет.
-        Проверяем по bluetoothctl/hciconfig/rfkill.
+        True/False если смогли определить; None — если нет bluetooth rfkill-свича.
+        Читаем из общей таблицы rfkill, без внешних утилит.
         """
-        # bluetoothctl show -> "Powered: yes"
-        if which("bluetoothctl"):
-            try:
-                out = subprocess.run(
-                    ["bluetoothctl", "show"],
-                    check=False, capture_output=True, text=True, timeout=0.5
-                ).stdout.lower()
-                if "powered: yes" in out:
-                    return True
-                if "powered: no" in out:
-                    return False
-            except Exception:
-                pass
-
-        # hciconfig -> "UP RUNNING"
-        if which("hciconfig"):
-            try:
-                out = subprocess.run(
-                    ["hciconfig"],
-                    check=False, capture_output=True, text=True, timeout=0.5
-                ).stdout.lower()
-                if "up" in out:
-                    return True
-                if "down" in out:
-                    return False
-            except Exception:
-                pass
-
-        # rfkill list bluetooth -> Soft blocked: yes/no
-        if which("rfkill"):
-            try:
-                out = subprocess.run(
-                    ["rfkill", "list", "bluetooth"],
-                    check=False, capture_output=True, text=True, timeout=0.5
-                ).stdout.lower()
-                if "soft blocked: yes" in out or "hard blocked: yes" in out:
-                    return False
-                if "soft blocked: no" in out:
-                    return True
-            except Exception:
-                pass
-
-        return None  # не смогли определить
+        blocked = self._rfkill.blocked(TYPE_BLUETOOTH)
+        return not blocked if blocked is not None else None
 
     def get_throughput(self) -> dict:
         current_time = time.time()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import ctypes
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Protocol
+
+try:
+    import fcntl
+except ImportError:  # non-Linux dev boxes
+    fcntl = None
+
+# _IOWR('N', 0x41, struct nvme_admin_cmd)
+NVME_IOCTL_ADMIN_CMD = 0xC0484E41
+NVME_ADMIN_GET_LOG_PAGE = 0x02
+NVME_LOG_SMART = 0x02
+NVME_NSID_ALL = 0xFFFFFFFF
+SMART_LOG_SIZE = 512
+
+class _AdminCmd(ctypes.Structure):
+    # struct nvme_passthru_cmd from <linux/nvme_ioctl.h>
+    _fields_ = [
+        ("opcode", ctypes.c_uint8),
+        ("flags", ctypes.c_uint8),
+        ("rsvd1", ctypes.c_uint16),
+        ("nsid", ctypes.c_uint32),
+        ("cdw2", ctypes.c_uint32),
+        ("cdw3", ctypes.c_uint32),
+        ("metadata", ctypes.c_uint64),
+        ("addr", ctypes.c_uint64),
+        ("metadata_len", ctypes.c_uint32),
+        ("data_len", ctypes.c_uint32),
+        ("cdw10", ctypes.c_uint32),
+        ("cdw11", ctypes.c_uint32),
+        ("cdw12", ctypes.c_uint32),
+        ("cdw13", ctypes.c_uint32),
+        ("cdw14", ctypes.c_uint32),
+        ("cdw15", ctypes.c_uint32),
+        ("timeout_ms", ctypes.c_uint32),
+        ("result", ctypes.c_uint32),
+    ]
+
+@dataclass(frozen=True)
+class NvmeHealth:
+    critical_warning: int
+    temperature_k: int
+    available_spare: int
+    percentage_used: int
+    data_units_read: int
+    data_units_written: int
+    power_on_hours: int
+
+    @property
+    def temperature(self) -> int:
+        """Composite temperature in °C (0 when the drive does not report one)."""
+        return self.temperature_k - 273 if self.temperature_k > 0 else 0
+
+    @property
+    def bytes_written(self) -> int:
+        # a data unit is 1000 sectors of 512 bytes
+        return self.data_units_written * 512_000
+
+def _u128(buf: bytes, offset: int) -> int:
+    return int.from_bytes(buf[offset:offset + 16], "little")
+
+def decode_smart_log(buf: bytes) -> NvmeHealth:
+    """Decodes the fields we display from a SMART / Health Information log page (LID 02h)."""
+    if len(buf) < SMART_LOG_SIZE:
+        raise ValueError(f"short SMART log page: {len(buf)} bytes")
+    critical_warning, temperature_k, available_spare, _threshold, percentage_used = struct.unpack_from("<BHBBB", buf, 0)
+    return NvmeHealth(
+        critical_warning=critical_warning,
+        temperature_k=temperature_k,
+        available_spare=available_spare,
+        percentage_used=percentage_used,
+        data_units_read=_u128(buf, 32),
+        data_units_written=_u128(buf, 48),
+        power_on_hours=_u128(buf, 128),
+    )
+
+class SmartLogBackend(Protocol):
+    def read_smart_log(self) -> bytes: ...
+    def close(self) -> None: ...
+
+class IoctlSmartLogBackend:
+    """Issues Get Log Page through NVME_IOCTL_ADMIN_CMD on a device fd kept open between reads."""
+
+    def __init__(self, device: str = "/dev/nvme0", timeout_ms: int = 1000):
+        self.device = device
+        self.timeout_ms = timeout_ms
+        self._fd: Optional[int] = None
+        self._buf = ctypes.create_string_buffer(SMART_LOG_SIZE)
+        self._lock = threading.Lock()
+
+    def read_smart_log(self) -> bytes:
+        if fcntl is None:
+            raise OSError("ioctl is not available on this platform")
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.device, os.O_RDONLY)
+            cmd = _AdminCmd(
+                opcode=NVME_ADMIN_GET_LOG_PAGE,
+                nsid=NVME_NSID_ALL,
+                addr=ctypes.addressof(self._buf),
+                data_len=SMART_LOG_SIZE,
+                cdw10=((SMART_LOG_SIZE // 4 - 1) << 16) | NVME_LOG_SMART,  # NUMDL | LID
+                timeout_ms=self.timeout_ms,
+            )
+            try:
+                status = fcntl.ioctl(self._fd, NVME_IOCTL_ADMIN_CMD, cmd)
+            except OSError:
+                self._close()
+                raise
+            if status != 0:
+                raise OSError(f"NVMe Get Log Page failed with status 0x{status:x}")
+            return self._buf.raw
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+class BytesSmartLogBackend:
+    """Serves a captured log page, e.g. from `nvme smart-log -b` or a test fixture."""
+
+    def __init__(self, data: Optional[bytes] = None, path: Optional[str] = None):
+        if data is None and path is None:
+            raise ValueError("either data or path is required")
+        self._data = data
+        self.path = path
+
+    def read_smart_log(self) -> bytes:
+        if self._data is not None:
+            return self._data
+        with open(self.path, "rb") as f:
+            return f.read(SMART_LOG_SIZE)
+
+    def close(self) -> None:
+        pass
+
+class NvmeHealthReader:
+    """
+    Caches the decoded health snapshot for `ttl` seconds. A failed read is
+    also remembered for `ttl`, so a missing or busy drive is not retried on
+    every tick.
+    """
+
+    def __init__(self, backend: SmartLogBackend, ttl: float = 30.0):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._health: Optional[NvmeHealth] = None
+        self._read_at: Optional[float] = None
+
+    def health(self) -> Optional[NvmeHealth]:
+        now = time.monotonic()
+        with self._lock:
+            if self._read_at is not None and now - self._read_at < self.ttl:
+                return self._health
+            try:
+                self._health = decode_smart_log(self.backend.read_smart_log())
+            except (OSError, ValueError, struct.error):
+                self._health = None
+            self._read_at = now
+            return self._health
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._read_at = None
+
+    def close(self) -> None:
+        self.backend.close()
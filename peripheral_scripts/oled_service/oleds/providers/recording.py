@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Append-only recording of the stats the OLED controller renders from: one
+record per stats cycle, each a 4-byte length followed by the zlib-packed
+JSON of {"ts": wall time, "stats": {...}}. Records compress independently
+(against a shared dictionary of the stats key names), so a file cut
+short by a crash is read up to its last whole record. Summary of a
+recording:
+
+    python -m oleds.providers.recording FILE
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from oleds.configs.configs import RECORD_PATH
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"OLEDREC1"
+_LEN = struct.Struct("<I")
+
+# preset dictionary: the key names every record repeats
+ZDICT = json.dumps([
+    "cpu", "cpu_freq", "temp", "mem", "swap", "used", "total", "percent", "uptime", "ip", "lan_ip", "wifi_ip",
+    "root_disk_usage", "storage_disk_usage", "status_root_disk", "disk_io", "read", "write",
+    "network_throughput", "upload", "download", "docker_restarts", "docker_status", "docker_exit_code",
+    "status_docker", "nvme_temp", "status_storage_disk", "core_voltage", "status_voltage", "throttling",
+    "status_wifi", "status_wifi_connected", "status_lan", "status_bluetooth", "weather", "stale",
+    "location_name", "temperature", "feels_like", "pressure", "humidity", "description", "source",
+    "ts", "stats", "running", "N/A", "K/s", "M/s",
+]).encode("utf-8")
+
+@dataclass(frozen=True)
+class Record:
+    ts: float                   # time.time() when recorded
+    stats: Dict[str, Any]
+
+def _jsonable(obj: Any) -> Any:
+    """json.dumps fallback for provider objects (named tuples are lists already)."""
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+def encode_record(stats: Mapping[str, Any], ts: float) -> bytes:
+    payload = json.dumps({"ts": ts, "stats": dict(stats)}, separators=(",", ":"), default=_jsonable)
+    comp = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS, zdict=ZDICT)
+    body = comp.compress(payload.encode("utf-8")) + comp.flush()
+    return _LEN.pack(len(body)) + body
+
+def decode_record(body: bytes) -> Record:
+    dec = zlib.decompressobj(zlib.MAX_WBITS, zdict=ZDICT)
+    obj = json.loads(dec.decompress(body) + dec.flush())
+    return Record(float(obj["ts"]), obj["stats"])
+
+def _complete_length(f) -> int:
+    """Bytes of f up to the end of its last whole record (a crash can leave half of one)."""
+    size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    if size < len(MAGIC) or f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{f.name}: not a stats recording")
+    end = len(MAGIC)
+    while end + _LEN.size <= size:
+        f.seek(end)
+        nxt = end + _LEN.size + _LEN.unpack(f.read(_LEN.size))[0]
+        if nxt > size:
+            break
+        end = nxt
+    return end
+
+class StatsRecorder:
+    """
+    Appends one record per record() call; each is flushed to the file as
+    it is written. A partial record left by a crash is cut off on open.
+    """
+
+    def __init__(self, path: str = RECORD_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._f = open(path, "ab+")
+        if self._f.seek(0, os.SEEK_END) == 0:
+            self._f.write(MAGIC)
+        else:
+            self._f.truncate(_complete_length(self._f))
+        self.records = 0
+        self.bytes_written = 0
+
+    def record(self, stats: Mapping[str, Any], ts: Optional[float] = None) -> None:
+        data = encode_record(stats, time.time() if ts is None else ts)
+        self._f.write(data)
+        self._f.flush()
+        self.records += 1
+        self.bytes_written += len(data)
+
+    def close(self) -> None:
+        self._f.close()
+
+def read_records(path: str) -> Iterator[Record]:
+    """Records in file order; stops quietly at a truncated or damaged tail."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a stats recording")
+        while True:
+            head = f.read(_LEN.size)
+            if len(head) < _LEN.size:
+                return
+            size = _LEN.unpack(head)[0]
+            body = f.read(size)
+            if len(body) < size:
+                return      # cut short mid-write
+            try:
+                yield decode_record(body)
+            except (zlib.error, ValueError, KeyError) as e:
+                log.warning("[StatsRecording] %s: stopping at a damaged record: %s", path, e)
+                return
+
+def open_recorder(logger: Optional[logging.Logger] = None) -> Optional[StatsRecorder]:
+    """The service's recorder, or None when RECORD_PATH is unset or unusable."""
+    if not RECORD_PATH:
+        return None
+    try:
+        return StatsRecorder()
+    except (OSError, ValueError) as e:
+        (logger or log).warning("[StatsRecording] Disabled, cannot open %s: %s", RECORD_PATH, e)
+        return None
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("path")
+    args = ap.parse_args()
+
+    n, first, last, keys = 0, None, None, set()
+    for rec in read_records(args.path):
+        n += 1
+        first = rec.ts if first is None else first
+        last = rec.ts
+        keys.update(rec.stats)
+    if not n:
+        print(f"{args.path}: no records")
+        return
+    size = os.path.getsize(args.path)
+    span = last - first
+    print(f"{args.path}: {n} records, {size / n:.0f} bytes/record, {span / 3600:.2f} h")
+    print(f"  from {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(first))}"
+          f" to {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last))}")
+    print(f"  keys: {', '.join(sorted(keys))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from oleds.configs.configs import PROBE_PERIOD_SLACK, PROBE_WORKERS
+
+class _ProbeState:
+    __slots__ = ("value", "sampled_at", "attempted_at", "future", "runs")
+
+    def __init__(self):
+        self.value: Optional[Dict[str, Any]] = None
+        self.sampled_at: Optional[float] = None
+        self.attempted_at: Optional[float] = None
+        self.future: Optional[Future] = None
+        self.runs = 0
+
+class SamplingScheduler:
+    """
+    Decides when each probe actually runs. A probe is started at most once per
+    its period; callers asking while a sample is in flight share that sample's
+    future, and callers asking within the period get the cached value.
+    Thread-safe, so several consumers can request the same probe.
+    """
+
+    def __init__(self, max_workers: int = PROBE_WORKERS, slack: float = PROBE_PERIOD_SLACK):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="oled-probe")
+        self._lock = threading.Lock()
+        self._states: Dict[str, _ProbeState] = {}
+        self._slack = max(0.0, slack)
+
+    def _state(self, name: str) -> _ProbeState:
+        st = self._states.get(name)
+        if st is None:
+            st = self._states[name] = _ProbeState()
+        return st
+
+    def _run(self, probe, st: _ProbeState) -> Dict[str, Any]:
+        value = probe.fn()
+        if not isinstance(value, dict):
+            raise TypeError(f"probe {probe.name} returned {type(value).__name__}")
+        with self._lock:
+            st.value = value
+            st.sampled_at = time.monotonic()
+        return value
+
+    def request(self, probe) -> Optional[Future]:
+        """
+        Returns the future of the sample to wait for, or None when the cached
+        value is still within the probe's period.
+        """
+        now = time.monotonic()
+        with self._lock:
+            st = self._state(probe.name)
+            if st.future is not None and not st.future.done():
+                return st.future
+            if st.attempted_at is not None and now - st.attempted_at < probe.period - self._slack:
+                return None
+            st.attempted_at = now
+            st.runs += 1
+            st.future = self._pool.submit(self._run, probe, st)
+            return st.future
+
+    def cached(self, probe) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Last good value and its age in seconds (inf when never sampled)."""
+        with self._lock:
+            st = self._state(probe.name)
+            if st.sampled_at is None:
+                return None, float("inf")
+            return st.value, time.monotonic() - st.sampled_at
+
+    def runs(self) -> Dict[str, int]:
+        with self._lock:
+            return {name: st.runs for name, st in self._states.items()}
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
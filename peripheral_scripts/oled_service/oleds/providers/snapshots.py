@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, FrozenSet, Iterable, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    seq: int                        # 1, 2, ... in publish order
+    ts: float                       # time.monotonic() at publish
+    stats: Mapping[str, Any]        # read-only view; never changed after publish
+    keys: Optional[FrozenSet[str]]  # keys collected for; None: all of them
+
+    def covers(self, keys: Optional[Iterable[str]]) -> bool:
+        """Whether the snapshot was collected for all of keys (None: every key)."""
+        if self.keys is None:
+            return True
+        return keys is not None and self.keys.issuperset(keys)
+
+class SnapshotCollector:
+    """
+    Collects stats on its own thread and publishes each result as an
+    immutable StatsSnapshot, so readers never wait on a probe. keys_fn is
+    asked for the stats keys to collect before every cycle (None: all of
+    them); request() starts the next cycle early, e.g. after a page switch
+    that needs other keys. on_publish is called (on the collector thread)
+    with every new snapshot.
+    """
+
+    def __init__(self, provider, keys_fn: Callable[[], Optional[Iterable[str]]], interval: float,
+                 logger: Optional[logging.Logger] = None,
+                 on_publish: Optional[Callable[[StatsSnapshot], None]] = None):
+        self.provider = provider
+        self.keys_fn = keys_fn
+        self.on_publish = on_publish
+        self.interval = max(0.05, float(interval))
+        self.log = logger or log
+        self._latest: Optional[StatsSnapshot] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SnapshotCollector":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="oled-collector", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def request(self) -> None:
+        self._wake.set()
+
+    def latest(self) -> Optional[StatsSnapshot]:
+        return self._latest
+
+    def collect_once(self) -> StatsSnapshot:
+        keys = self.keys_fn()
+        keys = frozenset(keys) if keys is not None else None
+        stats = dict(self.provider.get_stats(keys))
+        with self._lock:
+            seq = self._latest.seq + 1 if self._latest is not None else 1
+            self._latest = StatsSnapshot(seq, time.monotonic(), MappingProxyType(stats), keys)
+            snap = self._latest
+        if self.on_publish is not None:
+            self.on_publish(snap)
+        return snap
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.collect_once()
+            except Exception as e:
+                self.log.error("[SnapshotCollector] Collection failed: %s", e, exc_info=True)
+            self._wake.wait(max(0.0, self.interval - (time.monotonic() - started)))
+            self._wake.clear()
@@ -1,55 +1,116 @@
 #!/usr/bin/env python3
+import logging
+from typing import Iterable, List, Optional
 
+from oleds.configs.configs import PROBE_PERIODS, UPDATE_INTERVAL
+
+from .collector import Probe, StatsCollector
 from .system_provider import SystemProvider
 from .network_provider import NetworkProvider
 from .disk_provider import DiskProvider
 from .docker_provider import DockerProvider
 from .hardware_provider import HardwareProvider
+from .weather_provider import WeatherProvider
 
 class StatsProvider:
-    def __init__(self):
+    def __init__(self, logger: Optional[logging.Logger] = None):
         self.system = SystemProvider()
         self.network = NetworkProvider()
         self.root_disk = DiskProvider(path='/')
         self.storage_disk = DiskProvider(path='/mnt/storage/')
         self.docker = DockerProvider()
         self.hardware = HardwareProvider()
+        self.weather = WeatherProvider(logger=logger or logging.getLogger(__name__))
 
-    def get_all_stats(self):
-        disk = self.root_disk.get_usage()
-        docker_stats = self.docker.get_stats()
-        nvme_health = self.hardware.get_nvme_health()
-        throttling_status = self.hardware.get_throttling_status()
+        self.collector = StatsCollector(self._make_probes())
+        self._probe_for_key = {key: p.name for p in self.collector.probes.values() for key in p.keys}
+
+    def _make_probes(self):
+        empty_usage = {"used": 0, "total": 0, "percent": 0}
+
+        return [
+            self._scheduled("cpu", self._probe_cpu, {"cpu": 0, "cpu_freq": 0}),
+            self._scheduled("memory", self._probe_memory, {"mem": empty_usage, "swap": empty_usage}),
+            self._scheduled("temp", lambda: {"temp": self.system.get_cpu_temp()}, {"temp": 0}),
+            self._scheduled("uptime", lambda: {"uptime": self.system.get_uptime()}, {"uptime": "00:00"}),
+            self._scheduled("ip", self._probe_ip, {"ip": "N/A", "lan_ip": None, "wifi_ip": None}),
+            self._scheduled("root_disk", self._probe_root_disk, {"root_disk_usage": empty_usage, "status_root_disk": False}),
+            self._scheduled("storage_disk", lambda: {"storage_disk_usage": self.storage_disk.get_usage()}, {"storage_disk_usage": empty_usage}),
+            self._scheduled("disk_io", lambda: {"disk_io": self.storage_disk.get_io()}, {"disk_io": {"read": "0K", "write": "0K"}}),
+            self._scheduled("network_io", lambda: {"network_throughput": self.network.get_throughput()},
+                            {"network_throughput": {"upload": "0K/s", "download": "0K/s"}}),
+            self._scheduled("docker", self._probe_docker, {"docker_restarts": 0, "docker_status": "N/A", "docker_exit_code": -1, "status_docker": False}),
+            self._scheduled("nvme", self._probe_nvme, {"nvme_temp": 0, "status_storage_disk": False}),
+            self._scheduled("voltage", self._probe_voltage, {"core_voltage": 0.0, "status_voltage": False}),
+            self._scheduled("throttling", lambda: {"throttling": self.hardware.get_throttling_status()}, {"throttling": "N/A"}),
+            self._scheduled("wifi", self._probe_wifi, {"status_wifi": False, "status_wifi_connected": False}),
+            self._scheduled("lan", lambda: {"status_lan": self.network.is_lan_connected()}, {"status_lan": False}),
+            self._scheduled("bluetooth", lambda: {"status_bluetooth": self.network.is_bluetooth_enabled()}, {"status_bluetooth": None}),
+            self._scheduled("weather", lambda: {"weather": self.weather.get_weather()}, {"weather": None}),
+        ]
+
+    @staticmethod
+    def _scheduled(name, fn, default):
+        return Probe(name, fn, default, period=PROBE_PERIODS.get(name, UPDATE_INTERVAL))
 
-        stats = {
+    def _probe_cpu(self):
+        return {"cpu": self.system.get_cpu_usage(), "cpu_freq": self.system.get_cpu_frequency()}
+
+    def _probe_memory(self):
+        return {"mem": self.system.get_mem_usage(), "swap": self.system.get_swap_usage()}
+
+    def _probe_ip(self):
+        return {
             "ip": self.network.get_ip_address(),
-            "cpu": self.system.get_cpu_usage(),
-            "cpu_freq": self.system.get_cpu_frequency(),
-            "mem": self.system.get_mem_usage(),
-            "swap": self.system.get_swap_usage(),
-            "temp": self.system.get_cpu_temp(),
-            "uptime": self.system.get_uptime(),
-            "root_disk_usage": self.root_disk.get_usage(),
-            "storage_disk_usage": self.storage_disk.get_usage(),
+            "lan_ip": self.network.get_lan_ip(),
+            "wifi_ip": self.network.get_wlan_ip(),
+        }
+
+    def _probe_root_disk(self):
+        disk = self.root_disk.get_usage()
+        return {"root_disk_usage": disk, "status_root_disk": disk['percent'] < 90}
+
+    def _probe_docker(self):
+        docker_stats = self.docker.get_stats()
+        return {
             "docker_restarts": docker_stats["restarts"],
             "docker_status": docker_stats["status"],
+            "docker_exit_code": docker_stats["exit_code"],
+            "status_docker": docker_stats["is_running"],
+        }
+
+    def _probe_nvme(self):
+        nvme_health = self.hardware.get_nvme_health()
+        return {
             "nvme_temp": nvme_health["temperature"],
-            "core_voltage": self.hardware.get_core_voltage(),
-            "network_throughput": self.network.get_throughput(),
+            "status_storage_disk": nvme_health["critical_warning"] == 0,
+        }
 
-            "disk_io": self.storage_disk.get_io(),
-            "throttling": throttling_status,
+    def _probe_voltage(self):
+        core_voltage = self.hardware.get_core_voltage()
+        return {"core_voltage": core_voltage, "status_voltage": core_voltage > 4.75}
 
-            "status_docker": docker_stats["is_running"],
-            "status_root_disk": disk['percent'] < 90,
-            "status_storage_disk": nvme_health["critical_warning"] == 0,
+    def _probe_wifi(self):
+        return {
             "status_wifi": self.network.is_wifi_enabled(),
-            "status_voltage": self.hardware.get_core_voltage() > 4.75,
-            
-            "lan_ip": self.network.get_lan_ip(),
-            "wifi_ip": self.network.get_wlan_ip(),
-            "status_lan": self.network.is_lan_connected(),
             "status_wifi_connected": self.network.is_wifi_connected(),
-            "status_bluetooth": self.network.is_bluetooth_enabled(),
         }
-        return stats
\ No newline at end of file
+
+    def probes_for(self, keys: Iterable[str]) -> List[str]:
+        names = {self._probe_for_key[k] for k in keys if k in self._probe_for_key}
+        return sorted(names)
+
+    def get_stats(self, keys: Optional[Iterable[str]] = None):
+        """
+        Collects only the probes that produce the given stats keys (all of
+        them when keys is None). Due probes run concurrently; the rest are
+        served from cache until their period (OLED_PERIOD_<PROBE>) elapses.
+        A cycle takes at most the slowest probe deadline (OLED_PROBE_DEADLINE);
+        late probes report their last-known-good values and are listed in
+        stats["stale"].
+        """
+        names = None if keys is None else self.probes_for(keys)
+        return self.collector.collect(names)
+
+    def get_all_stats(self):
+        return self.get_stats(None)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Ring store of the numeric OLED stats: one fixed-width record per stats
+cycle in a memory-mapped file (tmpfs under /run by default), copied to
+persistent storage now and then so history survives reboots too. Other
+tools can read it without resampling:
+
+    python -m oleds.providers.timeseries [--since 600] [--fields cpu,temp] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import shutil
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from oleds.configs.configs import TS_CAPACITY, TS_PATH, TS_PERSIST_INTERVAL, TS_PERSIST_PATH
+from oleds.displays.ui.format import parse_rate_bps
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"OLEDTS1\0"
+HEADER_SIZE = 512
+
+def _usage(key: str) -> Callable[[Mapping[str, Any]], Any]:
+    return lambda s: (s.get(key) or {}).get("percent")
+
+def _rate(key: str, part: str) -> Callable[[Mapping[str, Any]], Any]:
+    return lambda s: parse_rate_bps((s.get(key) or {}).get(part)) if s.get(key) else None
+
+# field -> (stats key it comes from, extractor); rates in B/s
+FIELDS: Dict[str, Tuple[str, Callable[[Mapping[str, Any]], Any]]] = {
+    "cpu":            ("cpu", lambda s: s.get("cpu")),
+    "cpu_freq":       ("cpu_freq", lambda s: s.get("cpu_freq")),
+    "temp":           ("temp", lambda s: s.get("temp")),
+    "mem":            ("mem", _usage("mem")),
+    "swap":           ("swap", _usage("swap")),
+    "root_disk":      ("root_disk_usage", _usage("root_disk_usage")),
+    "storage_disk":   ("storage_disk_usage", _usage("storage_disk_usage")),
+    "net_up":         ("network_throughput", _rate("network_throughput", "upload")),
+    "net_down":       ("network_throughput", _rate("network_throughput", "download")),
+    "disk_read":      ("disk_io", _rate("disk_io", "read")),
+    "disk_write":     ("disk_io", _rate("disk_io", "write")),
+    "nvme_temp":      ("nvme_temp", lambda s: s.get("nvme_temp")),
+    "core_voltage":   ("core_voltage", lambda s: s.get("core_voltage")),
+    "docker_restarts": ("docker_restarts", lambda s: s.get("docker_restarts")),
+}
+
+HEADER = np.dtype([
+    ("magic", "S8"), ("capacity", "<u8"), ("head", "<u8"),   # head: records written so far
+    ("fields", f"S{HEADER_SIZE - 24}"),
+])
+
+def record_dtype(fields: Sequence[str]) -> np.dtype:
+    return np.dtype([("ts", "<f8")] + [(f, "<f4") for f in fields])
+
+class TimeSeriesStore:
+    """
+    Fixed-capacity ring of records (float64 wall-clock ts plus one float32
+    per field, NaN where a stat was missing or stale) behind a 512-byte
+    header, all in one mmap. Appends write the record, then bump the
+    header's head counter. Reads select records by ts with a mask over the
+    ring: ts is not assumed to increase, since the wall clock can step
+    back (fake-hwclock at boot, then an NTP step). A file whose header does not
+    match (capacity, fields) is rebuilt; on creation, the persisted copy
+    is loaded when it matches.
+    """
+
+    def __init__(self, path: str = TS_PATH, capacity: int = TS_CAPACITY,
+                 fields: Sequence[str] = tuple(FIELDS), persist_path: Optional[str] = TS_PERSIST_PATH,
+                 persist_interval: float = TS_PERSIST_INTERVAL, readonly: bool = False):
+        self.path = path
+        self.fields = tuple(fields)
+        self.dtype = record_dtype(self.fields)
+        self.persist_path = persist_path
+        self.persist_interval = float(persist_interval)
+        self._persisted_at = time.monotonic()
+        if readonly:
+            self._mm = np.memmap(path, dtype=np.uint8, mode="r")
+            hdr = np.ndarray((), HEADER, buffer=self._mm)
+            self.fields = tuple(f.decode() for f in bytes(hdr["fields"]).rstrip(b"\0").split(b",") if f)
+            self.dtype = record_dtype(self.fields)
+            capacity = int(hdr["capacity"])
+        else:
+            self._open(int(capacity))
+        self.capacity = int(capacity)
+        self._hdr = np.ndarray((), HEADER, buffer=self._mm)
+        self._rec = np.ndarray((self.capacity,), self.dtype, buffer=self._mm, offset=HEADER_SIZE)
+
+    # --- file ---
+    def _size(self, capacity: int) -> int:
+        return HEADER_SIZE + capacity * self.dtype.itemsize
+
+    def _matches(self, path: str, capacity: int) -> bool:
+        try:
+            if os.path.getsize(path) != self._size(capacity):
+                return False
+            with open(path, "rb") as f:
+                hdr = np.frombuffer(f.read(HEADER_SIZE), HEADER)[0]
+        except OSError:
+            return False
+        return (hdr["magic"] == MAGIC.rstrip(b"\0") and int(hdr["capacity"]) == capacity
+                and hdr["fields"] == ",".join(self.fields).encode())
+
+    def _open(self, capacity: int) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if not self._matches(self.path, capacity):
+            if self.persist_path and self._matches(self.persist_path, capacity):
+                shutil.copyfile(self.persist_path, self.path)
+                log.info("[TimeSeriesStore] Restored %s from %s", self.path, self.persist_path)
+            else:
+                with open(self.path, "wb") as f:
+                    f.truncate(self._size(capacity))
+                mm = np.memmap(self.path, dtype=np.uint8, mode="r+")
+                hdr = np.ndarray((), HEADER, buffer=mm)
+                hdr["magic"], hdr["capacity"], hdr["head"] = MAGIC, capacity, 0
+                hdr["fields"] = ",".join(self.fields).encode()
+                mm.flush()
+                del mm
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode="r+")
+
+    def persist(self) -> None:
+        """Atomically copies the ring to persist_path."""
+        if not self.persist_path:
+            return
+        os.makedirs(os.path.dirname(self.persist_path) or ".", exist_ok=True)
+        tmp = self.persist_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._mm.tobytes())
+        os.replace(tmp, self.persist_path)
+        self._persisted_at = time.monotonic()
+
+    def maybe_persist(self) -> None:
+        if self.persist_path and time.monotonic() - self._persisted_at >= self.persist_interval:
+            self.persist()
+
+    def close(self) -> None:
+        if self._mm.mode != "r":
+            self._mm.flush()
+            self.persist()
+
+    # --- writes ---
+    @property
+    def head(self) -> int:
+        return int(self._hdr["head"])
+
+    def __len__(self) -> int:
+        return min(self.head, self.capacity)
+
+    def append_row(self, ts: float, values: Sequence[float]) -> None:
+        head = self.head
+        self._rec[head % self.capacity] = (ts, *values)
+        self._hdr["head"] = head + 1    # after the record: a counted record is complete
+
+    def append(self, stats: Mapping[str, Any], ts: Optional[float] = None) -> None:
+        """Records the numeric fields of one stats snapshot; stale or missing ones as NaN."""
+        stale = set(stats.get("stale") or ())
+        row = []
+        for f in self.fields:
+            key, get = FIELDS[f]
+            v = None if key in stale else get(stats)
+            try:
+                row.append(float(v) if v is not None else math.nan)
+            except (TypeError, ValueError):
+                row.append(math.nan)
+        self.append_row(time.time() if ts is None else ts, row)
+
+    # --- reads ---
+    def _segments(self) -> List[np.ndarray]:
+        """The stored records as chronological slices of the ring (oldest first)."""
+        head = self.head
+        if head <= self.capacity:
+            return [self._rec[:head]]
+        start = head % self.capacity
+        return [self._rec[start:], self._rec[:start]]
+
+    def range(self, t0: float = -math.inf, t1: float = math.inf,
+              fields: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Copy of the records with t0 <= ts < t1 in write order, optionally just some fields."""
+        parts = [seg[(seg["ts"] >= t0) & (seg["ts"] < t1)] for seg in self._segments()]
+        out = np.concatenate(parts)
+        if fields is not None:
+            out = out[["ts", *fields]]
+        return out.copy()
+
+    def since(self, seconds: float, fields: Optional[Iterable[str]] = None) -> np.ndarray:
+        return self.range(time.time() - seconds, math.inf, fields)
+
+    def tail(self, n: int, fields: Optional[Iterable[str]] = None) -> np.ndarray:
+        """The newest n records, oldest first."""
+        if n <= 0:
+            return np.zeros(0, self.dtype)
+        segs = self._segments()
+        out = segs[-1][-n:]
+        if len(out) < n and len(segs) > 1:
+            out = np.concatenate((segs[0][len(out) - n:], out))
+        if fields is not None:
+            out = out[["ts", *fields]]
+        return out.copy()
+
+    def recent(self, n: int, fields: Sequence[str]) -> List[Tuple[float, ...]]:
+        """Values of fields in the newest n records that have all of them, oldest first."""
+        rows = self.tail(n, fields)
+        vals = np.column_stack([rows[f].astype(np.float64) for f in fields])
+        return [tuple(r) for r in vals[~np.isnan(vals).any(axis=1)].tolist()]
+
+def open_store(logger: Optional[logging.Logger] = None) -> Optional[TimeSeriesStore]:
+    """The service's store, or None (logged) when TS_PATH is unset or unusable."""
+    if not TS_PATH:
+        return None
+    try:
+        return TimeSeriesStore()
+    except Exception as e:
+        (logger or log).warning("[TimeSeriesStore] Disabled, cannot open %s: %s", TS_PATH, e)
+        return None
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--path", default=TS_PATH)
+    ap.add_argument("--since", type=float, default=600, help="seconds of history (default 600)")
+    ap.add_argument("--fields", help="comma-separated fields (default all)")
+    ap.add_argument("--json", action="store_true", help="one JSON object per record")
+    args = ap.parse_args()
+
+    store = TimeSeriesStore(args.path, readonly=True)
+    fields = args.fields.split(",") if args.fields else list(store.fields)
+    rows = store.since(args.since, fields)
+    if not args.json:
+        print("\t".join(["time", *fields]))
+    for r in rows:
+        vals = [None if math.isnan(r[f]) else round(float(r[f]), 3) for f in fields]
+        if args.json:
+            print(json.dumps({"ts": float(r["ts"]), **dict(zip(fields, vals))}))
+        else:
+            stamp = time.strftime("%H:%M:%S", time.localtime(float(r["ts"])))
+            print("\t".join([stamp, *("-" if v is None else str(v) for v in vals)]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import array
+import ctypes
+import glob
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # non-Linux dev boxes
+    fcntl = None
+
+# _IOWR(100, 0, char *): the size field is the pointer size of this build
+IOCTL_MBOX_PROPERTY = (3 << 30) | (ctypes.sizeof(ctypes.c_void_p) << 16) | (100 << 8) | 0
+
+MBOX_SUCCESS = 0x80000000
+TAG_GET_CLOCK_RATE_MEASURED = 0x00030047
+TAG_GET_VOLTAGE = 0x00030003
+TAG_GET_THROTTLED = 0x00030046
+
+VOLTAGE_CORE = 1
+CLOCK_ARM = 3
+CLOCK_CORE = 4
+
+@dataclass(frozen=True)
+class ThrottleFlags:
+    raw: int
+    under_voltage: bool
+    freq_capped: bool
+    throttled: bool
+    soft_temp_limit: bool
+    under_voltage_occurred: bool
+    freq_capped_occurred: bool
+    throttled_occurred: bool
+    soft_temp_limit_occurred: bool
+
+    @classmethod
+    def from_raw(cls, raw: int) -> "ThrottleFlags":
+        bit = lambda n: bool((raw >> n) & 1)
+        return cls(
+            raw=raw,
+            under_voltage=bit(0), freq_capped=bit(1), throttled=bit(2), soft_temp_limit=bit(3),
+            under_voltage_occurred=bit(16), freq_capped_occurred=bit(17),
+            throttled_occurred=bit(18), soft_temp_limit_occurred=bit(19),
+        )
+
+    @property
+    def active(self) -> bool:
+        return bool(self.raw & 0xF)
+
+    @property
+    def sticky(self) -> bool:
+        return bool(self.raw & 0xF0000)
+
+class _SysfsValue:
+    """A sysfs attribute kept open and re-read with pread at offset 0."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def read(self) -> Optional[str]:
+        with self._lock:
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self.path, os.O_RDONLY)
+                return os.pread(self._fd, 64, 0).decode("ascii", "ignore").strip()
+            except OSError:
+                self._close()
+                return None
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+class VideoCoreReader:
+    """
+    Reads core voltage, throttling flags and clocks without vcgencmd: through
+    the firmware mailbox (/dev/vcio) when it is usable, otherwise from sysfs
+    and hwmon. All paths are resolved under `root`, so a fake tree can stand
+    in for the real one.
+    """
+
+    def __init__(self, root: str = "/", use_mailbox: bool = True, history: int = 64):
+        self.root = root
+        self._lock = threading.Lock()
+        self._vcio_fd: Optional[int] = None
+        if use_mailbox and fcntl is not None:
+            try:
+                self._vcio_fd = os.open(self._path("dev/vcio"), os.O_RDWR)
+            except OSError:
+                self._vcio_fd = None
+
+        self._throttled_attr = self._find_one(
+            "sys/devices/platform/soc/soc:firmware/get_throttled",
+            "sys/devices/platform/*/*:firmware/get_throttled",
+            "sys/devices/platform/*firmware*/get_throttled",
+        )
+        self._uv_alarm_attr = self._find_hwmon("rpi_volt", "in0_lcrit_alarm")
+        self._core_uv_attr = self._find_regulator("core", "microvolts")
+        self._arm_freq_attr = self._find_one("sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
+
+        self._history: Deque[Tuple[float, ThrottleFlags]] = deque(maxlen=history)
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self.root, rel)
+
+    def _find_one(self, *patterns: str) -> Optional[_SysfsValue]:
+        for pat in patterns:
+            hits = sorted(glob.glob(self._path(pat)))
+            if hits:
+                return _SysfsValue(hits[0])
+        return None
+
+    def _find_hwmon(self, name: str, attr: str) -> Optional[_SysfsValue]:
+        for d in sorted(glob.glob(self._path("sys/class/hwmon/hwmon*"))):
+            try:
+                with open(os.path.join(d, "name")) as f:
+                    if f.read().strip() != name:
+                        continue
+            except OSError:
+                continue
+            p = os.path.join(d, attr)
+            if os.path.exists(p):
+                return _SysfsValue(p)
+        return None
+
+    def _find_regulator(self, name_part: str, attr: str) -> Optional[_SysfsValue]:
+        for d in sorted(glob.glob(self._path("sys/class/regulator/regulator.*"))):
+            try:
+                with open(os.path.join(d, "name")) as f:
+                    if name_part not in f.read().strip().lower():
+                        continue
+            except OSError:
+                continue
+            p = os.path.join(d, attr)
+            if os.path.exists(p):
+                return _SysfsValue(p)
+        return None
+
+    def _mailbox(self, tag: int, values: List[int], resp_words: int) -> Optional[List[int]]:
+        if self._vcio_fd is None:
+            return None
+        n = max(len(values), resp_words)
+        buf = array.array("I", [0] * (6 + n))
+        buf[0] = len(buf) * 4
+        buf[2] = tag
+        buf[3] = n * 4
+        for i, v in enumerate(values):
+            buf[5 + i] = v
+        try:
+            with self._lock:
+                fcntl.ioctl(self._vcio_fd, IOCTL_MBOX_PROPERTY, buf, True)
+        except OSError:
+            return None
+        if buf[1] != MBOX_SUCCESS or not (buf[4] & MBOX_SUCCESS):
+            return None
+        return list(buf[5:5 + n])
+
+    def core_voltage(self) -> Optional[float]:
+        resp = self._mailbox(TAG_GET_VOLTAGE, [VOLTAGE_CORE, 0], 2)
+        if resp is not None and resp[0] == VOLTAGE_CORE:
+            return resp[1] / 1_000_000.0
+        if self._core_uv_attr is not None:
+            raw = self._core_uv_attr.read()
+            if raw and raw.isdigit():
+                return int(raw) / 1_000_000.0
+        return None
+
+    def throttled_raw(self) -> Optional[int]:
+        # a zero request value leaves the sticky bits alone (0xffff would clear them)
+        resp = self._mailbox(TAG_GET_THROTTLED, [0], 1)
+        if resp is not None:
+            return resp[0]
+        if self._throttled_attr is not None:
+            raw = self._throttled_attr.read()
+            if raw:
+                try:
+                    return int(raw, 16)
+                except ValueError:
+                    pass
+        if self._uv_alarm_attr is not None:
+            raw = self._uv_alarm_attr.read()
+            if raw in ("0", "1"):
+                return int(raw)
+        return None
+
+    def throttled(self) -> Optional[ThrottleFlags]:
+        raw = self.throttled_raw()
+        if raw is None:
+            return None
+        flags = ThrottleFlags.from_raw(raw)
+        with self._lock:
+            if not self._history or self._history[-1][1].raw != raw:
+                self._history.append((time.time(), flags))
+        return flags
+
+    def throttle_history(self) -> List[Tuple[float, ThrottleFlags]]:
+        """(timestamp, flags) for every observed change of the throttle word."""
+        with self._lock:
+            return list(self._history)
+
+    def clocks(self) -> Dict[str, Optional[int]]:
+        """Measured clock rates in Hz."""
+        arm = core = None
+        resp = self._mailbox(TAG_GET_CLOCK_RATE_MEASURED, [CLOCK_ARM, 0], 2)
+        if resp is not None:
+            arm = resp[1]
+        resp = self._mailbox(TAG_GET_CLOCK_RATE_MEASURED, [CLOCK_CORE, 0], 2)
+        if resp is not None:
+            core = resp[1]
+        if arm is None and self._arm_freq_attr is not None:
+            raw = self._arm_freq_attr.read()
+            if raw and raw.isdigit():
+                arm = int(raw) * 1000
+        return {"arm": arm, "core": core}
+
+    def close(self) -> None:
+        for attr in (self._throttled_attr, self._uv_alarm_attr, self._core_uv_attr, self._arm_freq_attr):
+            if attr is not None:
+                attr.close()
+        if self._vcio_fd is not None:
+            try:
+                os.close(self._vcio_fd)
+            except OSError:
+                pass
+            self._vcio_fd = None
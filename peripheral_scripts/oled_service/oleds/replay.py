@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Replays a stats recording (OLED_RECORD_PATH) through OledController and
+the pages into an in-memory panel, and prints frame times per page, so
+renderer changes can be compared on real workloads. Full speed by
+default; --realtime keeps the recorded spacing:
+
+    python -m oleds.replay FILE [--profile ssd1327] [--realtime [--speed 10]]
+"""
+import argparse
+import json
+
+from oleds.configs.oled_profiles import PROFILES
+from oleds.displays.drivers.capture import CaptureDriver
+from oleds.displays.manager import DisplayManager
+from oleds.displays.screen_factory import make_pages
+from oleds.oled_controller import OledController
+from oleds.providers.recording import read_records
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("path")
+    ap.add_argument("--profile", choices=sorted(PROFILES), default="ssd1327")
+    ap.add_argument("--realtime", action="store_true", help="sleep out the recorded gaps between records")
+    ap.add_argument("--speed", type=float, default=1.0, help="realtime speed-up factor")
+    ap.add_argument("--page-interval", type=float, help="recorded seconds per page (default PAGE_INTERVAL)")
+    ap.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = ap.parse_args()
+
+    profile = PROFILES[args.profile]
+    driver = CaptureDriver(profile.width, profile.height, identifier=args.profile)
+    display = DisplayManager(driver, args.profile)
+    controller = OledController(display, make_pages(driver), persist=False)
+    try:
+        summary = controller.replay(read_records(args.path), realtime=args.realtime,
+                                    speed=max(args.speed, 1e-3), page_interval=args.page_interval)
+    finally:
+        controller.close()
+
+    if args.json:
+        print(json.dumps({"pages": summary, "memo": controller.memo.stats(),
+                          "transfer": display.transfer_stats()}))
+        return
+    print(f"{args.path}: {sum(s['frames'] for s in summary.values())} frames on {args.profile}")
+    print(f"  {'page':<24} {'frames':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}  (ms)")
+    for name, s in summary.items():
+        print(f"  {name:<24} {s['frames']:6d} {s['mean_ms']:8.3f} {s['p50_ms']:8.3f} {s['p95_ms']:8.3f} {s['max_ms']:8.3f}")
+    print(f"  memo: {controller.memo.stats()}")
+    print(f"  transfer: {display.transfer_stats()}")
+
+if __name__ == "__main__":
+    main()
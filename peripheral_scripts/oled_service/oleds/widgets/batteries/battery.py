@@ -18,6 +18,14 @@ def format_battery_text() -> str:
     icon = "🔌" if ac else "🔋"
     return f"{icon} {soc}%"
 
+def battery_fill_width(w: int = BATTERY_WIDTH) -> Optional[int]:
+    """Width of the charge bar draw_battery() fills; None when there is no UPS status."""
+    status = load_battery_status()
+    if not status or _SOC_KEY not in status:
+        return None
+    soc = max(0.0, min(100.0, status[_SOC_KEY]))
+    return int((w - 3 - 4) * soc / 100.0)
+
 def draw_battery(draw: ImageDraw.ImageDraw, x: int, y: int, w: int = BATTERY_WIDTH, h: int = BATTERY_HEIGHT) -> None:
     fg_color = 255
     bg_color = 0
@@ -40,11 +48,6 @@ def draw_battery(draw: ImageDraw.ImageDraw, x: int, y: int, w: int = BATTERY_WID
     
     draw.rectangle((x + inset, y + inset, x + body_w - inset, y + h - inset), fill=bg_color)
     
-    if level_w > 0:
-        x0 = x + inset
-        y0 = y + inset
-        x1 = x + inset + level_w
-        y1 = y + h - inset
-        
-        for line_y in range(y0, y1):
-            draw.line((x0, line_y, x1, line_y), fill=fg_color)
\ No newline at end of file
+    if level_w > 0 and h - 2 * inset > 0:
+        # one fill for the charge bar: rows y + inset .. y + h - inset - 1
+        draw.rectangle((x + inset, y + inset, x + inset + level_w, y + h - inset - 1), fill=fg_color)
\ No newline at end of file
@@ -25,6 +25,7 @@ VOLTAGE_MIN = float(os.environ.get("UPS_VOLTAGE_MIN", "3.0"))
 VOLTAGE_MAX = float(os.environ.get("UPS_VOLTAGE_MAX", "4.2"))
 
 DRY_RUN = os.environ.get("UPS_DRY_RUN", "0") == "1"
+OLED_ALERTS = os.environ.get("UPS_OLED_ALERTS", "1") == "1"
 SHUTDOWN_CMD = tuple(os.environ.get(
     "UPS_SHUTDOWN_CMD",
     "/sbin/shutdown -h now 'UPS: battery critically low'"
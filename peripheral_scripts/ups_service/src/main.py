@@ -4,6 +4,7 @@ from .shutdown_policy import ShutdownPolicy, ShutdownConfig
 from .status_writer import StatusWriter
 from .providers.geekworm_x1200 import GeekwormX1200
 from .display_soc_calculator import DisplaySoCCalculator
+from .oled_notifier import OledNotifier
 
 from utils.logger import setup_logger
 
@@ -39,7 +40,8 @@ def main():
             writer=status_writer,
             soc_calc=soc_calculator,
             logger=logger,
-            poll_interval=configs.POLL_INTERVAL_SEC
+            poll_interval=configs.POLL_INTERVAL_SEC,
+            notifier=OledNotifier(configs.LOW_BATTERY_PERCENT, logger) if configs.OLED_ALERTS else None
         )
         
         service.loop()
@@ -0,0 +1,30 @@
+import logging
+
+from utils import oled_control
+
+from .providers.ups_reading_interface import UpsReading
+
+class OledNotifier:
+    """Raises OLED alert pages on UPS transitions: AC lost or restored, battery entering the low range."""
+
+    def __init__(self, low_battery_percent: float, logger: logging.Logger):
+        self._low_battery_percent = low_battery_percent
+        self._log = logger
+        self._ac_present = None
+        self._low = False
+
+    def update(self, reading: UpsReading, display_soc: float) -> None:
+        if self._ac_present is not None and reading.ac_present != self._ac_present:
+            self._send("ac_restored" if reading.ac_present else "ac_lost", display_soc)
+        self._ac_present = reading.ac_present
+
+        low = not reading.ac_present and reading.soc_percent <= self._low_battery_percent
+        if low and not self._low:
+            self._send("low_battery", display_soc)
+        self._low = low
+
+    def _send(self, kind: str, display_soc: float) -> None:
+        if oled_control.alert(kind, soc=round(display_soc, 1)):
+            self._log.info(f"OLED alert sent: {kind}")
+        else:
+            self._log.debug(f"OLED service not listening; alert {kind} dropped")
@@ -5,15 +5,17 @@ from .providers.ups_reading_interface import UpsProvider
 from .shutdown_policy import ShutdownPolicy
 from .status_writer import StatusWriter
 from .display_soc_calculator import DisplaySoCCalculator
+from .oled_notifier import OledNotifier
 
 class UpsService:
-    def __init__(self, provider: UpsProvider, policy: ShutdownPolicy, writer: StatusWriter, soc_calc: DisplaySoCCalculator, logger: logging.Logger, poll_interval: float):
+    def __init__(self, provider: UpsProvider, policy: ShutdownPolicy, writer: StatusWriter, soc_calc: DisplaySoCCalculator, logger: logging.Logger, poll_interval: float, notifier: OledNotifier | None = None):
         self._provider = provider
         self._policy = policy
         self._writer = writer
         self._soc_calc = soc_calc
         self._log = logger
         self._poll_interval = poll_interval
+        self._notifier = notifier
         
         self._log.info("UPS Service started.")
 
@@ -26,6 +28,8 @@ class UpsService:
                     if reading.voltage_v > 0.1:
                         display_soc = self._soc_calc.calculate(reading.voltage_v, reading.ac_present)
                         self._writer.write(reading, display_soc)
+                        if self._notifier is not None:
+                            self._notifier.update(reading, display_soc)
                         self._policy.check(reading)
                         
                         self._log.info(f"AC={reading.ac_present} SOC_chip={reading.soc_percent:.1f}% "